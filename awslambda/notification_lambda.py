@@ -1,38 +1,75 @@
 import json
-from src.application.services import MarathonService, RecipientService
+from src.application.services import DIGEST_OPEN_REGISTRATION, MarathonService, RecipientService
+from src.application.pipeline import MarathonIngestionPipeline
+from src.application.crawler_registry import CrawlerRegistry
 from src.application.notification_service import NotificationService
-from src.infrastructure.database import create_database, init_tables
+from src.infrastructure.database import create_database, init_tables, pool_stats
 from src.infrastructure.uow import SqlAlchemyUnitOfWork
+from src.adapters.outbound.course_cache import CourseCache
 from src.adapters.outbound.notifications import (
     TwilioNotificationAdapter,
     TelegramNotificationAdapter
 )
-from src.infrastructure.models import RecipientDB
 from src.adapters.inbound.address_manager import GoogleSpreadSheetAddressManager
 from src.adapters.inbound.web_crawler import RoadRunWebCrawler, MarathonInfoWeeklyFilter
+from src.adapters.inbound.http_cache import CachedHttpClient, FileHttpCache
+from src.adapters.inbound.resilience import CircuitBreaker, ResilientFetcher, RetryPolicy
 from config import get_settings
 import logging
 
 logger = logging.getLogger(__name__)
 
+# warm start에서 재사용되는 코스 캐시
+COURSE_CACHE = CourseCache()
+
 def lambda_handler(event, context):
     settings = get_settings()
     
     create_database()
     init_tables()
     # 데이터베이스 세션 생성
-    uow = SqlAlchemyUnitOfWork()
+    uow = SqlAlchemyUnitOfWork(course_cache=COURSE_CACHE)
     marathon_service = MarathonService(uow)
     recipient_service = RecipientService(uow)
-    url = "http://www.roadrun.co.kr/schedule/list.php"
     
     marathon_filter = MarathonInfoWeeklyFilter()
-    crawler =  RoadRunWebCrawler(marathon_filter)
-    marathon_list = crawler.crawl(url)
+    http_client = CachedHttpClient(
+        cache=FileHttpCache(settings.CRAWLER_CACHE_DIR) if settings.CRAWLER_CACHE_DIR else None,
+        pool_maxsize=settings.CRAWLER_MAX_WORKERS,
+        fresh_for=settings.CRAWLER_CACHE_FRESH_SECONDS,
+    )
+    fetcher = ResilientFetcher(
+        request_timeout=settings.CRAWLER_REQUEST_TIMEOUT,
+        retry_policy=RetryPolicy(max_attempts=settings.CRAWLER_MAX_ATTEMPTS,
+                                 backoff_base=settings.CRAWLER_BACKOFF_BASE,
+                                 backoff_max=settings.CRAWLER_BACKOFF_MAX),
+        circuit_breaker=CircuitBreaker(failure_threshold=settings.CRAWLER_BREAKER_THRESHOLD,
+                                       reset_timeout=settings.CRAWLER_BREAKER_RESET_SECONDS),
+    )
+    roadrun_crawler = RoadRunWebCrawler(marathon_filter,
+                                        max_workers=settings.CRAWLER_MAX_WORKERS,
+                                        per_host_limit=settings.CRAWLER_PER_HOST_LIMIT,
+                                        min_request_interval=settings.CRAWLER_MIN_REQUEST_INTERVAL,
+                                        http_client=http_client,
+                                        known_rows=marathon_service.get_known_roadrun_rows(),
+                                        parser=settings.CRAWLER_PARSER,
+                                        fetcher=fetcher,
+                                        deadline_seconds=settings.CRAWLER_DEADLINE_SECONDS)
+
+    # 크롤링 소스 등록 - 소스들은 동시에 실행되고 중복 대회는 합쳐짐
+    crawler_registry = CrawlerRegistry()
+    crawler_registry.register('roadrun', roadrun_crawler, "http://www.roadrun.co.kr/schedule/list.php")
 
-    for marathon in marathon_list:
-        marathon = crawler.preprocess_data(marathon)
-        marathon_service.save_marathon_info(uow, marathon)
+    pipeline = MarathonIngestionPipeline(crawler_registry, marathon_service, batch_size=settings.INGEST_BATCH_SIZE)
+    ingestion_result = pipeline.run(None)
+    logger.info(f"Ingestion result: {ingestion_result}")
+    logger.info(f"Crawl sources: {crawler_registry.last_result.per_source}, "
+                f"duplicates: {crawler_registry.last_result.duplicates}, "
+                f"errors: {crawler_registry.last_result.errors}, "
+                f"field errors: {crawler_registry.last_result.field_errors}")
+    logger.info(f"HTTP cache stats: {http_client.stats.as_dict()}")
+    logger.info(f"Crawl stats: {roadrun_crawler.stats}, fetch stats: {fetcher.stats}")
+    logger.info(f"DB pool stats: {pool_stats()}")
 
     # 알림 서비스 설정
     twilio_adapter = TwilioNotificationAdapter(
@@ -49,11 +86,17 @@ def lambda_handler(event, context):
 
     address_manager = GoogleSpreadSheetAddressManager()
     recipients = address_manager.load_address()
-    logger.info(f"Recipients: {recipients}")
-    for recipient in recipients:
-        recipient_service.save_recipient(RecipientDB.from_dict(recipient))
+    if recipients is not None:
+        # 주소록을 불러오지 못하면 저장된 수신자를 지우지 않도록 동기화하지 않음
+        sync_result = recipient_service.sync_recipients(recipients)
+        logger.info(f"Recipient sync: {sync_result}")
+    # 중복 없이 정규화된 수신자에게 발송
+    recipients = [recipient.model_dump() for recipient in recipient_service.get_recipients()]
     
-    marathon_list = marathon_service.get_marathon_open_registration()
+    # 파이프라인이 방금 만든 digest를 사용 (만들지 못했으면 DB 조회)
+    marathon_list = marathon_service.get_digest_marathons(DIGEST_OPEN_REGISTRATION)
+    if marathon_list is None:
+        marathon_list = marathon_service.get_marathon_open_registration()
     notification_service.notify_new_marathon('이번주 마라톤 접수일정입니다', marathon_list, recipients)
     # 웹 크롤링 실행
     
@@ -0,0 +1,143 @@
+"""roadrun.co.kr에 접속하지 않고 RoadRunWebCrawler 처리량을 측정
+
+녹화된 페이지를 로컬 서버로 응답하면서 (지연 시간 설정 가능) 크롤링 모드와
+파서 백엔드 조합마다 pages/sec, fetch 지연 p50/p95, 파싱 시간, 최대 메모리를 보고한다.
+
+    python -m benchmarks.crawler_benchmark --rows 200 --latency-ms 50 --workers 1 8 --parsers html.parser lxml
+"""
+import argparse
+import statistics
+import threading
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import List
+
+from benchmarks.roadrun_stub import RoadRunStubServer
+from src.adapters.inbound.http_cache import CachedHttpClient
+from src.adapters.inbound.roadrun_parser import PARSERS, get_parser
+from src.adapters.inbound.web_crawler import BaseMarathonInfoFilter, RoadRunWebCrawler
+
+
+@dataclass
+class CrawlBenchmarkResult:
+    parser: str
+    workers: int
+    marathons: int
+    pages: int
+    elapsed: float
+    fetch_p50_ms: float
+    fetch_p95_ms: float
+    parse_ms: float
+    peak_memory_mb: float
+
+    @property
+    def pages_per_sec(self) -> float:
+        return self.pages / self.elapsed if self.elapsed else 0.0
+
+
+class TimedHttpClient(CachedHttpClient):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.timings: List[float] = []
+        self._lock = threading.Lock()
+
+    def get_text(self, url, encoding=None, **kwargs):
+        started = time.perf_counter()
+        try:
+            return super().get_text(url, encoding=encoding, **kwargs)
+        finally:
+            with self._lock:
+                self.timings.append(time.perf_counter() - started)
+
+
+class TimedParser:
+    def __init__(self, parser):
+        self.parser = parser
+        self.elapsed = 0.0
+        self._lock = threading.Lock()
+
+    def _timed(self, func, html):
+        started = time.perf_counter()
+        try:
+            return func(html)
+        finally:
+            with self._lock:
+                self.elapsed += time.perf_counter() - started
+
+    def parse_list(self, html):
+        return self._timed(self.parser.parse_list, html)
+
+    def parse_detail(self, html):
+        return self._timed(self.parser.parse_detail, html)
+
+
+def percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def run_crawl(server: RoadRunStubServer, parser: str, workers: int) -> CrawlBenchmarkResult:
+    http_client = TimedHttpClient(pool_maxsize=workers)
+    timed_parser = TimedParser(get_parser(parser))
+    crawler = RoadRunWebCrawler(BaseMarathonInfoFilter(),
+                                max_workers=workers,
+                                per_host_limit=workers,
+                                http_client=http_client,
+                                parser=timed_parser,
+                                base_url=server.base_url)
+
+    tracemalloc.start()
+    started = time.perf_counter()
+    marathon_list = crawler.crawl(server.list_url)
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return CrawlBenchmarkResult(
+        parser=parser,
+        workers=workers,
+        marathons=len(marathon_list),
+        pages=len(http_client.timings),
+        elapsed=elapsed,
+        fetch_p50_ms=statistics.median(http_client.timings) * 1000 if http_client.timings else 0.0,
+        fetch_p95_ms=percentile(http_client.timings, 95) * 1000,
+        parse_ms=timed_parser.elapsed * 1000,
+        peak_memory_mb=peak / 1024 / 1024,
+    )
+
+
+def run_benchmark(rows: int, latency: float, jitter: float,
+                  workers: List[int], parsers: List[str]) -> List[CrawlBenchmarkResult]:
+    results = []
+    with RoadRunStubServer(rows=rows, latency=latency, jitter=jitter) as server:
+        for parser in parsers:
+            for worker_count in workers:
+                results.append(run_crawl(server, parser, worker_count))
+    return results
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument('--rows', type=int, default=100, help='목록 페이지 일정 행 수')
+    arg_parser.add_argument('--latency-ms', type=float, default=30.0, help='요청당 지연 시간')
+    arg_parser.add_argument('--jitter-ms', type=float, default=10.0, help='지연 시간 편차')
+    arg_parser.add_argument('--workers', type=int, nargs='+', default=[1, 4, 8])
+    arg_parser.add_argument('--parsers', nargs='+', default=list(PARSERS), choices=list(PARSERS))
+    args = arg_parser.parse_args()
+
+    results = run_benchmark(args.rows, args.latency_ms / 1000, args.jitter_ms / 1000, args.workers, args.parsers)
+
+    print(f"{'parser':<12} {'workers':>7} {'marathons':>9} {'pages':>6} {'pages/s':>8} "
+          f"{'p50 ms':>8} {'p95 ms':>8} {'parse ms':>9} {'peak MB':>8}")
+    for result in results:
+        print(f"{result.parser:<12} {result.workers:>7} {result.marathons:>9} {result.pages:>6} "
+              f"{result.pages_per_sec:>8.1f} {result.fetch_p50_ms:>8.1f} {result.fetch_p95_ms:>8.1f} "
+              f"{result.parse_ms:>9.1f} {result.peak_memory_mb:>8.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+"""preprocess_data(행 단위) 대비 MarathonBatchNormalizer(배치 + 캐시) 성능 비교
+
+    python -m benchmarks.normalizer_benchmark --rows 5000
+"""
+import argparse
+import random
+import time
+
+from src.adapters.inbound.normalizer import MarathonBatchNormalizer
+from src.adapters.inbound.web_crawler import BaseMarathonInfoFilter, RoadRunWebCrawler
+
+START_TIMES = ['오전 9시', '오전 9시 30분', '오전 8시', '09:00', '08:30', '0900', '10시', '오후 1시']
+
+
+def build_raw_marathons(rows: int, seed: int = 0) -> list[dict]:
+    """실제 크롤링처럼 같은 날짜/출발시간 문자열이 반복되는 raw 마라톤 목록"""
+    rng = random.Random(seed)
+    marathons = []
+    for i in range(rows):
+        month, day = rng.randint(1, 12), rng.randint(1, 28)
+        marathons.append({
+            'title': f'마라톤 {i}',
+            'location': '서울 여의도공원',
+            'homepage': 'http://example.com',
+            'courses': ['10km', '하프'],
+            'organizer': '주최사',
+            'registration_period': f'2024년{max(1, month - 2)}월1일~2024년{month}월{day}일',
+            'event_datetime': f'2024년{month}월{day}일 출발시간: {rng.choice(START_TIMES)}',
+        })
+    return marathons
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument('--rows', type=int, default=5000)
+    arg_parser.add_argument('--repeat', type=int, default=5)
+    args = arg_parser.parse_args()
+
+    marathons = build_raw_marathons(args.rows)
+    crawler = RoadRunWebCrawler(BaseMarathonInfoFilter())
+
+    per_row = []
+    for _ in range(args.repeat):
+        started = time.perf_counter()
+        for marathon in marathons:
+            crawler.preprocess_data(marathon)
+        per_row.append(time.perf_counter() - started)
+
+    batch = []
+    normalizer = MarathonBatchNormalizer()
+    for _ in range(args.repeat):
+        normalizer.clear_cache()
+        started = time.perf_counter()
+        normalizer.normalize(marathons)
+        batch.append(time.perf_counter() - started)
+
+    per_row_ms, batch_ms = min(per_row) * 1000, min(batch) * 1000
+    print(f"rows: {args.rows}")
+    print(f"per-row preprocess_data : {per_row_ms:8.2f} ms ({per_row_ms * 1000 / args.rows:.2f} us/row)")
+    print(f"batch normalizer        : {batch_ms:8.2f} ms ({batch_ms * 1000 / args.rows:.2f} us/row)")
+    print(f"speedup                 : {per_row_ms / batch_ms:8.2f}x")
+    print(f"cache stats             : {normalizer.cache_stats()}")
+
+
+if __name__ == '__main__':
+    main()
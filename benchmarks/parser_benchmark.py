@@ -0,0 +1,44 @@
+"""roadrun 파서 백엔드별 페이지당 파싱 시간 측정
+
+    python -m benchmarks.parser_benchmark --rows 300 --repeat 20
+"""
+import argparse
+import statistics
+import time
+
+from benchmarks.roadrun_stub import build_list_page, load_page
+from src.adapters.inbound.roadrun_parser import PARSERS, get_parser
+
+
+def measure(func, html: str, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(html)
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings) * 1000
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument('--rows', type=int, default=300, help='목록 페이지 일정 행 수')
+    arg_parser.add_argument('--repeat', type=int, default=20)
+    args = arg_parser.parse_args()
+
+    list_html = build_list_page(args.rows)
+    detail_html = load_page('view_101.html')
+
+    print(f"{'backend':<12} {'list.php (ms/page)':>20} {'view.php (ms/page)':>20}")
+    for engine in PARSERS:
+        try:
+            parser = get_parser(engine)
+        except ImportError as e:
+            print(f"{engine:<12} skipped ({e})")
+            continue
+        list_ms = measure(parser.parse_list, list_html, args.repeat)
+        detail_ms = measure(parser.parse_detail, detail_html, args.repeat)
+        print(f"{engine:<12} {list_ms:>20.3f} {detail_ms:>20.3f}")
+
+
+if __name__ == '__main__':
+    main()
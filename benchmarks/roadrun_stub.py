@@ -0,0 +1,105 @@
+"""녹화된 roadrun 페이지로 list.php / view.php를 흉내 내는 로컬 HTTP 서버"""
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict
+from urllib.parse import parse_qs, urlparse
+
+CORPUS_DIR = Path(__file__).resolve().parent.parent / "tests" / "fixtures" / "roadrun"
+ROW_PATTERN = re.compile(r'<tr>\s*<td><font size="4">.*?</tr>', re.S)
+
+
+def load_page(name: str) -> str:
+    return (CORPUS_DIR / name).read_bytes().decode('euc-kr')
+
+
+def build_list_page(rows: int) -> str:
+    """녹화된 list.php의 일정 행을 반복하고, 행마다 고유한 view 번호를 붙인 목록 페이지"""
+    html = load_page('list.html')
+    matches = list(ROW_PATTERN.finditer(html))
+    templates = [match.group(0) for match in matches if 'view.php?no=' in match.group(0)]
+    body = '\n'.join(
+        re.sub(r'view\.php\?no=\d+', f'view.php?no={1000 + i}', templates[i % len(templates)])
+        for i in range(rows)
+    )
+    return html[:matches[0].start()] + body + html[matches[-1].end():]
+
+
+def build_detail_pages() -> Dict[int, str]:
+    return {no: load_page(f'view_{no}.html') for no in (101, 102, 103)}
+
+
+class RoadRunStubServer:
+    """latency(초) ± jitter 만큼 지연한 뒤 euc-kr 페이지를 응답"""
+
+    def __init__(self, rows: int = 100, latency: float = 0.0, jitter: float = 0.0, seed: int = 0):
+        self.list_page = build_list_page(rows).encode('euc-kr')
+        detail_pages = build_detail_pages()
+        self.detail_pages = [detail_pages[no].encode('euc-kr') for no in sorted(detail_pages)]
+        self.latency = latency
+        self.jitter = jitter
+        self.requests = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/schedule/"
+
+    @property
+    def list_url(self) -> str:
+        return self.base_url + 'list.php'
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _delay(self) -> float:
+        with self._lock:
+            self.requests += 1
+            jitter = self._random.uniform(-self.jitter, self.jitter) if self.jitter else 0.0
+        return max(0.0, self.latency + jitter)
+
+    def _page(self, path: str) -> bytes | None:
+        parsed = urlparse(path)
+        if parsed.path.endswith('/list.php'):
+            return self.list_page
+        if parsed.path.endswith('/view.php'):
+            no = int(parse_qs(parsed.query).get('no', ['0'])[0])
+            return self.detail_pages[no % len(self.detail_pages)]
+        return None
+
+    def _handler_class(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                time.sleep(stub._delay())
+                body = stub._page(self.path)
+                if body is None:
+                    self.send_error(404)
+                    return
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/html; charset=euc-kr')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
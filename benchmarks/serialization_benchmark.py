@@ -0,0 +1,100 @@
+"""마라톤 목록 API 응답의 요청당 CPU 시간 비교
+
+before: MarathonInfo.model_validate 재검증 + FastAPI response_model 검증/변환 + json.dumps
+after:  marathon_list_response (TypeAdapter.dump_json으로 한 번 직렬화)
+
+    python -m benchmarks.serialization_benchmark --rows 1000 10000 --repeat 10
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from datetime import datetime, timedelta
+
+from fastapi import FastAPI
+
+from src.adapters.inbound.api import marathon_list_response
+from src.domain.models import Course, MarathonInfo, Region
+
+
+def build_marathons(rows: int) -> list[MarathonInfo]:
+    """projection 조회 결과와 같은 MarathonInfo 목록"""
+    regions = list(Region)
+    return [
+        MarathonInfo(
+            id=i,
+            title=f'마라톤 {i}',
+            race_date=datetime(2024, 1, 1, 9, 0) + timedelta(days=i % 365),
+            location='서울 여의도공원',
+            region=regions[i % len(regions)],
+            courses=[Course(distance=10.0, name='10KM'), Course(distance=21.0975, name='HALF')],
+            homepage='http://example.com',
+            organization_name='주최사',
+            registration_start_date=datetime(2023, 11, 1),
+            registration_end_date=datetime(2023, 12, 31),
+        )
+        for i in range(rows)
+    ]
+
+
+def build_app(marathons: list[MarathonInfo]) -> FastAPI:
+    app = FastAPI()
+
+    @app.get('/before', response_model=list[MarathonInfo])
+    async def before():
+        return [MarathonInfo.model_validate(marathon) for marathon in marathons]
+
+    @app.get('/after', response_model=list[MarathonInfo])
+    async def after():
+        return marathon_list_response(marathons)
+
+    return app
+
+
+async def request(app: FastAPI, path: str) -> bytes:
+    """HTTP 서버 없이 ASGI 앱을 직접 호출해서 응답 본문을 반환"""
+    scope = {'type': 'http', 'asgi': {'version': '3.0'}, 'http_version': '1.1', 'method': 'GET',
+             'scheme': 'http', 'path': path, 'raw_path': path.encode(), 'root_path': '', 'query_string': b'',
+             'headers': [], 'client': ('127.0.0.1', 0), 'server': ('127.0.0.1', 80)}
+    body = []
+
+    async def receive():
+        return {'type': 'http.request', 'body': b'', 'more_body': False}
+
+    async def send(message):
+        if message['type'] == 'http.response.body':
+            body.append(message.get('body', b''))
+
+    await app(scope, receive, send)
+    return b''.join(body)
+
+
+async def measure(app: FastAPI, path: str, repeat: int) -> float:
+    """요청 하나를 처리하는 데 쓴 CPU 시간의 중앙값 (ms)"""
+    timings = []
+    for _ in range(repeat):
+        started = time.process_time()
+        await request(app, path)
+        timings.append(time.process_time() - started)
+    return statistics.median(timings) * 1000
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument('--rows', type=int, nargs='+', default=[1000, 10000])
+    arg_parser.add_argument('--repeat', type=int, default=10)
+    args = arg_parser.parse_args()
+
+    print(f"{'rows':>8} {'before (ms CPU)':>16} {'after (ms CPU)':>16} {'speedup':>8}")
+    for rows in args.rows:
+        app = build_app(build_marathons(rows))
+        # 두 경로의 응답이 같은지 먼저 확인 (첫 요청은 측정에서 제외)
+        assert json.loads(asyncio.run(request(app, '/before'))) == json.loads(asyncio.run(request(app, '/after')))
+        before_ms = asyncio.run(measure(app, '/before', args.repeat))
+        after_ms = asyncio.run(measure(app, '/after', args.repeat))
+        print(f"{rows:>8} {before_ms:>16.1f} {after_ms:>16.1f} {before_ms / after_ms:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
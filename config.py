@@ -11,6 +11,16 @@ class Settings(BaseSettings):
     DB_PASSWORD: str
     DB_NAME: str = "marathon_db"
     SQLALCHEMY_DATABASE_URL: str | None = None
+    # API 조회용 읽기 전용 복제본 (DB_READ_HOST만 주면 같은 계정/DB 이름으로 접속)
+    DB_READ_HOST: str | None = None
+    SQLALCHEMY_READ_DATABASE_URL: str | None = None
+    # 커넥션 풀 설정 (Lambda는 DB_NULL_POOL=true로 호출마다 연결을 닫음)
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = 1800  # 초, -1이면 사용하지 않음
+    DB_POOL_PRE_PING: bool = True
+    DB_NULL_POOL: bool = False
 
     # Twilio 설정
     TWILIO_ACCOUNT_SID: str
@@ -20,12 +30,36 @@ class Settings(BaseSettings):
     # Telegram 설정
     TELEGRAM_BOT_TOKEN: str
 
+    # Crawler 설정
+    CRAWLER_MAX_WORKERS: int = 8
+    CRAWLER_PER_HOST_LIMIT: int = 4
+    CRAWLER_MIN_REQUEST_INTERVAL: float = 0.0
+    CRAWLER_CACHE_DIR: str | None = None  # 예) /tmp/roadrun-cache, EFS 마운트 경로
+    CRAWLER_CACHE_FRESH_SECONDS: float = 0.0
+    CRAWLER_PARSER: str = 'html.parser'  # html.parser | lxml | selectolax
+    CRAWLER_REQUEST_TIMEOUT: float = 10.0
+    CRAWLER_MAX_ATTEMPTS: int = 3
+    CRAWLER_BACKOFF_BASE: float = 0.5
+    CRAWLER_BACKOFF_MAX: float = 5.0
+    CRAWLER_BREAKER_THRESHOLD: int = 5
+    CRAWLER_BREAKER_RESET_SECONDS: float = 60.0
+    CRAWLER_DEADLINE_SECONDS: float | None = 600.0
+    INGEST_BATCH_SIZE: int = 20
+
+    # API 응답 캐시 (REDIS_URL이 있으면 API 프로세스끼리 공유)
+    RESPONSE_CACHE_TTL_SECONDS: float = 300.0
+    RESPONSE_CACHE_MAX_ENTRIES: int = 256
+    RESPONSE_CACHE_VERSION_CHECK_SECONDS: float = 5.0
+    RESPONSE_CACHE_REDIS_URL: str | None = None
+
     AWS_ACCESS_KEY_ID: str | None = None
     AWS_SECRET_ACCESS_KEY: str | None = None
     
     @model_validator(mode='after')
     def set_database_url(self) -> 'Settings':
         self.SQLALCHEMY_DATABASE_URL = f"postgresql://{self.DB_USER}:{self.DB_PASSWORD}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
+        if self.DB_READ_HOST and not self.SQLALCHEMY_READ_DATABASE_URL:
+            self.SQLALCHEMY_READ_DATABASE_URL = f"postgresql://{self.DB_USER}:{self.DB_PASSWORD}@{self.DB_READ_HOST}:{self.DB_PORT}/{self.DB_NAME}"
         return self
 
     class Config:
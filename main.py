@@ -1,12 +1,24 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
+from config import get_settings
 from src.adapters.inbound.api import MarathonController
-from src.application.services import MarathonService
-from src.infrastructure.uow import SqlAlchemyUnitOfWork
+from src.adapters.inbound.response_cache import RedisSharedCache, ResponseCache, TTLCache
+from src.application.services import AsyncMarathonService, MarathonService
+from src.infrastructure.uow import AsyncSqlAlchemyUnitOfWork, ReadOnlyUnitOfWork, SqlAlchemyUnitOfWork
+from src.infrastructure.database import dispose_async_engine, dispose_engines, init_tables, pool_stats
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 서버 시작 시 아직 적용하지 않은 스키마 마이그레이션 실행
+    init_tables()
+    yield
+    await dispose_async_engine()
+    dispose_engines()
 
 def create_app() -> FastAPI:
-    app = FastAPI()
+    app = FastAPI(lifespan=lifespan)
     app.add_middleware(
                 CORSMiddleware,
                 allow_origins=["*"],
@@ -16,8 +28,19 @@ def create_app() -> FastAPI:
     )
 
     # 의존성 주입
+    settings = get_settings()
     marathon_service = MarathonService(uow=SqlAlchemyUnitOfWork())
-    marathon_controller = MarathonController(marathon_service)
+    response_cache = ResponseCache(
+        version_provider=lambda: MarathonService(ReadOnlyUnitOfWork()).get_data_version(),
+        local=TTLCache(maxsize=settings.RESPONSE_CACHE_MAX_ENTRIES, ttl=settings.RESPONSE_CACHE_TTL_SECONDS),
+        shared=RedisSharedCache(settings.RESPONSE_CACHE_REDIS_URL) if settings.RESPONSE_CACHE_REDIS_URL else None,
+        version_check_interval=settings.RESPONSE_CACHE_VERSION_CHECK_SECONDS,
+    )
+    # 목록 조회는 async 서비스로 처리하므로 요청별 읽기 전용 UoW(read_uow_factory)는 쓰지 않음
+    marathon_controller = MarathonController(marathon_service,
+                                             pool_stats=pool_stats,
+                                             async_marathon_service=AsyncMarathonService(AsyncSqlAlchemyUnitOfWork()),
+                                             response_cache=response_cache)
     
     # 라우터 등록
     app.include_router(marathon_controller.router)
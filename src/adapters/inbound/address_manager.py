@@ -1,4 +1,5 @@
 from src.ports.inbound import AddressManagerPort
+from src.domain.phone import normalize_phone_number
 from typing import List, Dict
 
 from google.oauth2 import service_account
@@ -10,8 +11,8 @@ SCOPES = ["https://www.googleapis.com/auth/spreadsheets"]
 SPREADSHEET_ID = "1Pjuh7x_QxImluPDoJaa47be10tbq6YDaCtogrsU5_80"
 RANGE_NAME = "response_sheet"
 
-def preprocess_phone_number(phone_number: str) -> str:
-    return '+82' + phone_number.replace("-", "")[1:]
+def preprocess_phone_number(phone_number: str) -> str | None:
+    return normalize_phone_number(phone_number)
 
 class GoogleSpreadSheetAddressManager(AddressManagerPort):
     def load_address(self) -> List[Dict]:
@@ -40,7 +41,9 @@ class GoogleSpreadSheetAddressManager(AddressManagerPort):
 
             for row in values:
                 timestamp_str, name, courses, phone_number = row
-                phone_number = preprocess_phone_number(phone_number)
+                if not (phone_number := preprocess_phone_number(phone_number)):
+                    print(f"{name}의 전화번호 형식이 올바르지 않습니다: {row[3]}")
+                    continue
                 recipients.append(dict(name=name, phone_number=phone_number))
             return recipients
                 
@@ -1,18 +1,111 @@
-from fastapi import APIRouter,FastAPI, Query
+from fastapi import APIRouter,FastAPI, Body, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from fastapi.routing import APIRoute
 from datetime import datetime
+from typing import AsyncIterator, Callable, Iterator
+from pydantic import BaseModel
+from starlette.concurrency import run_in_threadpool
 
+from src.application.uow import AbstractUnitOfWork
 from src.infrastructure.uow import SqlAlchemyUnitOfWork
-from src.domain.models import MarathonInfo
+from src.domain.models import MarathonInfo, Region
 from src.ports.inbound import ControllerPort
-from src.application.services import MarathonService
+from src.application.services import (DIGEST_OPEN_REGISTRATION, DIGEST_THIS_MONTH, MARATHON_LIST_ADAPTER,
+                                      MAX_BATCH_QUERIES, AsyncMarathonService, MarathonQuery, MarathonService)
+from src.application.fields import MARATHON_FIELDS, parse_fields
+from src.application.pagination import MAX_PAGE_SIZE, next_cursor
+from src.adapters.inbound.response_cache import ResponseCache, cached_route
+
+STREAM_MEDIA_TYPES = {
+    'ndjson': 'application/x-ndjson',
+    'json': 'application/json',
+}
+FIELDS_DESCRIPTION = f"응답 필드 (fields=title,race_date,homepage / 가능한 필드: {', '.join(MARATHON_FIELDS)})"
+
+
+class MarathonBatchResult(BaseModel):
+    """일괄 조회에서 조회 하나의 결과 (next_cursor는 목록 API의 X-Next-Cursor 헤더와 같음)"""
+    items: list[MarathonInfo]
+    next_cursor: str | None = None
+
+
+def stream_marathons(marathons: Iterator[MarathonInfo], format: str) -> Iterator[str]:
+    """마라톤을 한 건씩 직렬화 (ndjson: 한 줄에 하나, json: 하나의 JSON 배열)"""
+    if format == 'ndjson':
+        for marathon in marathons:
+            yield marathon.model_dump_json() + '\n'
+        return
+    yield '['
+    for index, marathon in enumerate(marathons):
+        yield (',' if index else '') + marathon.model_dump_json()
+    yield ']'
+
+
+def fields_include(fields: tuple[str, ...] | None) -> dict | None:
+    """목록의 모든 항목에서 fields만 직렬화하는 include"""
+    return {'__all__': set(fields)} if fields else None
+
+
+def marathon_list_response(marathon_list: list[MarathonInfo], limit: int | None = None,
+                           fields: tuple[str, ...] | None = None) -> Response:
+    """서비스가 만든 MarathonInfo 목록을 다시 검증하지 않고 한 번에 JSON으로 직렬화
+
+    Response를 직접 반환하면 FastAPI는 response_model 검증/변환을 건너뛴다 (response_model은 문서용).
+    fields가 있으면 그 필드만 직렬화한다.
+    """
+    cursor = next_cursor(marathon_list, limit)
+    return Response(content=MARATHON_LIST_ADAPTER.dump_json(marathon_list, include=fields_include(fields)),
+                    media_type='application/json',
+                    headers={'X-Next-Cursor': cursor} if cursor else None)
+
+
+def marathon_batch_response(queries: list[MarathonQuery], results: list[list[MarathonInfo]]) -> Response:
+    """조회마다 {"items": [...], "next_cursor": ...}를 만들어 조회 순서대로 JSON 배열로 응답"""
+    body = b','.join(
+        MarathonBatchResult.model_construct(items=marathon_list,
+                                            next_cursor=next_cursor(marathon_list, query.limit))
+        .model_dump_json(include={'items': fields_include(query.fields) or True, 'next_cursor': True})
+        .encode()
+        for query, marathon_list in zip(queries, results)
+    )
+    return Response(content=b'[' + body + b']', media_type='application/json')
 
 
 class MarathonController(ControllerPort):
-    def __init__(self, marathon_service: MarathonService):
+    def __init__(self, marathon_service: MarathonService,
+                 read_uow_factory: Callable[[], AbstractUnitOfWork] | None = None,
+                 pool_stats: Callable[[], dict] | None = None,
+                 async_marathon_service: AsyncMarathonService | None = None,
+                 response_cache: ResponseCache | None = None):
         self.marathon_service = marathon_service
+        # 주어지면 목록 조회 응답을 캐시하고 ETag로 304 응답
+        self.response_cache = response_cache
+        self.cached_route_class = cached_route(response_cache) if response_cache else APIRoute
+        # 주어지면 목록 조회는 이벤트 루프를 막지 않는 asyncio 드라이버로 실행
+        self.async_marathon_service = async_marathon_service
+        # 주어지면 조회 API는 요청마다 읽기 전용 UoW(세션 하나)를 열어서 사용
+        # (async 서비스로 조회할 때는 동기 세션을 쓰지 않으므로 열지 않음)
+        self.read_uow_factory = read_uow_factory
+        self.read_dependencies = ([Depends(self.open_read_scope)]
+                                  if read_uow_factory is not None and async_marathon_service is None else [])
+        self.pool_stats = pool_stats
         self.router = APIRouter(prefix="/api/v1")
         self.setup_routes()
 
+    async def open_read_scope(self, request: Request) -> AsyncIterator[None]:
+        """요청 하나 동안 읽기 전용 UoW를 열어 두고, 그 UoW를 쓰는 MarathonService를 request.state에 저장"""
+        with self.read_uow_factory() as uow:
+            request.state.marathon_service = MarathonService(uow)
+            yield
+
+    def service(self, request: Request) -> MarathonService:
+        return getattr(request.state, 'marathon_service', self.marathon_service)
+
+    async def query(self, request: Request, method: str, **kwargs):
+        """async 서비스가 있으면 await하고, 없으면 동기 서비스의 같은 이름 메서드를 호출"""
+        if self.async_marathon_service is not None:
+            return await getattr(self.async_marathon_service, method)(**kwargs)
+        return getattr(self.service(request), method)(**kwargs)
 
     def setup_routes(self):
         self.router.add_api_route(
@@ -20,51 +113,183 @@ class MarathonController(ControllerPort):
             self.health_check,
             methods=["GET"]
         )
+        self.router.add_api_route(
+            "/healthcheck/db-pool",
+            self.db_pool_stats,
+            methods=["GET"]
+        )
         self.router.add_api_route(
             "/marathon",
             self.get_marathon_info,
             methods=["GET"],
-            response_model=list[MarathonInfo]
+            dependencies=self.read_dependencies,
+            response_model=list[MarathonInfo],
+            route_class_override=self.cached_route_class,
+        )
+        self.router.add_api_route(
+            "/marathon/batch",
+            self.get_marathon_batch,
+            methods=["POST"],
+            dependencies=self.read_dependencies,
+            response_model=list[MarathonBatchResult],
+        )
+        self.router.add_api_route(
+            "/marathon/search",
+            self.search_marathons,
+            methods=["GET"],
+            dependencies=self.read_dependencies,
+            response_model=list[MarathonInfo],
+            route_class_override=self.cached_route_class,
+        )
+        self.router.add_api_route(
+            "/marathon/stream",
+            self.stream_marathon_info,
+            methods=["GET"],
+            dependencies=self.read_dependencies,
+            response_class=StreamingResponse,
         )
         self.router.add_api_route(
             "/marathon/open-registration",
             self.get_marathon_open_registration,
             methods=["GET"],
-            response_model=list[MarathonInfo]
+            dependencies=self.read_dependencies,
+            response_model=list[MarathonInfo],
+            route_class_override=self.cached_route_class,
         )
         self.router.add_api_route(
             "/marathon/this-month",
             self.get_marathon_this_month,
             methods=["GET"],
-            response_model=list[MarathonInfo]
+            dependencies=self.read_dependencies,
+            response_model=list[MarathonInfo],
+            route_class_override=self.cached_route_class,
         )
 
     async def health_check(self):
         return {"message": "healthy!"}
+
+    async def db_pool_stats(self):
+        """DB 커넥션 풀 사용량 (체크아웃 대기 시간, 최대 동시 사용 수)"""
+        return self.pool_stats() if self.pool_stats else {}
     
     async def get_marathon_info(
         self,
+        request: Request,
         registration_status: bool = Query(None, description="접수 기간 체크"),
-        region: str = Query(None, description="지역 조회"),
+        region: list[Region] = Query(None, description="지역 조회 (region=서울&region=경기)"),
         course: int = Query(None, description="코스 조회"),
         race_search_start_date: datetime = Query(None, description="마라톤 날짜 탐색 범위(시작)"),
         race_search_end_date: datetime = Query(None, description="마라톤 날짜 탐색 범위(끝)"),
+        limit: int = Query(None, ge=1, le=MAX_PAGE_SIZE, description="페이지 크기 (다음 페이지는 X-Next-Cursor 헤더)"),
+        cursor: str = Query(None, description="이전 응답의 X-Next-Cursor 값"),
+        fields: str = Query(None, description=FIELDS_DESCRIPTION),
     ):
         
-        marathon_list = self.marathon_service.get_marathon_info(
-            registration_status, 
-            region, 
-            course, 
-            race_search_start_date, 
-            race_search_end_date
-        )
-        return [MarathonInfo.model_validate(marathon) for marathon in marathon_list]
+        try:
+            fields = parse_fields(fields)
+            marathon_list = await self.query(
+                request,
+                'get_marathon_info',
+                registration_status=registration_status,
+                region=region,
+                course=course,
+                race_search_start_date=race_search_start_date,
+                race_search_end_date=race_search_end_date,
+                limit=limit,
+                cursor=cursor,
+                fields=fields,
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        return marathon_list_response(marathon_list, limit, fields)
 
+    async def get_marathon_batch(
+        self,
+        request: Request,
+        queries: list[MarathonQuery] = Body(..., min_length=1, max_length=MAX_BATCH_QUERIES,
+                                            description="조회 목록 (view: marathon | open-registration | this-month)"),
+    ):
+        """여러 목록 조회를 요청 한 번, DB 세션 하나로 실행 (예: 달력 화면의 전체/접수 중/이번 달 목록)"""
+        try:
+            if self.async_marathon_service is not None:
+                results = await self.async_marathon_service.get_marathon_batch(queries)
+            else:
+                # 동기 서비스는 조회가 여러 번이라 이벤트 루프를 막지 않도록 스레드에서 실행
+                results = await run_in_threadpool(self.service(request).get_marathon_batch, queries)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        return marathon_batch_response(queries, results)
+
+    async def search_marathons(
+        self,
+        request: Request,
+        q: str = Query(..., min_length=1, max_length=100, description="대회명, 장소, 주최 검색어 (예: 춘천)"),
+        limit: int = Query(20, ge=1, le=100, description="최대 결과 수"),
+        fields: str = Query(None, description=FIELDS_DESCRIPTION),
+    ):
+        try:
+            fields = parse_fields(fields)
+            marathon_list = await self.query(request, 'search_marathons', q=q, limit=limit, fields=fields)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        return marathon_list_response(marathon_list, fields=fields)
+
+    async def stream_marathon_info(
+        self,
+        request: Request,
+        registration_status: bool = Query(None, description="접수 기간 체크"),
+        region: list[Region] = Query(None, description="지역 조회 (region=서울&region=경기)"),
+        course: int = Query(None, description="코스 조회"),
+        race_search_start_date: datetime = Query(None, description="마라톤 날짜 탐색 범위(시작)"),
+        race_search_end_date: datetime = Query(None, description="마라톤 날짜 탐색 범위(끝)"),
+        format: str = Query('ndjson', pattern='^(ndjson|json)$', description="ndjson | json"),
+    ):
+        marathons = self.service(request).iter_marathon_info(
+            registration_status,
+            region,
+            course,
+            race_search_start_date,
+            race_search_end_date,
+        )
+        return StreamingResponse(stream_marathons(marathons, format), media_type=STREAM_MEDIA_TYPES[format])
     
-    async def get_marathon_open_registration(self):
-        marathon_list = self.marathon_service.get_marathon_open_registration()
-        return [MarathonInfo.model_validate(marathon) for marathon in marathon_list]
+    async def digest_response(self, request: Request, name: str) -> Response | None:
+        """수집 때 미리 만든 JSON이 유효하면 그대로 응답 (직렬화/검증 없음)"""
+        payload = await self.query(request, 'get_digest', name=name)
+        return None if payload is None else Response(content=payload, media_type='application/json')
 
-    async def get_marathon_this_month(self):
-        marathon_list = self.marathon_service.get_marathon_this_month()
-        return [MarathonInfo.model_validate(marathon) for marathon in marathon_list]
+    async def get_marathon_open_registration(
+        self,
+        request: Request,
+        limit: int = Query(None, ge=1, le=MAX_PAGE_SIZE, description="페이지 크기"),
+        cursor: str = Query(None, description="이전 응답의 X-Next-Cursor 값"),
+        fields: str = Query(None, description=FIELDS_DESCRIPTION),
+    ):
+        if limit is None and cursor is None and fields is None and (
+                digest := await self.digest_response(request, DIGEST_OPEN_REGISTRATION)):
+            return digest
+        try:
+            fields = parse_fields(fields)
+            marathon_list = await self.query(request, 'get_marathon_open_registration', limit=limit, cursor=cursor,
+                                             fields=fields)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        return marathon_list_response(marathon_list, limit, fields)
+
+    async def get_marathon_this_month(
+        self,
+        request: Request,
+        limit: int = Query(None, ge=1, le=MAX_PAGE_SIZE, description="페이지 크기"),
+        cursor: str = Query(None, description="이전 응답의 X-Next-Cursor 값"),
+        fields: str = Query(None, description=FIELDS_DESCRIPTION),
+    ):
+        if limit is None and cursor is None and fields is None and (
+                digest := await self.digest_response(request, DIGEST_THIS_MONTH)):
+            return digest
+        try:
+            fields = parse_fields(fields)
+            marathon_list = await self.query(request, 'get_marathon_this_month', limit=limit, cursor=cursor,
+                                             fields=fields)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        return marathon_list_response(marathon_list, limit, fields)
@@ -0,0 +1,151 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    not_modified: int = 0
+    unchanged_content: int = 0
+    fresh: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def record(self, **counts: int):
+        with self._lock:
+            for name, value in counts.items():
+                setattr(self, name, getattr(self, name) + value)
+
+    def as_dict(self) -> Dict[str, int]:
+        return dict(
+            hits=self.hits,
+            misses=self.misses,
+            not_modified=self.not_modified,
+            unchanged_content=self.unchanged_content,
+            fresh=self.fresh,
+        )
+
+
+@dataclass
+class CacheEntry:
+    url: str
+    text: str
+    content_hash: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    stored_at: float = 0.0
+
+
+class FileHttpCache:
+    """URL별 응답을 디렉터리에 저장하는 HTTP 캐시 (Lambda /tmp, EFS 마운트 등)"""
+
+    def __init__(self, cache_dir: str | os.PathLike):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, url: str) -> Path:
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        return self.cache_dir / f'{key}.json'
+
+    def get(self, url: str) -> Optional[CacheEntry]:
+        try:
+            with open(self._path(url), encoding='utf-8') as f:
+                return CacheEntry(**json.load(f))
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def set(self, entry: CacheEntry):
+        # 동시에 같은 URL을 쓰더라도 깨진 파일이 남지 않도록 임시 파일에 쓰고 교체
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(entry.__dict__, f, ensure_ascii=False)
+            os.replace(tmp_path, self._path(entry.url))
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+
+class CachedHttpClient:
+    """keep-alive 세션을 공유하고, ETag/Last-Modified 조건부 요청으로 캐시를 재검증하는 HTTP 클라이언트
+
+    서버가 검증자(ETag, Last-Modified)를 보내지 않으면 본문 해시를 비교해서
+    바뀌지 않은 페이지는 다시 디코딩하지 않고 캐시된 텍스트를 돌려준다.
+    fresh_for(초) 안에 저장된 항목은 요청 없이 바로 사용한다.
+    """
+
+    def __init__(self,
+                 session: requests.Session | None = None,
+                 cache: FileHttpCache | None = None,
+                 pool_maxsize: int = 10,
+                 fresh_for: float = 0.0):
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=pool_maxsize, pool_maxsize=pool_maxsize)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+        self.session = session
+        self.cache = cache
+        self.fresh_for = fresh_for
+        self.stats = CacheStats()
+
+    def get_text(self, url: str, encoding: str | None = None, **kwargs) -> str:
+        cached = self.cache.get(url) if self.cache else None
+        if cached and self.fresh_for > 0 and time.time() - cached.stored_at < self.fresh_for:
+            self.stats.record(hits=1, fresh=1)
+            return cached.text
+
+        headers = dict(kwargs.pop('headers', None) or {})
+        if cached and cached.etag:
+            headers['If-None-Match'] = cached.etag
+        if cached and cached.last_modified:
+            headers['If-Modified-Since'] = cached.last_modified
+
+        response = self.session.get(url, headers=headers, **kwargs)
+
+        if cached and response.status_code == 304:
+            self.stats.record(hits=1, not_modified=1)
+            self._store(cached, cached.etag, cached.last_modified)
+            return cached.text
+
+        response.raise_for_status()
+        content_hash = hashlib.sha256(response.content).hexdigest()
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+
+        if cached and cached.content_hash == content_hash:
+            self.stats.record(hits=1, unchanged_content=1)
+            self._store(cached, etag, last_modified)
+            return cached.text
+
+        self.stats.record(misses=1)
+        if encoding:
+            response.encoding = encoding
+        text = response.text
+        if self.cache:
+            self.cache.set(CacheEntry(url=url,
+                                      text=text,
+                                      content_hash=content_hash,
+                                      etag=etag,
+                                      last_modified=last_modified,
+                                      stored_at=time.time()))
+        return text
+
+    def _store(self, entry: CacheEntry, etag: Optional[str], last_modified: Optional[str]):
+        if not self.cache:
+            return
+        entry.etag = etag
+        entry.last_modified = last_modified
+        entry.stored_at = time.time()
+        self.cache.set(entry)
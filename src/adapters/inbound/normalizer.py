@@ -0,0 +1,134 @@
+import re
+from dataclasses import dataclass, field
+from datetime import datetime, time
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple
+
+KOREAN_DATE_PATTERN = re.compile(r'(\d{4})년(\d{1,2})월(\d{1,2})일')
+DIGITS_PATTERN = re.compile(r'\d+')
+HOUR_PATTERN = re.compile(r'(\d+)시')
+MINUTE_PATTERN = re.compile(r'(\d+)분')
+
+# 값을 그대로 옮기는 필드 (crawler key → domain key)
+PASSTHROUGH_FIELDS = {
+    'title': 'title',
+    'location': 'location',
+    'homepage': 'homepage',
+    'courses': 'courses',
+    'organizer': 'organization_name',
+    'roadrun_no': 'roadrun_no',
+    'list_row_hash': 'list_row_hash',
+}
+
+
+@dataclass
+class FieldError:
+    index: int
+    field: str
+    value: Any
+    message: str
+
+
+@dataclass
+class NormalizationResult:
+    records: List[Dict] = field(default_factory=list)
+    errors: List[FieldError] = field(default_factory=list)
+
+
+def parse_korean_date(value: str) -> datetime:
+    """'2024년12월8일' → datetime (크롤러의 행 단위 전처리도 이 함수를 사용)"""
+    match = KOREAN_DATE_PATTERN.fullmatch(value.strip())
+    if not match:
+        raise ValueError(f"날짜 형식이 아닙니다: {value!r}")
+    year, month, day = map(int, match.groups())
+    return datetime(year, month, day)
+
+
+def parse_start_time(value: str) -> time:
+    """'오전 9시 30분', '09:00', '0900' 같은 출발시간을 해석 (실패 시 ValueError)"""
+    time_str = value.replace("출발시간:", "").replace("출발", "").replace(';', ':').strip()
+    try:
+        if time_str.isdigit():
+            if len(time_str) == 4:
+                return time(int(time_str[:2]), int(time_str[2:]))
+            return time(int(time_str), 0)
+        if ':' in time_str:
+            hour, minute = map(int, DIGITS_PATTERN.findall(time_str)[:2])
+            if hour == 24:
+                hour = 0
+            return time(hour, minute)
+
+        hour = int(HOUR_PATTERN.search(time_str).group(1))
+        minute_match = MINUTE_PATTERN.search(time_str)
+        minute = int(minute_match.group(1)) if minute_match else 0
+        if '오후' in time_str and hour != 12:
+            hour += 12
+        return time(hour, minute)
+    except (AttributeError, TypeError, ValueError) as e:
+        raise ValueError(f"출발시간 형식이 아닙니다: {value!r}") from e
+
+
+class MarathonBatchNormalizer:
+    """크롤링한 raw 마라톤 목록을 도메인 필드로 한 번에 정규화
+
+    같은 날짜/출발시간 문자열이 반복되므로 해석 결과를 크기 제한이 있는 캐시에 보관한다.
+    해석에 실패한 필드는 print 대신 FieldError로 모아서 돌려준다.
+    대회일시나 접수기간을 해석하지 못한 마라톤은 결과에서 제외하고,
+    출발시간만 해석하지 못한 마라톤은 00:00으로 두되 오류로 보고한다.
+    """
+
+    def __init__(self, cache_size: int = 1024):
+        self._parse_date = lru_cache(maxsize=cache_size)(parse_korean_date)
+        self._parse_start_time = lru_cache(maxsize=cache_size)(parse_start_time)
+
+    def normalize(self, marathons: List[Dict]) -> NormalizationResult:
+        result = NormalizationResult()
+        for index, marathon in enumerate(marathons):
+            record = self._normalize_one(index, marathon, result.errors)
+            if record is not None:
+                result.records.append(record)
+        return result
+
+    def cache_stats(self) -> Dict[str, Dict[str, int]]:
+        stats = {}
+        for name, cached in (('date', self._parse_date), ('start_time', self._parse_start_time)):
+            info = cached.cache_info()
+            stats[name] = dict(hits=info.hits, misses=info.misses, size=info.currsize)
+        return stats
+
+    def clear_cache(self):
+        self._parse_date.cache_clear()
+        self._parse_start_time.cache_clear()
+
+    def _normalize_one(self, index: int, marathon: Dict, errors: List[FieldError]) -> Dict | None:
+        record = {}
+        valid = True
+        for key, value in marathon.items():
+            if key in PASSTHROUGH_FIELDS:
+                record[PASSTHROUGH_FIELDS[key]] = value
+            elif key == 'registration_period':
+                try:
+                    record['registration_start_date'], record['registration_end_date'] = \
+                        self._parse_registration_period(value)
+                except (AttributeError, ValueError) as e:
+                    errors.append(FieldError(index, key, value, str(e)))
+                    valid = False
+            elif key == 'event_datetime':
+                try:
+                    date_str, start_time_str = value.split(' 출발시간:')
+                    race_date = self._parse_date(date_str)
+                except (AttributeError, ValueError) as e:
+                    errors.append(FieldError(index, key, value, str(e)))
+                    valid = False
+                    continue
+                try:
+                    start_time = self._parse_start_time(start_time_str)
+                except ValueError as e:
+                    errors.append(FieldError(index, 'start_time', start_time_str, str(e)))
+                    start_time = time(0, 0)
+                record['race_date'] = datetime.combine(race_date, start_time)
+        return record if valid else None
+
+    def _parse_registration_period(self, value: str) -> Tuple[datetime, datetime]:
+        start, end = value.split('~')
+        return self._parse_date(start), self._parse_date(end)
@@ -0,0 +1,173 @@
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Optional, TypeVar
+from urllib.parse import urlparse
+
+import requests
+
+T = TypeVar('T')
+
+
+class DeadlineExceeded(Exception):
+    pass
+
+
+class CircuitOpenError(Exception):
+    pass
+
+
+class Deadline:
+    """크롤링 전체에 주어진 시간 예산"""
+
+    def __init__(self, seconds: float | None, clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        self.expires_at = clock() + seconds if seconds is not None else None
+
+    def remaining(self) -> float | None:
+        if self.expires_at is None:
+            return None
+        return max(0.0, self.expires_at - self._clock())
+
+    @property
+    def expired(self) -> bool:
+        remaining = self.remaining()
+        return remaining is not None and remaining <= 0
+
+
+@dataclass
+class RetryPolicy:
+    """지수 백오프 + full jitter 재시도 정책 (max_attempts는 첫 시도를 포함)"""
+    max_attempts: int = 3
+    backoff_base: float = 0.5
+    backoff_max: float = 5.0
+
+    def backoff(self, attempt: int, rng: random.Random | None = None) -> float:
+        ceiling = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+        return (rng or random).uniform(0, ceiling)
+
+
+class CircuitBreaker:
+    """호스트별로 연속 실패가 failure_threshold 번 쌓이면 reset_timeout 동안 요청을 막음
+
+    reset_timeout이 지나면 한 번의 시험 요청(half-open)을 허용하고,
+    성공하면 닫고 실패하면 다시 연다.
+    """
+
+    def __init__(self,
+                 failure_threshold: int = 5,
+                 reset_timeout: float = 60.0,
+                 clock: Callable[[], float] = time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._failures: Dict[str, int] = {}
+        self._opened_at: Dict[str, float] = {}
+        self._trial_in_flight: Dict[str, bool] = {}
+
+    def state(self, host: str) -> str:
+        with self._lock:
+            return self._state(host)
+
+    def _state(self, host: str) -> str:
+        opened_at = self._opened_at.get(host)
+        if opened_at is None:
+            return 'closed'
+        if self._clock() - opened_at >= self.reset_timeout:
+            return 'half-open'
+        return 'open'
+
+    def before_call(self, host: str):
+        with self._lock:
+            state = self._state(host)
+            if state == 'open' or (state == 'half-open' and self._trial_in_flight.get(host)):
+                raise CircuitOpenError(f"{host} 요청이 연속으로 실패해서 잠시 중단합니다.")
+            if state == 'half-open':
+                self._trial_in_flight[host] = True
+
+    def record_success(self, host: str):
+        with self._lock:
+            self._failures.pop(host, None)
+            self._opened_at.pop(host, None)
+            self._trial_in_flight.pop(host, None)
+
+    def record_failure(self, host: str):
+        with self._lock:
+            self._trial_in_flight.pop(host, None)
+            failures = self._failures.get(host, 0) + 1
+            self._failures[host] = failures
+            if failures >= self.failure_threshold or host in self._opened_at:
+                self._opened_at[host] = self._clock()
+
+
+def is_retryable(error: Exception) -> bool:
+    if isinstance(error, (requests.ConnectionError, requests.Timeout)):
+        return True
+    if isinstance(error, requests.HTTPError) and error.response is not None:
+        return error.response.status_code >= 500 or error.response.status_code == 429
+    return False
+
+
+@dataclass
+class FetchStats:
+    attempts: int = 0
+    retries: int = 0
+    failures: int = 0
+    circuit_rejections: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def record(self, **counts: int):
+        with self._lock:
+            for name, value in counts.items():
+                setattr(self, name, getattr(self, name) + value)
+
+
+class ResilientFetcher:
+    """요청마다 timeout을 걸고, 재시도/백오프와 서킷 브레이커를 적용"""
+
+    def __init__(self,
+                 request_timeout: float = 10.0,
+                 retry_policy: RetryPolicy | None = None,
+                 circuit_breaker: CircuitBreaker | None = None,
+                 sleep: Callable[[float], None] = time.sleep):
+        self.request_timeout = request_timeout
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        self.stats = FetchStats()
+        self._sleep = sleep
+
+    def fetch(self, url: str, attempt: Callable[[float], T], deadline: Optional[Deadline] = None) -> T:
+        """attempt(timeout)을 호출해서 결과를 반환 (timeout은 남은 시간 예산을 넘지 않음)"""
+        host = urlparse(url).netloc
+        for attempt_no in range(self.retry_policy.max_attempts):
+            if deadline and deadline.expired:
+                raise DeadlineExceeded(f"크롤링 시간 예산을 초과했습니다: {url}")
+            try:
+                self.circuit_breaker.before_call(host)
+            except CircuitOpenError:
+                self.stats.record(circuit_rejections=1)
+                raise
+
+            timeout = self.request_timeout
+            if deadline and deadline.remaining() is not None:
+                timeout = min(timeout, deadline.remaining())
+
+            self.stats.record(attempts=1)
+            try:
+                result = attempt(timeout)
+            except Exception as e:
+                self.stats.record(failures=1)
+                self.circuit_breaker.record_failure(host)
+                if not is_retryable(e) or attempt_no == self.retry_policy.max_attempts - 1:
+                    raise
+                delay = self.retry_policy.backoff(attempt_no)
+                if deadline and deadline.remaining() is not None and delay >= deadline.remaining():
+                    raise DeadlineExceeded(f"재시도 전에 크롤링 시간 예산이 끝났습니다: {url}") from e
+                self.stats.record(retries=1)
+                self._sleep(delay)
+                continue
+
+            self.circuit_breaker.record_success(host)
+            return result
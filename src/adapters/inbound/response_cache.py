@@ -0,0 +1,233 @@
+import base64
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Optional
+
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+from starlette.concurrency import run_in_threadpool
+
+# 캐시한 응답에서 같이 돌려주는 헤더
+CACHED_HEADERS = ('x-next-cursor',)
+
+
+@dataclass
+class CachedResponse:
+    body: bytes
+    etag: str
+    media_type: str = 'application/json'
+    headers: Dict[str, str] = field(default_factory=dict)
+
+    def dumps(self) -> bytes:
+        return json.dumps(dict(body=base64.b64encode(self.body).decode(),
+                               etag=self.etag,
+                               media_type=self.media_type,
+                               headers=self.headers)).encode()
+
+    @classmethod
+    def loads(cls, data: bytes) -> 'CachedResponse':
+        values = json.loads(data)
+        return cls(body=base64.b64decode(values['body']),
+                   etag=values['etag'],
+                   media_type=values['media_type'],
+                   headers=values['headers'])
+
+
+def strong_etag(body: bytes) -> str:
+    return '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """If-None-Match 헤더에 etag가 있는지 (If-None-Match는 약한 비교: W/ 접두어 무시)"""
+    if not if_none_match:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(',')]
+    return '*' in tags or etag in (tag.removeprefix('W/') for tag in tags)
+
+
+class TTLCache:
+    """최근에 쓴 순서로 maxsize개까지 유지하고, ttl초가 지난 항목은 버리는 프로세스 내 캐시"""
+
+    def __init__(self, maxsize: int = 256, ttl: float = 300.0, clock: Callable[[], float] = time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.clock = clock
+        self._entries: OrderedDict[str, tuple[float, object]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if self.clock() >= expires_at:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value):
+        with self._lock:
+            self._entries[key] = (self.clock() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class LocalSharedCache:
+    """공유 캐시(Redis) 대신 쓰는 프로세스 내 구현 (로컬 개발/테스트용)"""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self.clock = clock
+        self._values: Dict[str, tuple[float, bytes]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None or self.clock() >= entry[0]:
+                self._values.pop(key, None)
+                return None
+            return entry[1]
+
+    def set(self, key: str, value: bytes, ttl: float):
+        with self._lock:
+            self._values[key] = (self.clock() + ttl, value)
+
+
+class RedisSharedCache:
+    """여러 API 프로세스가 같이 쓰는 Redis 캐시"""
+
+    def __init__(self, url: str):
+        try:
+            import redis
+        except ImportError as e:
+            raise ImportError("공유 응답 캐시를 사용하려면 redis 패키지가 필요합니다.") from e
+        self.client = redis.Redis.from_url(url)
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.client.get(key)
+
+    def set(self, key: str, value: bytes, ttl: float):
+        self.client.set(key, value, px=int(ttl * 1000))
+
+
+@dataclass
+class ResponseCacheStats:
+    hits: int = 0
+    shared_hits: int = 0
+    misses: int = 0
+    not_modified: int = 0
+    invalidations: int = 0
+
+
+class ResponseCache:
+    """조회 API 응답 캐시 (프로세스 내 TTL LRU + 선택적으로 공유 캐시)
+
+    캐시 키에 데이터 버전을 넣어서, 수집이 끝나 버전이 바뀌면 이전 응답은 더 이상 쓰지 않는다.
+    데이터 버전은 version_check_interval초마다 한 번만 version_provider로 확인한다.
+    """
+
+    def __init__(self,
+                 version_provider: Callable[[], object],
+                 local: TTLCache | None = None,
+                 shared: LocalSharedCache | RedisSharedCache | None = None,
+                 version_check_interval: float = 5.0,
+                 clock: Callable[[], float] = time.monotonic):
+        self.version_provider = version_provider
+        self.local = local or TTLCache()
+        self.shared = shared
+        self.version_check_interval = version_check_interval
+        self.clock = clock
+        self.stats = ResponseCacheStats()
+        self._version = None
+        self._version_checked_at = None
+
+    async def version(self) -> str:
+        now = self.clock()
+        if self._version_checked_at is None or now - self._version_checked_at >= self.version_check_interval:
+            version = str(await run_in_threadpool(self.version_provider))
+            if self._version is not None and version != self._version:
+                self.local.clear()
+                self.stats.invalidations += 1
+            self._version, self._version_checked_at = version, now
+        return self._version
+
+    async def get(self, key: str) -> Optional[CachedResponse]:
+        cached = self.local.get(key)
+        if cached is not None:
+            self.stats.hits += 1
+            return cached
+        # 공유 캐시(Redis) 클라이언트는 동기 I/O라서 이벤트 루프를 막지 않도록 스레드에서 호출
+        data = await run_in_threadpool(self.shared.get, key) if self.shared else None
+        if data is not None:
+            cached = CachedResponse.loads(data)
+            self.local.set(key, cached)
+            self.stats.shared_hits += 1
+            return cached
+        self.stats.misses += 1
+        return None
+
+    async def set(self, key: str, cached: CachedResponse):
+        self.local.set(key, cached)
+        if self.shared:
+            await run_in_threadpool(self.shared.set, key, cached.dumps(), self.local.ttl)
+
+
+def cache_key(request: Request, version: str) -> str:
+    """경로 + 정렬한 query parameter (region=서울&region=경기 와 반대 순서는 같은 키)"""
+    params = sorted((name, value) for name, value in request.query_params.multi_items() if value != '')
+    query = '&'.join(f'{name}={value}' for name, value in params)
+    return f'marathon:v{version}:{request.url.path}?{query}'
+
+
+def not_modified(cached: CachedResponse) -> Response:
+    return Response(status_code=304, headers={'ETag': cached.etag, 'Cache-Control': 'no-cache'})
+
+
+def to_response(cached: CachedResponse) -> Response:
+    return Response(content=cached.body,
+                    media_type=cached.media_type,
+                    headers={**cached.headers, 'ETag': cached.etag, 'Cache-Control': 'no-cache'})
+
+
+def cached_route(cache: ResponseCache) -> type[APIRoute]:
+    """응답을 cache에 저장하고 ETag/If-None-Match로 304를 돌려주는 route 클래스"""
+
+    class CachedRoute(APIRoute):
+        def get_route_handler(self):
+            handler = super().get_route_handler()
+
+            async def cached_handler(request: Request) -> Response:
+                key = cache_key(request, await cache.version())
+                cached = await cache.get(key)
+                if cached is None:
+                    response = await handler(request)
+                    if response.status_code != 200 or not hasattr(response, 'body'):
+                        return response
+                    cached = CachedResponse(body=response.body,
+                                            etag=strong_etag(response.body),
+                                            media_type=response.media_type or 'application/json',
+                                            headers={name: value for name, value in response.headers.items()
+                                                     if name in CACHED_HEADERS})
+                    await cache.set(key, cached)
+                if etag_matches(request.headers.get('if-none-match'), cached.etag):
+                    cache.stats.not_modified += 1
+                    return not_modified(cached)
+                return to_response(cached)
+
+            return cached_handler
+
+    return CachedRoute
@@ -0,0 +1,239 @@
+import re
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from bs4 import BeautifulSoup
+
+
+class RoadRunParser(ABC):
+    """roadrun list.php / view.php 파서
+
+    백엔드마다 노드 탐색 방법만 다르고, 행을 해석하는 규칙은 모두 여기서 공유한다.
+    (기존 BeautifulSoup html.parser 구현과 같은 결과를 내야 함)
+    """
+    name: str
+
+    def parse_list(self, html: str) -> List[Dict]:
+        doc = self._parse_document(html)
+        list_rows = []
+        for row in self._schedule_rows(doc):
+            cols = self._descendants(row, 'td')
+            if len(cols) >= 4:
+                date_cell = self._find(cols[0], 'font', size="4")
+                title_cell = self._find(cols[1], 'a')
+
+                if date_cell is not None and title_cell is not None \
+                        and self._text(date_cell).strip() and self._text(title_cell).strip():
+                    if re.match(r'\d', self._text(date_cell).strip()):
+                        if list_row := self._parse_list_row(cols):
+                            list_rows.append(list_row)
+        return list_rows
+
+    def parse_detail(self, html: str) -> Tuple[Optional[str], Optional[str]]:
+        doc = self._parse_document(html)
+        registration_period = None
+        event_datetime = None
+
+        table = self._detail_table(doc)
+        if table is not None:
+            for row in self._descendants(table, 'tr'):
+                cols = self._descendants(row, 'td')
+                if len(cols) >= 2:
+                    label = self._text(cols[0]).strip()
+                    value = self._text(cols[1]).strip()
+
+                    if '접수기간' in label:
+                        registration_period = value
+                    elif '대회일시' in label:
+                        event_datetime = value
+
+        return registration_period, event_datetime
+
+    def _parse_list_row(self, cols: List[Any]) -> Optional[Dict]:
+        try:
+            date_font = self._find(cols[0], 'font', size="4")
+            date_cell = self._text(date_font) if date_font is not None else ""
+
+            day_font = self._find(cols[0], 'font', color="#959595")
+            day_of_week = self._text(day_font).strip('()') if day_font is not None else ""
+
+            title_link = self._find(cols[1], 'a')
+            title = self._text(title_link) if title_link is not None else ""
+            detail_url = self._attr(title_link, 'href') if title_link is not None else ""
+
+            course_font = self._find(cols[1], 'font', color="#990000")
+            courses = self._text(course_font).split(',') if course_font is not None else []
+            courses = [course.strip() for course in courses]
+
+            location = self._text(cols[2]).strip()
+
+            organizer_text = self._text(cols[3]).split('☎')
+            organizer = organizer_text[0].strip()
+            contact = organizer_text[1].strip().split()[0] if len(organizer_text) > 1 else ""
+
+            homepage = None
+            homepage_link = self._find(cols[3], 'a', href=True)
+            if homepage_link is not None:
+                homepage_img = self._find(homepage_link, 'img')
+                if homepage_img is not None and 'home.gif' in self._attr(homepage_img, 'src'):
+                    homepage = self._attr(homepage_link, 'href')
+
+            return {
+                'date': date_cell,
+                'day_of_week': day_of_week,
+                'title': title,
+                'courses': courses,
+                'location': location,
+                'organizer': organizer,
+                'contact': contact,
+                'homepage': homepage,
+                'detail_url': detail_url,
+            }
+        except Exception as e:
+            print(f"Error parsing marathon info: {str(e)}")
+            return None
+
+    @abstractmethod
+    def _parse_document(self, html: str) -> Any:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _schedule_rows(self, doc: Any) -> Iterable[Any]:
+        """일정 행 후보 (날짜 font가 있는 tr)"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def _detail_table(self, doc: Any) -> Any:
+        """상세 페이지의 첫 번째 table"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def _descendants(self, node: Any, tag: str) -> List[Any]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _find(self, node: Any, tag: str, **attrs) -> Any:
+        """attrs 값이 True이면 속성이 있기만 하면 됨"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def _text(self, node: Any) -> str:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _attr(self, node: Any, name: str) -> str:
+        """속성이 없으면 KeyError"""
+        raise NotImplementedError
+
+
+class SoupRoadRunParser(RoadRunParser):
+    """기존 크롤러와 같은 BeautifulSoup(html.parser) 기반 파서"""
+    name = 'html.parser'
+
+    def _parse_document(self, html: str):
+        return BeautifulSoup(html, 'html.parser')
+
+    def _schedule_rows(self, doc):
+        return doc.find_all('tr')
+
+    def _detail_table(self, doc):
+        return doc.find('table')
+
+    def _descendants(self, node, tag):
+        return node.find_all(tag)
+
+    def _find(self, node, tag, **attrs):
+        return node.find(tag, attrs=attrs)
+
+    def _text(self, node):
+        return node.text
+
+    def _attr(self, node, name):
+        return node[name]
+
+
+class LxmlRoadRunParser(RoadRunParser):
+    name = 'lxml'
+
+    def __init__(self):
+        try:
+            import lxml.html
+        except ImportError as e:
+            raise ImportError("lxml 파서를 사용하려면 lxml 패키지가 필요합니다.") from e
+        self._html = lxml.html
+
+    def _parse_document(self, html: str):
+        return self._html.document_fromstring(html)
+
+    def _schedule_rows(self, doc):
+        return doc.xpath("//tr[.//font[@size='4']]")
+
+    def _detail_table(self, doc):
+        return next(doc.iter('table'), None)
+
+    def _descendants(self, node, tag):
+        return [child for child in node.iter(tag) if child is not node]
+
+    def _find(self, node, tag, **attrs):
+        for child in node.iter(tag):
+            if child is node:
+                continue
+            if all((name in child.attrib) if value is True else child.attrib.get(name) == value
+                   for name, value in attrs.items()):
+                return child
+        return None
+
+    def _text(self, node):
+        return str(node.text_content())
+
+    def _attr(self, node, name):
+        return node.attrib[name]
+
+
+class SelectolaxRoadRunParser(RoadRunParser):
+    name = 'selectolax'
+
+    def __init__(self):
+        try:
+            from selectolax.lexbor import LexborHTMLParser
+        except ImportError as e:
+            raise ImportError("selectolax 파서를 사용하려면 selectolax 패키지가 필요합니다.") from e
+        self._html_parser = LexborHTMLParser
+
+    def _parse_document(self, html: str):
+        return self._html_parser(html)
+
+    def _schedule_rows(self, doc):
+        return [row for row in doc.css('tr') if row.css_first('font[size="4"]') is not None]
+
+    def _detail_table(self, doc):
+        return doc.css_first('table')
+
+    def _descendants(self, node, tag):
+        return node.css(tag)
+
+    def _find(self, node, tag, **attrs):
+        selector = tag + ''.join(f'[{name}]' if value is True else f'[{name}="{value}"]'
+                                 for name, value in attrs.items())
+        return node.css_first(selector)
+
+    def _text(self, node):
+        return node.text(deep=True)
+
+    def _attr(self, node, name):
+        value = node.attributes[name]
+        return value if value is not None else ''
+
+
+PARSERS = {
+    SoupRoadRunParser.name: SoupRoadRunParser,
+    LxmlRoadRunParser.name: LxmlRoadRunParser,
+    SelectolaxRoadRunParser.name: SelectolaxRoadRunParser,
+}
+
+
+def get_parser(engine: str = 'html.parser') -> RoadRunParser:
+    try:
+        return PARSERS[engine]()
+    except KeyError:
+        raise ValueError(f"지원하지 않는 파서입니다: {engine} (가능한 값: {', '.join(PARSERS)})")
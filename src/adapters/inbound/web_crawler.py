@@ -1,65 +1,259 @@
-from bs4 import BeautifulSoup
-import requests
+import hashlib
 import re
+import threading
+import time as time_module
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
 from datetime import datetime, time, timedelta
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, Iterator, List, Mapping, Optional, Tuple
+from urllib.parse import urljoin, urlparse
 
 from src.ports.inbound import WebCrawlerPort
+from src.adapters.inbound.http_cache import CachedHttpClient
+from src.adapters.inbound.roadrun_parser import RoadRunParser, get_parser
+from src.adapters.inbound.normalizer import MarathonBatchNormalizer, parse_korean_date, parse_start_time
+from src.adapters.inbound.resilience import Deadline, ResilientFetcher
+
+# 목록 페이지 날짜가 이번 주 시작보다 이 기간 안쪽으로 지났으면 올해 이미 끝난 대회, 더 지났으면 내년 대회로 봄
+LIST_DATE_LOOKBACK = timedelta(days=60)
+
+
+def parse_registration_period(value: str) -> Tuple[datetime, datetime]:
+    registration_start_date, registration_end_date = map(parse_korean_date, value.split('~'))
+    return registration_start_date, registration_end_date
+
 
 class BaseMarathonInfoFilter:
-    def filter(self, marathon_list: List[Dict]) -> List[Dict]:
-        return marathon_list
+    def pre_filter(self, row: Dict) -> bool:
+        """목록 페이지 정보(날짜, 요일, 코스)만으로 통과 가능성이 있는지 판단
+        False를 반환한 행은 상세 페이지를 요청하지 않음"""
+        return True
 
-class MarathonInfoWeeklyFilter(BaseMarathonInfoFilter):
     def filter(self, marathon: Dict) -> Dict | None:
-        today = datetime.now()
+        """상세 페이지 정보(접수기간, 대회일시)까지 채워진 마라톤을 최종 판단"""
+        return marathon
+
+class MarathonInfoWeeklyFilter(BaseMarathonInfoFilter):
+    """이번 주에 열리는 마라톤 또는 오늘 접수 중인 마라톤만 통과"""
+
+    def __init__(self, today: datetime | None = None):
+        self._today = today
+
+    @property
+    def today(self) -> datetime:
+        return self._today or datetime.now()
+
+    def _week_range(self) -> Tuple[datetime, datetime]:
+        today = self.today
         week_start = today - timedelta(days=today.weekday())
         week_start = week_start.replace(hour=0, minute=0, second=0, microsecond=0)
     
         week_end = week_start + timedelta(days=6)
         week_end = week_end.replace(hour=23, minute=59, second=59, microsecond=999999)
+        return week_start, week_end
+
+    def pre_filter(self, row: Dict) -> bool:
+        # 접수는 대회 전에 끝나므로, 이번 주 이전에 끝난 대회는 어느 조건도 만족할 수 없음
+        race_day = self._infer_list_date(row.get('date', ''))
+        if race_day is None:
+            return True
+        week_start, _ = self._week_range()
+        return race_day >= week_start
+
+    def filter(self, marathon: Dict) -> Dict | None:
+        try:
+            race_date = marathon.get('race_date') or \
+                parse_korean_date(marathon['event_datetime'].split('출발시간:')[0])
+            if 'registration_start_date' in marathon:
+                registration_start_date = marathon['registration_start_date']
+                registration_end_date = marathon['registration_end_date']
+            else:
+                registration_start_date, registration_end_date = \
+                    parse_registration_period(marathon['registration_period'])
+        except (AttributeError, KeyError, TypeError, ValueError) as e:
+            print(f"Error filtering marathon info: {str(e)}")
+            return
 
-        if week_start <= marathon['race_date'] <= week_end:
+        today = self.today
+        week_start, week_end = self._week_range()
+
+        if week_start <= race_date <= week_end:
             return marathon
-        elif marathon['registration_start_date'] <= today and marathon['registration_end_date'] >= today:
+        elif registration_start_date <= today and registration_end_date >= today:
             return marathon
 
         return
 
+    def _infer_list_date(self, date_cell: str) -> Optional[datetime]:
+        """목록 페이지의 '12/8' 형식 날짜에 연도를 붙임
+
+        올해보다 이전 연도로는 추정하지 않는다. 올해 날짜가 이번 주 시작 전 LIST_DATE_LOOKBACK 이내면
+        최근에 끝난 대회로 보고, 그보다 더 지났으면 내년 대회로 본다 (몇 달 뒤 대회를 지난 대회로 걸러내지 않도록).
+        """
+        match = re.match(r'\s*(\d{1,2})/(\d{1,2})', date_cell)
+        if not match:
+            return None
+        month, day = int(match.group(1)), int(match.group(2))
+        week_start, _ = self._week_range()
+        for year in (self.today.year, self.today.year + 1):
+            try:
+                candidate = datetime(year, month, day)
+            except ValueError:
+                continue
+            if candidate >= week_start - LIST_DATE_LOOKBACK:
+                return candidate
+        return None
+
+ROADRUN_SCHEDULE_URL = "http://www.roadrun.co.kr/schedule/"
+
+# 상세 페이지 없이 목록 페이지에서 알 수 있는 필드 (변경 여부 판단에 사용)
+LIST_ROW_FIELDS = ('date', 'day_of_week', 'title', 'courses', 'location', 'organizer', 'contact', 'homepage')
+
+
+@dataclass
+class CrawlStats:
+    rows_seen: int = 0
+    detail_fetches: int = 0
+    skipped_known: int = 0
+    prefiltered: int = 0
+    deadline_exceeded: bool = False
+    # 상세 페이지를 가져오지 못해 결과에서 빠진 행 ({roadrun_no, title, reason})
+    skipped: List[Dict] = field(default_factory=list)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def record(self, **counts: int):
+        with self._lock:
+            for name, value in counts.items():
+                setattr(self, name, getattr(self, name) + value)
+
+    @property
+    def fetches_avoided(self) -> int:
+        return self.skipped_known + self.prefiltered
+
+
+class PerHostLimiter:
+    """호스트별 동시 요청 수와 요청 간 최소 간격을 제한"""
+
+    def __init__(self, max_concurrent: int = 2, min_interval: float = 0.0):
+        self.max_concurrent = max_concurrent
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._semaphores: Dict[str, threading.Semaphore] = {}
+        self._next_slot: Dict[str, float] = {}
+
+    def _semaphore(self, host: str) -> threading.Semaphore:
+        with self._lock:
+            if host not in self._semaphores:
+                self._semaphores[host] = threading.Semaphore(self.max_concurrent)
+            return self._semaphores[host]
+
+    def _wait_for_slot(self, host: str):
+        if self.min_interval <= 0:
+            return
+        with self._lock:
+            now = time_module.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self.min_interval
+        if slot > now:
+            time_module.sleep(slot - now)
+
+    def run(self, url: str, func: Callable, *args, **kwargs):
+        host = urlparse(url).netloc
+        with self._semaphore(host):
+            self._wait_for_slot(host)
+            return func(*args, **kwargs)
+
+
 class RoadRunWebCrawler(WebCrawlerPort):
 
-    def __init__(self, marathon_filter: BaseMarathonInfoFilter):
+    def __init__(self,
+                 marathon_filter: BaseMarathonInfoFilter,
+                 max_workers: int = 1,
+                 per_host_limit: int = 2,
+                 min_request_interval: float = 0.0,
+                 http_client: CachedHttpClient | None = None,
+                 known_rows: Mapping[int, str] | None = None,
+                 parser: RoadRunParser | str = 'html.parser',
+                 base_url: str = ROADRUN_SCHEDULE_URL,
+                 fetcher: ResilientFetcher | None = None,
+                 deadline_seconds: float | None = None,
+                 clock: Callable[[], float] = time_module.monotonic):
+        """
+        max_workers: 상세 페이지 동시 요청 수 (1이면 순차 크롤링)
+        per_host_limit: 한 호스트에 동시에 보낼 수 있는 최대 요청 수
+        min_request_interval: 같은 호스트에 대한 요청 시작 간 최소 간격(초)
+        http_client: 요청에 사용할 클라이언트 (없으면 캐시 없는 keep-alive 세션)
+        known_rows: 이미 저장된 마라톤의 {roadrun 번호: 목록 행 해시}
+                    목록 행이 바뀌지 않은 마라톤은 상세 페이지를 요청하지 않음
+        parser: HTML 파서 백엔드 ('html.parser', 'lxml', 'selectolax') 또는 파서 객체
+        base_url: view.php 상세 페이지 기준 URL
+        fetcher: 요청 timeout, 재시도, 서킷 브레이커 설정 (없으면 기본값)
+        deadline_seconds: 크롤링 한 번에 쓸 수 있는 전체 시간(초)
+                          넘으면 남은 행은 건너뛰고 stats.skipped에 기록한 뒤 부분 결과를 반환
+        clock: 시간 예산을 재는 시계 (테스트에서 가짜 시계를 넣을 때 사용)
+        """
         self.marathon_filter = marathon_filter
+        self.max_workers = max(1, max_workers)
+        self.host_limiter = PerHostLimiter(per_host_limit, min_request_interval)
+        self.http_client = http_client or CachedHttpClient(pool_maxsize=max(per_host_limit, self.max_workers))
+        self.known_rows = dict(known_rows or {})
+        self.stats = CrawlStats()
+        self.parser = get_parser(parser) if isinstance(parser, str) else parser
+        self.base_url = base_url
+        self.normalizer = MarathonBatchNormalizer()
+        self.fetcher = fetcher or ResilientFetcher()
+        self.deadline_seconds = deadline_seconds
+        self.clock = clock
+        self._deadline = Deadline(None, clock)
 
     def crawl(self, url: str) -> List[Dict]:
         try:
-            response = requests.get(url)
-            response.encoding = 'euc-kr'
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            marathon_list = []
-            rows = soup.find_all('tr')
-            
-            for row in rows:
-                cols = row.find_all('td')
-                if len(cols) >= 4:
-                    date_cell = cols[0].find('font', size="4")
-                    title_cell = cols[1].find('a')
-                    
-                    if date_cell and title_cell and date_cell.text.strip() and title_cell.text.strip():
-                        if re.match(r'\d', date_cell.text.strip()):
-                            marathon_info = self._parse_marathon_info(cols)
-                            filtered_marathon_info = self.marathon_filter.filter(marathon_info)
-                            if filtered_marathon_info:
-                                marathon_list.append(filtered_marathon_info)
-                                
-            
-            return marathon_list
-            
+            return list(self.iter_crawl(url))
         except Exception as e:
             print(f"Error crawling marathon schedule: {str(e)}")
             return []
 
+    def iter_crawl(self, url: str) -> Iterator[Dict]:
+        """상세 정보가 채워지는 대로 목록 순서에 맞춰 마라톤을 하나씩 내보냄"""
+        self._deadline = Deadline(self.deadline_seconds, self.clock)
+        html = self._fetch(url)
+
+        list_rows = [self._add_row_identity(row) for row in self.parser.parse_list(html)]
+        self.stats.rows_seen += len(list_rows)
+
+        candidate_rows = [row for row in list_rows if self.marathon_filter.pre_filter(row)]
+        self.stats.prefiltered += len(list_rows) - len(candidate_rows)
+
+        new_rows = [row for row in candidate_rows if not self._is_known(row)]
+        self.stats.skipped_known += len(candidate_rows) - len(new_rows)
+
+        for marathon_info in self._map_rows(self._add_detail_info, new_rows):
+            if marathon_info is None:
+                continue
+            filtered_marathon_info = self.marathon_filter.filter(marathon_info)
+            if filtered_marathon_info:
+                yield filtered_marathon_info
+
+    def _map_rows(self, func: Callable, rows: List) -> Iterator:
+        """행마다 func를 적용하고, 동시 크롤링 시에도 입력 순서대로 결과를 돌려줌"""
+        if self.max_workers == 1 or len(rows) <= 1:
+            yield from map(func, rows)
+            return
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            yield from executor.map(func, rows)
+
+    def _fetch(self, url: str, count_as: str | None = None) -> str:
+        """count_as: 요청을 실제로 보냈을 때 한 번 올릴 CrawlStats 항목 (재시도는 한 번으로 셈)"""
+        counted = False
+
+        def attempt(timeout: float) -> str:
+            nonlocal counted
+            if count_as and not counted:
+                counted = True
+                self.stats.record(**{count_as: 1})
+            return self.host_limiter.run(url, self.http_client.get_text, url, encoding='euc-kr', timeout=timeout)
+        return self.fetcher.fetch(url, attempt, self._deadline)
+
     def preprocess_data(self, marathon: Dict) -> Dict:
         marathon_info = {}
         for key, value in marathon.items():
@@ -73,134 +267,75 @@ class RoadRunWebCrawler(WebCrawlerPort):
                 marathon_info['courses'] = value
             elif key == 'organizer':
                 marathon_info['organization_name'] = value
+            elif key in ('roadrun_no', 'list_row_hash'):
+                marathon_info[key] = value
             elif key == 'registration_period':
-                registration_start_date, registration_end_date = map(
-                    lambda x: datetime.strptime(x.strip(), '%Y년%m월%d일'),
-                    value.split('~')
-                )
+                registration_start_date, registration_end_date = parse_registration_period(value)
                 marathon_info['registration_start_date'] = registration_start_date
                 marathon_info['registration_end_date'] = registration_end_date
             elif key == 'event_datetime':
                 date, start_time = value.split(' 출발시간:')
-                date = datetime.strptime(date.strip(), '%Y년%m월%d일')
+                date = parse_korean_date(date)
                 start_time = self._parse_race_time(start_time)
                 race_time = datetime.combine(date, start_time)
                 marathon_info['race_date'] = race_time
         return marathon_info
 
-    def _parse_marathon_info(self, cols: List) -> Optional[Dict]:
+    def preprocess_batch(self, marathon_list: List[Dict]) -> Tuple[List[Dict], List[Dict]]:
+        result = self.normalizer.normalize(marathon_list)
+        return result.records, [asdict(error) for error in result.errors]
+
+    def _is_known(self, row: Dict) -> bool:
+        roadrun_no = row.get('roadrun_no')
+        return roadrun_no is not None and self.known_rows.get(roadrun_no) == row['list_row_hash']
+
+    def _add_detail_info(self, row: Dict) -> Dict | None:
+        if self._deadline.expired:
+            self._skip(row, 'deadline exceeded')
+            return None
         try:
-            date_font = cols[0].find('font', size="4")
-            date_cell = date_font.text if date_font else ""
-            
-            day_font = cols[0].find('font', color="#959595")
-            day_of_week = day_font.text.strip('()') if day_font else ""
-            
-            title_link = cols[1].find('a')
-            title = title_link.text if title_link else ""
-            detail_url = title_link['href'] if title_link else ""
-            
-            course_font = cols[1].find('font', color="#990000")
-            courses = course_font.text.split(',') if course_font else []
-            courses = [course.strip() for course in courses]
-            
-            location = cols[2].text.strip() if cols[2] else ""
-            
-            organizer_text = cols[3].text.split('☎') if cols[3] else ["", ""]
-            organizer = organizer_text[0].strip()
-            contact = organizer_text[1].strip().split()[0] if len(organizer_text) > 1 else ""
-            
-            homepage = None
-            homepage_link = cols[3].find('a', href=True)
-            if homepage_link and homepage_link.find('img') and 'home.gif' in homepage_link.find('img')['src']:
-                homepage = homepage_link['href']
-            
-            registration_period, event_datetime = self._get_detail_info(detail_url)
-            
-            return {
-                'date': date_cell,
-                'day_of_week': day_of_week,
-                'title': title,
-                'courses': courses,
-                'location': location,
-                'organizer': organizer,
-                'contact': contact,
-                'homepage': homepage,
-                'detail_url': detail_url,
-                'registration_period': registration_period,
-                'event_datetime': event_datetime
-            }
+            registration_period, event_datetime = self._get_detail_info(row['detail_url'])
         except Exception as e:
-            print(f"Error parsing marathon info: {str(e)}")
+            print(f"Error fetching detail info: {str(e)}")
+            self._skip(row, f"{type(e).__name__}: {str(e)}")
             return None
+        return {**row, 'registration_period': registration_period, 'event_datetime': event_datetime}
+
+    def _skip(self, row: Dict, reason: str):
+        if self._deadline.expired:
+            self.stats.deadline_exceeded = True
+        self.stats.skipped.append(dict(roadrun_no=row.get('roadrun_no'), title=row.get('title'), reason=reason))
+
+    def _add_row_identity(self, row: Dict) -> Dict:
+        row['roadrun_no'] = self._extract_view_no(row['detail_url'])
+        row['list_row_hash'] = self._list_row_hash(row)
+        return row
 
     def _get_detail_info(self, detail_url: str) -> Tuple[Optional[str], Optional[str]]:
-        try:
-            real_url = self._convert_js_url_to_real_url(detail_url)
-            if not real_url:
-                return None, None
-            
-            response = requests.get(real_url)
-            response.encoding = 'euc-kr'
-            html_content = response.text.encode('utf-8', errors='ignore').decode('utf-8')
-            soup = BeautifulSoup(html_content, 'html.parser')
-            
-            registration_period = None
-            event_datetime = None
-            
-            table = soup.find('table')
-            if table:
-                for row in table.find_all('tr'):
-                    cols = row.find_all('td')
-                    if len(cols) >= 2:
-                        label = cols[0].text.strip()
-                        value = cols[1].text.strip()
-                        
-                        if '접수기간' in label:
-                            registration_period = value
-                        elif '대회일시' in label:
-                            event_datetime = value
-            
-            return registration_period, event_datetime
-        except Exception as e:
-            print(f"Error fetching detail info: {str(e)}")
+        real_url = self._convert_js_url_to_real_url(detail_url)
+        if not real_url:
             return None, None
+        
+        return self.parser.parse_detail(self._fetch(real_url, count_as='detail_fetches'))
 
     def _convert_js_url_to_real_url(self, js_url: str) -> Optional[str]:
         match = re.search(r"'(view\.php\?no=\d+)'", js_url)
         if match:
-            return f"http://www.roadrun.co.kr/schedule/{match.group(1)}"
+            return urljoin(self.base_url, match.group(1))
         return None
 
+    def _extract_view_no(self, js_url: str) -> Optional[int]:
+        match = re.search(r"'view\.php\?no=(\d+)'", js_url)
+        return int(match.group(1)) if match else None
+
+    @staticmethod
+    def _list_row_hash(row: Dict) -> str:
+        fingerprint = '\x1f'.join(str(row.get(field)) for field in LIST_ROW_FIELDS)
+        return hashlib.sha1(fingerprint.encode('utf-8')).hexdigest()
+
     def _parse_race_time(self, time_str: str) -> time:
-        time_str = time_str.replace("출발시간:", "").replace("출발", "").replace(';', ':').strip()
         try:
-            if time_str.isdigit():
-                if len(time_str) == 4:
-                    hour = int(time_str[:2])
-                    minute = int(time_str[2:])
-                    return time(hour, minute)
-                else:
-                    hour = int(time_str)
-                    return time(hour, 0)
-            if ':' in time_str:
-                hour, minute = map(int, re.findall(r'\d+', time_str)[:2])
-                if hour == 24:
-                    hour = 0
-                return time(hour, minute)
-            
-            hour_match = re.search(r'(\d+)시', time_str)
-            hour = int(hour_match.group(1))
-
-            minute_match = re.search(r'(\d+)분', time_str)
-            minute = int(minute_match.group(1)) if minute_match else 0
-
-            is_pm = '오후' in time_str
-            if is_pm and hour != 12:
-                hour += 12
-
-            return time(hour, minute)
-
-        except Exception as e:
-            print(f'시간 파싱 에러: {str(e)}, 입력값: {time_str}')
-            return time(0, 0) 
\ No newline at end of file
+            return parse_start_time(time_str)
+        except ValueError as e:
+            print(f'시간 파싱 에러: {str(e)}')
+            return time(0, 0)
@@ -0,0 +1,70 @@
+import threading
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from src.infrastructure.models import Course
+
+
+class CourseCache:
+    """거리 → Course id 캐시 (여러 UoW가 함께 사용)
+
+    course 테이블은 수십 행 이하이므로 처음 사용할 때 전체를 읽어 두고,
+    캐시에 없는 거리만 DB를 다시 확인한 뒤 한 번에 추가한다.
+    새로 추가한 코스는 트랜잭션이 커밋된 뒤에 add()로 캐시에 반영한다 (롤백되면 버림).
+    """
+
+    def __init__(self):
+        self._ids: dict[float, int] | None = None
+        self._lock = threading.Lock()
+        self.loads = 0
+
+    @property
+    def loaded(self) -> bool:
+        return self._ids is not None
+
+    def refresh(self, session: Session):
+        """DB의 코스 목록으로 캐시를 다시 채움"""
+        ids = {}
+        for course_id, distance in session.execute(select(Course.id, Course.distance).order_by(Course.id)):
+            ids.setdefault(distance, course_id)
+        with self._lock:
+            self._ids = ids
+            self.loads += 1
+
+    def clear(self):
+        with self._lock:
+            self._ids = None
+
+    def get_ids(self, session: Session, distances: set[float]) -> dict[float, int]:
+        """캐시에 있는 거리의 id (캐시가 비어 있으면 먼저 전체를 읽음)"""
+        if self._ids is None:
+            self.refresh(session)
+        with self._lock:
+            return {distance: self._ids[distance] for distance in distances if distance in self._ids}
+
+    def create_missing(self, session: Session, courses: dict[float, str]) -> tuple[dict[float, int], dict[float, int]]:
+        """캐시에 없는 거리의 코스를 DB에서 다시 찾고, 그래도 없으면 한 번에 추가
+
+        (DB에 있던 코스 id, 새로 추가한 코스 id)를 반환한다. 새로 추가한 코스는 아직 커밋 전이므로
+        캐시에 넣지 않는다.
+        """
+        found = {}
+        for course_id, distance in session.execute(
+                select(Course.id, Course.distance).where(Course.distance.in_(courses)).order_by(Course.id)):
+            found.setdefault(distance, course_id)
+        if found:
+            self.add(found)
+
+        new_courses = {distance: Course(distance=distance, name=name)
+                       for distance, name in courses.items() if distance not in found}
+        if new_courses:
+            session.add_all(new_courses.values())
+            session.flush()
+        return found, {distance: course.id for distance, course in new_courses.items()}
+
+    def add(self, ids: dict[float, int]):
+        with self._lock:
+            if self._ids is not None:
+                for distance, course_id in ids.items():
+                    self._ids.setdefault(distance, course_id)
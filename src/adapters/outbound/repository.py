@@ -1,8 +1,187 @@
-from src.infrastructure.models import MarathonInfoDB, Course, RecipientDB
-from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from src.infrastructure.models import DataVersionDB, MarathonDigestDB, MarathonInfoDB, Course, RecipientDB, marathon_course_association
+from sqlalchemy.orm import Query, Session, selectinload
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import Row, and_, column, delete, func, insert, literal_column, select, table, tuple_, update
+from sqlalchemy.dialects import postgresql, sqlite
+import re
 from datetime import datetime
-from src.domain.repository import AbstractRepository
+from typing import Iterator
+from src.domain.repository import AbstractReadRepository, AbstractRepository
+from src.domain.models import Course as CourseInfo, MarathonInfo, Region
+from src.domain.region import classify_region, parse_region
+from src.application.pagination import Keyset
+from src.adapters.outbound.course_cache import CourseCache
+
+# INSERT ... ON CONFLICT를 지원하는 dialect별 insert 구문
+UPSERT_INSERTS = {
+    'postgresql': postgresql.insert,
+    'sqlite': sqlite.insert,
+}
+
+# 일괄 저장 시 marathon_info에 기록하는 컬럼
+MARATHON_COLUMNS = (
+    'title',
+    'race_date',
+    'location',
+    'region',
+    'homepage',
+    'organization_name',
+    'registration_start_date',
+    'registration_end_date',
+    'roadrun_no',
+    'list_row_hash',
+)
+
+# projection 조회에서 MarathonInfo를 만드는 컬럼
+MARATHON_INFO_COLUMNS = (
+    MarathonInfoDB.id,
+    MarathonInfoDB.title,
+    MarathonInfoDB.race_date,
+    MarathonInfoDB.location,
+    MarathonInfoDB.region,
+    MarathonInfoDB.homepage,
+    MarathonInfoDB.organization_name,
+    MarathonInfoDB.registration_start_date,
+    MarathonInfoDB.registration_end_date,
+)
+# fields를 지정해도 항상 조회하는 컬럼 (정렬과 다음 페이지 cursor에 사용)
+KEYSET_FIELDS = ('id', 'race_date')
+# 코스를 한 번에 조회할 마라톤 id 개수 (selectinload와 같은 크기)
+COURSE_LOAD_CHUNK_SIZE = 500
+
+
+# 아래 조회 조건/구문은 동기 저장소와 비동기 저장소(async_repository)가 같이 사용
+
+def region_values(region: Region | str | list[Region | str]) -> list[str]:
+    regions = region if isinstance(region, (list, tuple, set)) else [region]
+    return [parse_region(value).value for value in regions]
+
+
+def has_course(distance: int):
+    # 조인 + DISTINCT 대신 IN 서브쿼리로 걸러서 (race_date, id) 정렬/limit을 그대로 사용
+    return MarathonInfoDB.id.in_(
+        select(marathon_course_association.c.marathon_id)
+        .join(Course, Course.id == marathon_course_association.c.course_id)
+        .where(Course.distance == distance)
+    )
+
+
+def registration_open(check_date: datetime):
+    return and_(MarathonInfoDB.registration_start_date <= check_date,
+                MarathonInfoDB.registration_end_date >= check_date)
+
+
+def marathon_conditions(registration_status: bool,
+                        region: Region | str | list[Region | str],
+                        course: int,
+                        race_search_start_date: datetime,
+                        race_search_end_date: datetime) -> list:
+    conditions = []
+    if registration_status:
+        conditions.append(registration_open(datetime.now()))
+    if course is not None:
+        conditions.append(has_course(course))
+    if region:
+        conditions.append(MarathonInfoDB.region.in_(region_values(region)))
+    if race_search_start_date is not None and race_search_end_date is not None:
+        conditions.append(and_(MarathonInfoDB.race_date >= race_search_start_date,
+                               MarathonInfoDB.race_date <= race_search_end_date))
+    return conditions
+
+
+def paginate(query, limit: int | None, after: Keyset | None):
+    """limit/after가 있으면 (race_date, id) 순서로 after 다음부터 limit개 (Query, Select 모두 가능)"""
+    if limit is not None or after is not None:
+        query = query.order_by(MarathonInfoDB.race_date, MarathonInfoDB.id)
+    if after is not None:
+        query = query.filter(tuple_(MarathonInfoDB.race_date, MarathonInfoDB.id) > tuple_(*after))
+    if limit is not None:
+        query = query.limit(limit)
+    return query
+
+
+def courses_statement(marathon_ids: list[int]):
+    return select(marathon_course_association.c.marathon_id, Course.distance, Course.name, Course.description)\
+        .join(Course, Course.id == marathon_course_association.c.course_id)\
+        .where(marathon_course_association.c.marathon_id.in_(marathon_ids))\
+        .order_by(marathon_course_association.c.marathon_id, Course.distance)
+
+
+# 검색 index (migration 8): Postgres는 search_vector 컬럼(GIN), SQLite는 FTS5 테이블
+SEARCH_VECTOR = literal_column('marathon_info.search_vector')
+SEARCH_FTS_TABLE = table('marathon_info_fts', column('rowid'))
+# 대회명 > 장소 > 주최 순서로 가중치 (SQLite bm25, Postgres는 setweight A/B/C)
+SEARCH_FTS_WEIGHTS = (10.0, 5.0, 1.0)
+SEARCH_TOKEN_PATTERN = re.compile(r'\w+')
+
+
+def search_terms(q: str) -> list[str]:
+    """검색어를 단어로 나눔 (index 질의 문법에 쓰이는 기호는 버림)"""
+    terms = SEARCH_TOKEN_PATTERN.findall(q or '')
+    if not terms:
+        raise ValueError(f"검색어가 비어 있습니다: {q!r}")
+    return terms
+
+
+def marathon_info_columns(fields: tuple[str, ...] | None) -> tuple:
+    """fields에 있는 컬럼만 조회 (None이면 전체, courses는 코스 테이블에서 따로 조회)"""
+    if fields is None:
+        return MARATHON_INFO_COLUMNS
+    return tuple(column for column in MARATHON_INFO_COLUMNS if column.key in KEYSET_FIELDS or column.key in fields)
+
+
+def loads_courses(fields: tuple[str, ...] | None) -> bool:
+    return fields is None or 'courses' in fields
+
+
+def search_statement(dialect: str, terms: list[str], limit: int, fields: tuple[str, ...] | None = None):
+    """모든 단어로 시작하는 단어가 있는 마라톤을 관련도 순으로 조회 ('춘천' → '춘천시', '춘천마라톤')"""
+    statement = select(*marathon_info_columns(fields))
+    if dialect == 'postgresql':
+        query = func.to_tsquery(literal_column("'simple'::regconfig"), ' & '.join(f"{term}:*" for term in terms))
+        statement = statement.where(SEARCH_VECTOR.op('@@')(query))\
+            .order_by(func.ts_rank(SEARCH_VECTOR, query).desc())
+    elif dialect == 'sqlite':
+        fts = literal_column(SEARCH_FTS_TABLE.name)
+        statement = statement.join(SEARCH_FTS_TABLE, SEARCH_FTS_TABLE.c.rowid == MarathonInfoDB.id)\
+            .where(fts.op('MATCH')(' '.join(f'"{term}"*' for term in terms)))\
+            .order_by(func.bm25(fts, *SEARCH_FTS_WEIGHTS))
+    else:
+        raise NotImplementedError(f"{dialect}는 마라톤 검색을 지원하지 않습니다.")
+    return statement.order_by(MarathonInfoDB.race_date, MarathonInfoDB.id).limit(limit)
+
+
+def to_marathon_info(row, courses: list[CourseInfo]) -> MarathonInfo:
+    return MarathonInfo(
+        id=row.id,
+        title=row.title,
+        race_date=row.race_date,
+        location=row.location,
+        region=row.region,
+        courses=courses,
+        homepage=row.homepage,
+        organization_name=row.organization_name,
+        registration_start_date=row.registration_start_date,
+        registration_end_date=row.registration_end_date,
+    )
+
+
+def to_partial_marathon_info(row, courses: list[CourseInfo] | None) -> MarathonInfo:
+    """조회한 컬럼만 채운 MarathonInfo (fields로 고른 필드만 응답할 때 사용, 검증 없이 생성)"""
+    values = row._asdict()
+    if values.get('region') is not None:
+        values['region'] = Region(values['region'])
+    if courses is not None:
+        values['courses'] = courses
+    return MarathonInfo.model_construct(**values)
+
+
+def to_marathon_infos(rows: list, courses: dict[int, list[CourseInfo]],
+                      fields: tuple[str, ...] | None) -> list[MarathonInfo]:
+    if fields is None:
+        return [to_marathon_info(row, courses.get(row.id, [])) for row in rows]
+    with_courses = loads_courses(fields)
+    return [to_partial_marathon_info(row, courses.get(row.id, []) if with_courses else None) for row in rows]
 
 class RecipientRepository(AbstractRepository):
     def __init__(self, db: Session):
@@ -14,19 +193,42 @@ class RecipientRepository(AbstractRepository):
     def get_all(self):
         return self.db.query(RecipientDB).all()
 
+    def get_phone_index(self) -> dict[str, tuple[int, str]]:
+        """전화번호 → (id, 이름)"""
+        rows = self.db.execute(select(RecipientDB.phone_number, RecipientDB.id, RecipientDB.name))
+        return {phone_number: (recipient_id, name) for phone_number, recipient_id, name in rows}
+
+    def bulk_insert(self, recipients: list[dict]):
+        if recipients:
+            self.db.execute(insert(RecipientDB), recipients)
+
+    def bulk_update(self, recipients: list[dict]):
+        """id를 포함한 dict 목록으로 기본키 기준 일괄 갱신"""
+        if recipients:
+            self.db.execute(update(RecipientDB), recipients)
+
+    def delete_by_ids(self, recipient_ids: list[int]):
+        if recipient_ids:
+            self.db.execute(delete(RecipientDB).where(RecipientDB.id.in_(recipient_ids)))
+
 class MarathonRepository(AbstractRepository):
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, course_cache: CourseCache | None = None):
         self.db = db
+        self.course_cache = course_cache or CourseCache()
+        # 이 세션에서 새로 추가한 코스 (커밋 후 UoW가 course_cache에 반영)
+        self.pending_course_ids: dict[float, int] = {}
 
     def save(self, 
             title: str,
             race_date: datetime,
             location: str,
-            homepage: str,
+            homepage: str | None,
             courses: list[Course],
             organization_name: str,
             registration_start_date: datetime,
-            registration_end_date: datetime):
+            registration_end_date: datetime,
+            roadrun_no: int | None = None,
+            list_row_hash: str | None = None):
         register_courses = []
         for course_name in courses:
             if course := self.create_or_get_course(course_name):
@@ -40,78 +242,370 @@ class MarathonRepository(AbstractRepository):
             courses=register_courses,
             organization_name=organization_name,
             registration_start_date=registration_start_date,
-            registration_end_date=registration_end_date
+            registration_end_date=registration_end_date,
+            roadrun_no=roadrun_no,
+            list_row_hash=list_row_hash,
         )
 
         self.db.add(marathon_info)
 
-    def get_by_title_race_date(self, title: str, race_date: datetime):
-        return self.db.query(MarathonInfoDB).filter(and_(MarathonInfoDB.title == title,
-                                                        MarathonInfoDB.race_date == race_date)).first()
+    def bulk_upsert(self, marathons: list[dict]) -> int:
+        """마라톤 목록을 INSERT ... ON CONFLICT (title, race_date) 한 번으로 저장하고, 저장/갱신한 수를 반환
 
-    def create_or_get_course(self, course: str) -> Course:
-        if result := Course.normalize_course_name(course):
-            distance, name = result
-        else:
+        이미 있는 마라톤은 list_row_hash가 바뀐 경우에만 갱신한다.
+        roadrun 번호로 이미 저장된 마라톤은 제목/날짜가 바뀌었어도 같은 행을 갱신한다.
+        커밋은 하지 않으므로 호출한 쪽(UoW)에서 배치마다 한 번 커밋한다.
+        """
+        # 같은 배치 안의 중복은 먼저 나온 값을 사용 (한 문장에서 같은 행을 두 번 갱신할 수 없음)
+        rows_by_key = {}
+        for marathon in marathons:
+            rows_by_key.setdefault((marathon['title'], marathon['race_date']), marathon)
+        if not rows_by_key:
+            return 0
+
+        written_ids = self._update_by_roadrun_no(rows_by_key)
+        if rows_by_key:
+            written_ids.update(self._upsert_by_title_race_date(rows_by_key))
+
+        self._replace_courses({marathon_id: marathon.get('courses') or []
+                               for marathon_id, marathon in written_ids.items()})
+        return len(written_ids)
+
+    def _update_by_roadrun_no(self, rows_by_key: dict[tuple, dict]) -> dict[int, dict]:
+        """roadrun 번호는 같은데 제목/날짜가 바뀐 마라톤을 기본키로 일괄 갱신 (갱신한 행은 rows_by_key에서 제거)"""
+        by_roadrun_no = {marathon['roadrun_no']: key for key, marathon in rows_by_key.items()
+                         if marathon.get('roadrun_no') is not None}
+        if not by_roadrun_no:
+            return {}
+
+        existing = self.db.execute(
+            select(MarathonInfoDB.id, MarathonInfoDB.roadrun_no, MarathonInfoDB.title,
+                   MarathonInfoDB.race_date, MarathonInfoDB.list_row_hash)
+            .where(MarathonInfoDB.roadrun_no.in_(by_roadrun_no))
+        ).all()
+
+        updates = {}
+        for marathon_id, roadrun_no, title, race_date, list_row_hash in existing:
+            key = by_roadrun_no[roadrun_no]
+            if key == (title, race_date):
+                # 같은 제목/날짜는 ON CONFLICT 쪽에서 처리
+                continue
+            marathon = rows_by_key.pop(key)
+            if marathon.get('list_row_hash') and marathon['list_row_hash'] != list_row_hash:
+                updates[marathon_id] = marathon
+
+        # 바뀐 제목/날짜의 행이 이미 있으면 그 행에 합치고(ON CONFLICT) 예전 행은 삭제
+        merged_ids = self._merge_renamed_into_existing(updates, rows_by_key)
+        if merged_ids:
+            self.db.execute(delete(marathon_course_association)
+                            .where(marathon_course_association.c.marathon_id.in_(merged_ids)))
+            self.db.execute(delete(MarathonInfoDB).where(MarathonInfoDB.id.in_(merged_ids)))
+
+        if updates:
+            self.db.execute(update(MarathonInfoDB), [
+                {'id': marathon_id, **self._marathon_row(marathon)}
+                for marathon_id, marathon in updates.items()
+            ])
+        return updates
+
+    def _merge_renamed_into_existing(self, updates: dict[int, dict], rows_by_key: dict[tuple, dict]) -> list[int]:
+        """제목/날짜를 바꾸면 unique (title, race_date)가 겹치는 행을 updates에서 rows_by_key로 옮기고 그 id를 반환"""
+        if not updates:
+            return []
+        keys = {(marathon['title'], marathon['race_date']): marathon_id for marathon_id, marathon in updates.items()}
+        taken = self.db.execute(
+            select(MarathonInfoDB.id, MarathonInfoDB.title, MarathonInfoDB.race_date)
+            .where(MarathonInfoDB.title.in_({title for title, _ in keys}))
+        ).all()
+
+        merged_ids = []
+        for existing_id, title, race_date in taken:
+            marathon_id = keys.get((title, race_date))
+            if marathon_id is not None and marathon_id != existing_id and marathon_id in updates:
+                rows_by_key[(title, race_date)] = updates.pop(marathon_id)
+                merged_ids.append(marathon_id)
+        return merged_ids
+
+    def _upsert_by_title_race_date(self, rows_by_key: dict[tuple, dict]) -> dict[int, dict]:
+        dialect = self.db.get_bind().dialect.name
+        if dialect not in UPSERT_INSERTS:
+            raise NotImplementedError(f"{dialect}는 일괄 저장(ON CONFLICT)을 지원하지 않습니다.")
+
+        table = MarathonInfoDB.__table__
+        statement = UPSERT_INSERTS[dialect](table).values(
+            [self._marathon_row(marathon) for marathon in rows_by_key.values()]
+        )
+        excluded = statement.excluded
+        statement = statement.on_conflict_do_update(
+            index_elements=[table.c.title, table.c.race_date],
+            set_={column: excluded[column] for column in MARATHON_COLUMNS if column not in ('title', 'race_date')},
+            where=and_(excluded.list_row_hash.isnot(None),
+                       table.c.list_row_hash.is_distinct_from(excluded.list_row_hash)),
+        ).returning(table.c.id, table.c.title, table.c.race_date)
+
+        return {marathon_id: rows_by_key[(title, race_date)]
+                for marathon_id, title, race_date in self.db.execute(statement)}
+
+    def _replace_courses(self, courses_by_marathon: dict[int, list[str]]):
+        """저장/갱신한 마라톤의 코스 연결을 지우고 한 번의 INSERT로 다시 기록"""
+        if not courses_by_marathon:
             return
+        course_ids = self.get_or_create_course_ids(
+            {name for names in courses_by_marathon.values() for name in names}
+        )
+        self.db.execute(delete(marathon_course_association)
+                        .where(marathon_course_association.c.marathon_id.in_(courses_by_marathon)))
 
-        course = self.db.query(Course).filter(
-            Course.distance == distance
-        ).first()
+        associations = []
+        for marathon_id, names in courses_by_marathon.items():
+            linked = set()
+            for name in names:
+                course_id = course_ids.get(name)
+                if course_id is not None and course_id not in linked:
+                    linked.add(course_id)
+                    associations.append({'marathon_id': marathon_id, 'course_id': course_id})
+        if associations:
+            self.db.execute(insert(marathon_course_association), associations)
+        # 세션에 올라와 있는 마라톤의 courses 관계를 다시 읽도록 함
+        self.db.expire_all()
 
-        if not course:
-            course = Course(
-                distance = distance,
-                name = name
-            )
-            self.db.add(course)
-            self.db.flush()
+    def get_or_create_course_ids(self, course_names: set[str]) -> dict[str, int]:
+        """코스 이름 → Course id (course_cache를 사용하고, 없는 거리의 코스는 한 번에 추가)"""
+        normalized = {}
+        for course_name in course_names:
+            if result := Course.normalize_course_name(course_name):
+                normalized[course_name] = result
+        if not normalized:
+            return {}
 
-        return course
+        distances = {distance for distance, _ in normalized.values()}
+        ids_by_distance = self.course_cache.get_ids(self.db, distances)
+        ids_by_distance.update({distance: course_id for distance, course_id in self.pending_course_ids.items()
+                                if distance in distances})
 
-    def get(self):
-        return self.db.query(MarathonInfoDB).all()
-    
-    def get_by_region(self, region: str):
-        return self.db.query(MarathonInfoDB).filter(MarathonInfoDB.location == region).all()
-    
-    def get_by_distance(self, distance: int):
-        return self.db.query(MarathonInfoDB)\
-                .join(MarathonInfoDB.courses)\
-                .filter(Course.distance == distance)\
-                .distinct()\
+        missing = {}
+        for distance, name in normalized.values():
+            if distance not in ids_by_distance:
+                missing.setdefault(distance, name)
+        if missing:
+            found, created = self.course_cache.create_missing(self.db, missing)
+            self.pending_course_ids.update(created)
+            ids_by_distance.update(found)
+            ids_by_distance.update(created)
+
+        return {course_name: ids_by_distance[distance] for course_name, (distance, _) in normalized.items()}
+
+    @staticmethod
+    def _marathon_row(marathon: dict) -> dict:
+        row = {column: marathon.get(column) for column in MARATHON_COLUMNS}
+        row['region'] = classify_region(row['location']).value
+        return row
+
+    def get_known_roadrun_rows(self) -> dict[int, str]:
+        rows = self.db.query(MarathonInfoDB.roadrun_no, MarathonInfoDB.list_row_hash)\
+                .filter(MarathonInfoDB.roadrun_no.isnot(None))\
                 .all()
+        return {roadrun_no: list_row_hash for roadrun_no, list_row_hash in rows}
+
+    def next_registration_start(self, after: datetime) -> datetime | None:
+        """after 이후에 접수를 시작하는 가장 빠른 시각"""
+        return self.db.execute(select(func.min(MarathonInfoDB.registration_start_date))
+                               .where(MarathonInfoDB.registration_start_date > after)).scalar()
 
-    def get_by_registration_period(self, check_date: datetime):
-        return self.db.query(MarathonInfoDB).filter(and_(MarathonInfoDB.registration_start_date <= check_date,
-                                                    MarathonInfoDB.registration_end_date >= check_date)).all()
+    def search(self, q: str, limit: int = 20, fields: tuple[str, ...] | None = None) -> list[MarathonInfo]:
+        """대회명/장소/주최에서 검색어로 찾은 마라톤 (관련도 순, 빈 검색어는 ValueError)"""
+        statement = search_statement(self.db.get_bind().dialect.name, search_terms(q), limit, fields)
+        return self._to_marathon_infos(self.db.execute(statement).all(), fields)
 
-    def get_by_race_date(self, search_start_date: datetime, search_end_date: datetime):
-        return self.db.query(MarathonInfoDB).filter(
+    def create_or_get_course(self, course: str) -> Course:
+        if course_id := self.get_or_create_course_ids({course}).get(course):
+            return self.db.get(Course, course_id)
+
+    def get(self, projection: bool = False):
+        return self._load(self.db.query(MarathonInfoDB), projection)
+    
+    def get_by_region(self, region: Region | str | list[Region | str], projection: bool = False):
+        query = self.db.query(MarathonInfoDB).filter(MarathonInfoDB.region.in_(region_values(region)))
+        return self._load(query, projection)
+
+    def get_by_distance(self, distance: int, projection: bool = False):
+        return self._load(self.db.query(MarathonInfoDB).filter(has_course(distance)), projection)
+
+    def get_by_registration_period(self, check_date: datetime, projection: bool = False,
+                                   limit: int | None = None, after: Keyset | None = None,
+                                   fields: tuple[str, ...] | None = None):
+        query = self.db.query(MarathonInfoDB).filter(registration_open(check_date))
+        return self._load(query, projection, limit, after, fields)
+
+    def get_by_race_date(self, search_start_date: datetime, search_end_date: datetime, projection: bool = False):
+        query = self.db.query(MarathonInfoDB).filter(
             and_(search_start_date <= MarathonInfoDB.race_date,
             MarathonInfoDB.race_date <= search_end_date)
-        ).all()
+        )
+        return self._load(query, projection)
 
 
     def get_marathons(self, 
                       registration_status: bool = True, 
-                      region: str = None,
+                      region: Region | str | list[Region | str] = None,
                       course: int = None,
                       race_search_start_date: datetime = None,
-                      race_search_end_date: datetime = None
+                      race_search_end_date: datetime = None,
+                      projection: bool = False,
+                      limit: int | None = None,
+                      after: Keyset | None = None,
+                      fields: tuple[str, ...] | None = None,
                       ):
-        query = self.db.query(MarathonInfoDB)
-        if registration_status:
-            query = query.filter(and_(MarathonInfoDB.registration_start_date <= datetime.now(),
-                                       MarathonInfoDB.registration_end_date >= datetime.now()))
-        if course is not None:
-            query = query.join(MarathonInfoDB.courses)\
-                    .filter(Course.distance == course)\
-                    .distinct()
-        if region is not None:
-            query = query.filter(MarathonInfoDB.location == region)
-        if race_search_start_date is not None and race_search_end_date is not None:
-            query = query.filter(and_(MarathonInfoDB.race_date >= race_search_start_date,
-                                  MarathonInfoDB.race_date <= race_search_end_date)
-                                  )
-        return query.all()
+        query = self._marathons_query(registration_status, region, course,
+                                      race_search_start_date, race_search_end_date)
+        return self._load(query, projection, limit, after, fields)
+
+    def iter_marathons(self,
+                       registration_status: bool = True,
+                       region: Region | str | list[Region | str] = None,
+                       course: int = None,
+                       race_search_start_date: datetime = None,
+                       race_search_end_date: datetime = None,
+                       chunk_size: int = 500,
+                       ) -> Iterator[MarathonInfo]:
+        """get_marathons(projection=True)와 같은 결과를 서버 측 커서로 chunk_size개씩 읽으면서 반환"""
+        query = self._marathons_query(registration_status, region, course,
+                                      race_search_start_date, race_search_end_date)\
+            .with_entities(*MARATHON_INFO_COLUMNS)\
+            .yield_per(chunk_size)
+        rows = []
+        for row in query:
+            rows.append(row)
+            if len(rows) == chunk_size:
+                yield from self._to_marathon_infos(rows)
+                rows = []
+        yield from self._to_marathon_infos(rows)
+
+    def _marathons_query(self,
+                         registration_status: bool,
+                         region: Region | str | list[Region | str],
+                         course: int,
+                         race_search_start_date: datetime,
+                         race_search_end_date: datetime) -> Query:
+        return self.db.query(MarathonInfoDB).filter(*marathon_conditions(
+            registration_status, region, course, race_search_start_date, race_search_end_date))
+
+    def _load(self, query: Query, projection: bool,
+              limit: int | None = None, after: Keyset | None = None,
+              fields: tuple[str, ...] | None = None) -> list[MarathonInfoDB] | list[MarathonInfo]:
+        """마라톤 목록과 코스를 조회 수와 관계없이 일정한 쿼리 수로 읽음
+
+        limit/after가 있으면 (race_date, id) 순서로 after 다음부터 limit개만 읽는다 (키셋 페이지네이션).
+        projection=False: ORM 객체를 반환하고 courses는 selectinload로 한 번에 읽는다.
+        projection=True: ORM 객체를 만들지 않고 컬럼 값으로 바로 MarathonInfo를 만든다.
+        fields가 있으면 (projection=True) 그 컬럼만 조회하고, courses가 없으면 코스 테이블은 읽지 않는다.
+        """
+        query = paginate(query, limit, after)
+        if not projection:
+            return query.options(selectinload(MarathonInfoDB.courses)).all()
+        return self._to_marathon_infos(query.with_entities(*marathon_info_columns(fields)).all(), fields)
+
+    def _to_marathon_infos(self, rows: list, fields: tuple[str, ...] | None = None) -> list[MarathonInfo]:
+        courses = self._get_courses_by_marathon([row.id for row in rows]) if rows and loads_courses(fields) else {}
+        return to_marathon_infos(rows, courses, fields)
+
+    def _get_courses_by_marathon(self, marathon_ids: list[int]) -> dict[int, list[CourseInfo]]:
+        courses = {}
+        for start in range(0, len(marathon_ids), COURSE_LOAD_CHUNK_SIZE):
+            statement = courses_statement(marathon_ids[start:start + COURSE_LOAD_CHUNK_SIZE])
+            for marathon_id, distance, name, description in self.db.execute(statement):
+                courses.setdefault(marathon_id, []).append(
+                    CourseInfo(distance=distance, name=name, description=description))
+        return courses
+
+
+DIGEST_COLUMNS = (MarathonDigestDB.payload, MarathonDigestDB.valid_until)
+
+
+class MarathonDigestRepository(AbstractRepository):
+    def __init__(self, db: Session):
+        self.db = db
+
+    def save(self, name: str, payload: str, item_count: int, built_at: datetime, valid_until: datetime | None):
+        self.db.merge(MarathonDigestDB(name=name, payload=payload, item_count=item_count,
+                                       built_at=built_at, valid_until=valid_until))
+
+    def get(self, name: str) -> Row | None:
+        """(payload, valid_until) - 기본 키 조회 한 번"""
+        return self.db.execute(select(*DIGEST_COLUMNS).where(MarathonDigestDB.name == name)).first()
+
+    def get_version(self, name: str) -> int:
+        return self.db.execute(select(DataVersionDB.version).where(DataVersionDB.name == name)).scalar() or 0
+
+    def bump_version(self, name: str, updated_at: datetime) -> int:
+        version = self.db.get(DataVersionDB, name, with_for_update=True)
+        if version is None:
+            version = DataVersionDB(name=name, version=0)
+            self.db.add(version)
+        version.version += 1
+        version.updated_at = updated_at
+        self.db.flush()
+        return version.version
+
+
+class AsyncMarathonDigestRepository(AbstractReadRepository):
+    """digest 조회만 asyncio 세션으로 실행 (저장은 MarathonDigestRepository)"""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get(self, name: str) -> Row | None:
+        return (await self.db.execute(select(*DIGEST_COLUMNS).where(MarathonDigestDB.name == name))).first()
+
+
+class AsyncMarathonRepository(AbstractReadRepository):
+    """MarathonRepository의 조회를 asyncio 세션으로 실행 (projection 조회만 지원, 저장은 MarathonRepository)
+
+    비동기 세션에서는 지연 로딩을 할 수 없으므로 ORM 객체 대신 컬럼 값으로 MarathonInfo를 만든다.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_marathons(self,
+                            registration_status: bool = True,
+                            region: Region | str | list[Region | str] = None,
+                            course: int = None,
+                            race_search_start_date: datetime = None,
+                            race_search_end_date: datetime = None,
+                            limit: int | None = None,
+                            after: Keyset | None = None,
+                            fields: tuple[str, ...] | None = None,
+                            ) -> list[MarathonInfo]:
+        statement = select(*marathon_info_columns(fields)).where(*marathon_conditions(
+            registration_status, region, course, race_search_start_date, race_search_end_date))
+        return await self._load(statement, limit, after, fields)
+
+    async def get_by_registration_period(self, check_date: datetime,
+                                         limit: int | None = None, after: Keyset | None = None,
+                                         fields: tuple[str, ...] | None = None) -> list[MarathonInfo]:
+        statement = select(*marathon_info_columns(fields)).where(registration_open(check_date))
+        return await self._load(statement, limit, after, fields)
+
+    async def search(self, q: str, limit: int = 20, fields: tuple[str, ...] | None = None) -> list[MarathonInfo]:
+        statement = search_statement(self.db.get_bind().dialect.name, search_terms(q), limit, fields)
+        return await self._to_marathon_infos((await self.db.execute(statement)).all(), fields)
+
+    async def _load(self, statement, limit: int | None, after: Keyset | None,
+                    fields: tuple[str, ...] | None = None) -> list[MarathonInfo]:
+        rows = (await self.db.execute(paginate(statement, limit, after))).all()
+        return await self._to_marathon_infos(rows, fields)
+
+    async def _to_marathon_infos(self, rows: list, fields: tuple[str, ...] | None = None) -> list[MarathonInfo]:
+        load = rows and loads_courses(fields)
+        courses = await self._get_courses_by_marathon([row.id for row in rows]) if load else {}
+        return to_marathon_infos(rows, courses, fields)
+
+    async def _get_courses_by_marathon(self, marathon_ids: list[int]) -> dict[int, list[CourseInfo]]:
+        courses = {}
+        for start in range(0, len(marathon_ids), COURSE_LOAD_CHUNK_SIZE):
+            statement = courses_statement(marathon_ids[start:start + COURSE_LOAD_CHUNK_SIZE])
+            for marathon_id, distance, name, description in await self.db.execute(statement):
+                courses.setdefault(marathon_id, []).append(
+                    CourseInfo(distance=distance, name=name, description=description))
+        return courses
@@ -0,0 +1,193 @@
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from queue import Queue
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from src.ports.inbound import WebCrawlerPort
+
+# 대회명 비교에서 무시할 부분: "제22회", 연도, 공백/문장부호
+_EDITION_PATTERN = re.compile(r'제?\s*\d+\s*회')
+_YEAR_PATTERN = re.compile(r'(19|20)\d{2}\s*년?')
+_NON_WORD_PATTERN = re.compile(r'[\W_]+')
+_REGION_SUFFIX_PATTERN = re.compile(r'(특별자치시|특별자치도|특별시|광역시|도|시)$')
+
+
+def normalize_title(title: str) -> str:
+    title = _EDITION_PATTERN.sub('', title or '')
+    title = _YEAR_PATTERN.sub('', title)
+    return _NON_WORD_PATTERN.sub('', title).lower()
+
+
+def normalize_location(location: str) -> str:
+    """장소의 첫 단어(시/도)만 비교 (예: '대전광역시 유성구' → '대전')"""
+    first_word = (location or '').strip().split(' ')[0]
+    return _REGION_SUFFIX_PATTERN.sub('', first_word) if len(first_word) > 2 else first_word
+
+
+def marathon_dedup_key(marathon: Dict) -> Tuple:
+    race_date = marathon.get('race_date')
+    return (
+        normalize_title(marathon.get('title', '')),
+        race_date.date() if race_date else None,
+        normalize_location(marathon.get('location', '')),
+    )
+
+
+@dataclass
+class DedupResult:
+    marathons: List[Dict]
+    duplicates: int
+    sources: Dict[Tuple, List[str]]
+
+
+def deduplicate_marathons(tagged_marathons: Iterable[Tuple[str, Dict]]) -> DedupResult:
+    """(소스 이름, 마라톤) 목록에서 같은 대회를 해시 키로 묶음 - O(n)
+
+    먼저 들어온 소스의 값을 유지하고, 비어 있는 필드만 나중 소스의 값으로 채운다.
+    """
+    merged: Dict[Tuple, Dict] = {}
+    sources: Dict[Tuple, List[str]] = {}
+    duplicates = 0
+    for source, marathon in tagged_marathons:
+        key = marathon_dedup_key(marathon)
+        if key not in merged:
+            merged[key] = dict(marathon)
+            sources[key] = [source]
+            continue
+        duplicates += 1
+        sources[key].append(source)
+        existing = merged[key]
+        for name, value in marathon.items():
+            if existing.get(name) in (None, '', []) and value not in (None, '', []):
+                existing[name] = value
+    return DedupResult(marathons=list(merged.values()), duplicates=duplicates, sources=sources)
+
+
+@dataclass
+class CrawlSource:
+    name: str
+    crawler: WebCrawlerPort
+    url: str
+
+
+@dataclass
+class MultiSourceCrawlResult:
+    marathons: List[Dict]
+    duplicates: int = 0
+    per_source: Dict[str, int] = field(default_factory=dict)
+    errors: Dict[str, str] = field(default_factory=dict)
+    field_errors: Dict[str, List[Dict]] = field(default_factory=dict)
+
+
+# 소스 워커가 큐에 넣는 메시지 종류
+_MARATHON, _FIELD_ERRORS, _ERROR, _DONE = 'marathon', 'field_errors', 'error', 'done'
+
+
+class CrawlerRegistry(WebCrawlerPort):
+    """등록된 크롤러를 동시에 실행하고 소스 간 중복 대회를 합침
+
+    각 소스의 마라톤은 해당 크롤러의 preprocess_batch로 한 건씩 전처리되므로,
+    crawl()/iter_crawl()이 돌려주는 마라톤은 이미 도메인 필드 형식이다.
+    """
+
+    def __init__(self, max_workers: int | None = None):
+        self.max_workers = max_workers
+        self._sources: Dict[str, CrawlSource] = {}
+        self.last_result: MultiSourceCrawlResult | None = None
+
+    def register(self, name: str, crawler: WebCrawlerPort, url: str):
+        if name in self._sources:
+            raise ValueError(f"이미 등록된 크롤링 소스입니다: {name}")
+        self._sources[name] = CrawlSource(name=name, crawler=crawler, url=url)
+
+    @property
+    def sources(self) -> List[CrawlSource]:
+        return list(self._sources.values())
+
+    def crawl(self, url: str | None = None) -> List[Dict]:
+        """url은 WebCrawlerPort 호환용이며 사용하지 않음 (소스별 url 사용)"""
+        return self.crawl_all().marathons
+
+    def iter_crawl(self, url: str | None = None) -> Iterator[Dict]:
+        """모든 소스를 동시에 크롤링하면서 마라톤을 도착하는 대로 하나씩 반환 (소스가 끝나기를 기다리지 않음)
+
+        중복 키는 마라톤이 도착할 때 확인해서 먼저 도착한 소스의 값을 사용하고 나중에 온 중복은 건너뛴다.
+        빈 필드를 다른 소스 값으로 채우는 병합은 모든 소스를 기다리는 crawl_all에서만 한다.
+        url은 WebCrawlerPort 호환용이며 사용하지 않음
+        """
+        result = MultiSourceCrawlResult(marathons=[])
+        self.last_result = result
+        seen = set()
+        for _, marathon in self._iter_sources(result):
+            key = marathon_dedup_key(marathon)
+            if key in seen:
+                result.duplicates += 1
+                continue
+            seen.add(key)
+            result.marathons.append(marathon)
+            yield marathon
+
+    def preprocess_data(self, marathon_data: Dict) -> Dict:
+        return marathon_data
+
+    def crawl_all(self) -> MultiSourceCrawlResult:
+        """모든 소스가 끝날 때까지 기다린 뒤, 등록 순서대로 소스 값을 우선해서 중복 대회를 병합"""
+        result = MultiSourceCrawlResult(marathons=[])
+        order = {source.name: index for index, source in enumerate(self.sources)}
+        tagged_marathons = sorted(self._iter_sources(result), key=lambda tagged: order[tagged[0]])
+
+        dedup_result = deduplicate_marathons(tagged_marathons)
+        result.marathons = dedup_result.marathons
+        result.duplicates = dedup_result.duplicates
+        self.last_result = result
+        return result
+
+    def _iter_sources(self, result: MultiSourceCrawlResult) -> Iterator[Tuple[str, Dict]]:
+        """소스마다 워커 스레드가 전처리한 마라톤을 큐에 넣고, 도착하는 대로 (소스 이름, 마라톤)을 반환
+
+        소스별 건수, 크롤링 오류, 필드 오류는 result에 기록한다.
+        반환을 중간에 멈추면 워커는 다음 마라톤을 읽기 전에 크롤링을 멈춘다.
+        """
+        sources = self.sources
+        if not sources:
+            return
+        queue = Queue()
+        stop = threading.Event()
+        for source in sources:
+            result.per_source[source.name] = 0
+        with ThreadPoolExecutor(max_workers=self.max_workers or len(sources)) as executor:
+            for source in sources:
+                executor.submit(self._crawl_source, source, queue, stop)
+            running = len(sources)
+            try:
+                while running:
+                    kind, name, value = queue.get()
+                    if kind == _DONE:
+                        running -= 1
+                    elif kind == _ERROR:
+                        result.errors[name] = value
+                    elif kind == _FIELD_ERRORS:
+                        result.field_errors.setdefault(name, []).extend(value)
+                    else:
+                        result.per_source[name] += 1
+                        yield name, value
+            finally:
+                stop.set()
+
+    def _crawl_source(self, source: CrawlSource, queue: Queue, stop: threading.Event):
+        try:
+            for index, raw_marathon in enumerate(source.crawler.iter_crawl(source.url)):
+                if stop.is_set():
+                    break
+                marathons, field_errors = source.crawler.preprocess_batch([raw_marathon])
+                if field_errors:
+                    queue.put((_FIELD_ERRORS, source.name, [dict(error, index=index) for error in field_errors]))
+                for marathon in marathons:
+                    queue.put((_MARATHON, source.name, marathon))
+        except Exception as e:
+            print(f"Error crawling {source.name}: {str(e)}")
+            queue.put((_ERROR, source.name, str(e)))
+        finally:
+            queue.put((_DONE, source.name, None))
@@ -0,0 +1,22 @@
+from src.domain.models import MarathonInfo
+
+# fields 파라미터로 고를 수 있는 응답 필드
+MARATHON_FIELDS = tuple(MarathonInfo.model_fields)
+
+
+def parse_fields(fields: str | list[str] | None) -> tuple[str, ...] | None:
+    """응답에 넣을 MarathonInfo 필드 ('title,race_date' 또는 ['title', 'race_date'])
+
+    지정하지 않으면 None(전체 필드), 모르는 필드가 있으면 ValueError.
+    순서와 중복에 관계없이 MarathonInfo 필드 순서의 tuple을 반환한다.
+    """
+    if fields is None:
+        return None
+    names = fields.split(',') if isinstance(fields, str) else fields
+    names = {name.strip() for name in names if name.strip()}
+    if not names:
+        return None
+    if unknown := names - set(MARATHON_FIELDS):
+        raise ValueError(f"알 수 없는 필드입니다: {', '.join(sorted(unknown))} "
+                         f"(가능한 필드: {', '.join(MARATHON_FIELDS)})")
+    return tuple(name for name in MARATHON_FIELDS if name in names)
@@ -22,6 +22,6 @@ class NotificationService:
 일시: {marathon.race_date.strftime('%Y-%m-%d %H:%M')}
 접수기간: {marathon.registration_start_date.strftime('%Y-%m-%d')} ~ {marathon.registration_end_date.strftime('%Y-%m-%d')}
 장소: {marathon.location}
-링크: {marathon.homepage}
+링크: {marathon.homepage or '-'}
         """.strip() for marathon in marathon_list
         ])
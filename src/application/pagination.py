@@ -0,0 +1,33 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+
+from src.domain.models import MarathonInfo
+
+MAX_PAGE_SIZE = 1000
+
+# 키셋 페이지네이션 위치 (race_date, id) - 이 값보다 뒤에 있는 마라톤부터 조회
+Keyset = tuple[datetime, int]
+
+
+def encode_cursor(marathon: MarathonInfo) -> str:
+    """마지막으로 받은 마라톤의 (race_date, id)를 외부에 노출하지 않는 문자열로 변환"""
+    payload = json.dumps([marathon.race_date.isoformat(), marathon.id], separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str) -> Keyset:
+    try:
+        payload = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        race_date, marathon_id = json.loads(payload)
+        return datetime.fromisoformat(race_date), int(marathon_id)
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as e:
+        raise ValueError(f"잘못된 cursor입니다: {cursor!r}") from e
+
+
+def next_cursor(marathon_list: list[MarathonInfo], limit: int | None) -> str | None:
+    """limit만큼 채워진 페이지면 다음 페이지 cursor를 반환"""
+    if limit is None or len(marathon_list) < limit:
+        return None
+    return encode_cursor(marathon_list[-1])
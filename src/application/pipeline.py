@@ -0,0 +1,94 @@
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List
+
+from src.ports.inbound import WebCrawlerPort
+from src.application.services import MarathonService
+
+
+@dataclass
+class PipelineResult:
+    crawled: int = 0
+    preprocessed: int = 0
+    filtered_out: int = 0
+    written: int = 0
+    batches: int = 0
+    failed_batches: int = 0
+    digests: int = 0
+    errors: List[str] = field(default_factory=list)
+
+
+class MarathonIngestionPipeline:
+    """crawl → preprocess → filter → 배치 저장을 제너레이터로 이어서 처리
+
+    마라톤은 파싱되는 대로 다음 단계로 넘어가고 batch_size 단위로 커밋되므로,
+    크롤링 도중 실패해도 그때까지 처리한 배치는 데이터베이스에 남는다.
+    저장에 실패한 배치는 건너뛰고(failed_batches) 다음 배치를 계속 저장한다.
+    """
+
+    def __init__(self,
+                 crawler: WebCrawlerPort,
+                 marathon_service: MarathonService,
+                 batch_size: int = 20,
+                 marathon_filter=None):
+        self.crawler = crawler
+        self.marathon_service = marathon_service
+        self.batch_size = max(1, batch_size)
+        self.marathon_filter = marathon_filter
+
+    def run(self, url: str) -> PipelineResult:
+        result = PipelineResult()
+        marathons = self._filter(self._preprocess(self._crawl(url, result), result), result)
+        for batch in self._batched(marathons, result):
+            try:
+                result.written += self.marathon_service.save_marathon_batch(batch)
+                result.batches += 1
+            except Exception as e:
+                # 실패한 배치만 버리고 다음 배치는 계속 저장
+                print(f"Error saving marathon batch: {str(e)}")
+                result.failed_batches += 1
+                result.errors.append(f"persist {len(batch)} marathons "
+                                     f"({batch[0].get('title')} ~ {batch[-1].get('title')}): {str(e)}")
+        try:
+            # 커밋된 결과로 조회용 digest를 한 번만 다시 만들고 데이터 버전을 올림 (API 응답 캐시 무효화)
+            result.digests = self.marathon_service.rebuild_digests()
+        except Exception as e:
+            print(f"Error rebuilding marathon digests: {str(e)}")
+            result.errors.append(f"digest: {str(e)}")
+        return result
+
+    def _crawl(self, url: str, result: PipelineResult) -> Iterator[Dict]:
+        for marathon in self.crawler.iter_crawl(url):
+            result.crawled += 1
+            yield marathon
+
+    def _preprocess(self, marathons: Iterable[Dict], result: PipelineResult) -> Iterator[Dict]:
+        for marathon in marathons:
+            try:
+                preprocessed = self.crawler.preprocess_data(marathon)
+            except Exception as e:
+                result.errors.append(f"preprocess {marathon.get('title')}: {str(e)}")
+                continue
+            result.preprocessed += 1
+            yield preprocessed
+
+    def _filter(self, marathons: Iterable[Dict], result: PipelineResult) -> Iterator[Dict]:
+        for marathon in marathons:
+            if self.marathon_filter is None or self.marathon_filter.filter(marathon):
+                yield marathon
+            else:
+                result.filtered_out += 1
+
+    def _batched(self, marathons: Iterable[Dict], result: PipelineResult) -> Iterator[List[Dict]]:
+        batch = []
+        try:
+            for marathon in marathons:
+                batch.append(marathon)
+                if len(batch) >= self.batch_size:
+                    yield batch
+                    batch = []
+        except Exception as e:
+            # 크롤링이 중간에 실패해도 모아둔 마라톤은 저장
+            print(f"Error crawling marathon schedule: {str(e)}")
+            result.errors.append(f"crawl: {str(e)}")
+        if batch:
+            yield batch
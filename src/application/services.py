@@ -1,72 +1,337 @@
-from src.domain.models import MarathonInfo
-from src.infrastructure.models import MarathonInfoDB, RecipientDB
-from src.application.uow import AbstractUnitOfWork
+from src.domain.models import MarathonInfo, Region
+from src.domain.phone import normalize_phone_number
+from src.application.fields import parse_fields
+from src.application.pagination import MAX_PAGE_SIZE, decode_cursor
+from src.infrastructure.models import RecipientDB
+from src.application.uow import AbstractAsyncUnitOfWork, AbstractUnitOfWork
 from sqlalchemy.orm import Session
-from datetime import datetime
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Iterator, Literal
+from pydantic import BaseModel, Field, TypeAdapter, field_validator
 import calendar
 
+# 수집이 끝날 때 미리 만들어 두는 조회 결과 이름 (API 경로와 같음)
+DIGEST_OPEN_REGISTRATION = 'open-registration'
+DIGEST_THIS_MONTH = 'this-month'
+MARATHON_LIST_ADAPTER = TypeAdapter(list[MarathonInfo])
+# 수집 결과가 반영될 때 올리는 데이터 버전 이름
+DATA_VERSION_MARATHON = 'marathon'
+# 일괄 조회 한 번에 실행할 수 있는 조회 수
+MAX_BATCH_QUERIES = 10
+
+
+class MarathonQuery(BaseModel):
+    """일괄 조회의 조회 하나 (view는 목록 API 경로: marathon, open-registration, this-month)"""
+    view: Literal['marathon', 'open-registration', 'this-month'] = 'marathon'
+    registration_status: bool | None = None
+    region: list[Region] | None = None
+    course: int | None = None
+    race_search_start_date: datetime | None = None
+    race_search_end_date: datetime | None = None
+    limit: int | None = Field(None, ge=1, le=MAX_PAGE_SIZE)
+    cursor: str | None = None
+    fields: tuple[str, ...] | None = None
+
+    @field_validator('fields', mode='before')
+    @classmethod
+    def check_fields(cls, fields):
+        return parse_fields(fields)
+
+
+def digest_payload(digest, now: datetime) -> str | None:
+    """저장된 digest가 아직 유효하면 JSON을 반환"""
+    if digest is None or (digest.valid_until is not None and now >= digest.valid_until):
+        return None
+    return digest.payload
+
+
+def batch_query_call(query: MarathonQuery, now: datetime) -> tuple[str, dict]:
+    """일괄 조회의 조회 하나를 실행할 repository 메서드 이름과 인자 (동기/async repository 공통)"""
+    after = decode_cursor(query.cursor) if query.cursor else None
+    if query.view == 'open-registration':
+        return 'get_by_registration_period', dict(check_date=now, limit=query.limit, after=after,
+                                                  fields=query.fields)
+    race_search_start_date, race_search_end_date = query.race_search_start_date, query.race_search_end_date
+    if query.view == 'this-month':
+        race_search_start_date, race_search_end_date = this_month_range(now)
+    return 'get_marathons', dict(
+        registration_status=query.registration_status,
+        region=query.region,
+        course=query.course,
+        race_search_start_date=race_search_start_date,
+        race_search_end_date=race_search_end_date,
+        limit=query.limit,
+        after=after,
+        fields=query.fields,
+    )
+
+
+def this_month_range(now: datetime) -> tuple[datetime, datetime]:
+    """now가 속한 달의 첫날 0시와 마지막 날 23:59:59"""
+    _, last_day = calendar.monthrange(now.year, now.month)
+    return datetime(now.year, now.month, 1, 0, 0, 0), datetime(now.year, now.month, last_day, 23, 59, 59)
+
+
 class MarathonService:
     def __init__(self, uow: AbstractUnitOfWork):
         self.uow = uow
     
-    def save_marathon_info(self, marathon: MarathonInfoDB):
+    def save_marathon_info(self, marathon: dict):
+        self.save_marathon_batch([marathon])
+
+    def save_marathon_batch(self, marathons: list[dict]) -> int:
+        """여러 마라톤을 일괄 upsert 후 한 번 커밋하고, 새로 저장하거나 갱신한 수를 반환"""
         with self.uow as uow:
-            existing_marathon = uow.marathon_repository.get_by_title_race_date(marathon.title, 
-                                                                               marathon.race_date, 
-                                                                               )
-            if not existing_marathon:
-                uow.marathon_repository.save(marathon)
+            written = uow.marathon_repository.bulk_upsert(marathons)
+            if written:
                 uow.commit()
+        return written
+
+    def get_known_roadrun_rows(self) -> dict[int, str]:
+        with self.uow as uow:
+            return uow.marathon_repository.get_known_roadrun_rows()
 
     def get_marathon_info(self, 
                           registration_status: bool = None,
-                          region: str = None, 
+                          region: Region | str | list[Region | str] = None, 
                           course: int = None, 
                           race_search_start_date: datetime = None, 
-                          race_search_end_date: datetime = None):
+                          race_search_end_date: datetime = None,
+                          limit: int | None = None,
+                          cursor: str | None = None,
+                          fields: tuple[str, ...] | None = None):
+        """limit/cursor를 주면 (race_date, id) 순서로 cursor 다음부터 limit개만 조회 (잘못된 cursor는 ValueError)
 
+        fields를 주면 그 필드만 조회해서 채운다 (parse_fields 결과, id/race_date는 항상 포함).
+        """
+        after = decode_cursor(cursor) if cursor else None
         with self.uow as uow:
             
-            marathon_list: list[MarathonInfoDB] = uow.marathon_repository.get_marathons(
+            marathon_list: list[MarathonInfo] = uow.marathon_repository.get_marathons(
                 registration_status=registration_status,
             region = region,
             course = course,
             race_search_start_date = race_search_start_date,
             race_search_end_date = race_search_end_date,
+            projection = True,
+            limit = limit,
+            after = after,
+            fields = fields,
             )
-            marathon_list = [marathon.to_pydantic() for marathon in marathon_list]
 
         return marathon_list
+
+    def iter_marathon_info(self,
+                           registration_status: bool = None,
+                           region: Region | str | list[Region | str] = None,
+                           course: int = None,
+                           race_search_start_date: datetime = None,
+                           race_search_end_date: datetime = None,
+                           chunk_size: int = 500) -> Iterator[MarathonInfo]:
+        """전체 결과를 메모리에 올리지 않고 chunk_size개씩 읽으면서 반환 (스트리밍 응답용)
+
+        응답을 보내는 동안 트랜잭션이 열려 있으므로 공유 UoW 대신 별도 UoW를 사용한다.
+        """
+        with self.uow.new() as uow:
+            yield from uow.marathon_repository.iter_marathons(
+                registration_status=registration_status,
+                region=region,
+                course=course,
+                race_search_start_date=race_search_start_date,
+                race_search_end_date=race_search_end_date,
+                chunk_size=chunk_size,
+            )
     
-    def get_marathon_open_registration(self):
+    def get_marathon_open_registration(self, limit: int | None = None, cursor: str | None = None,
+                                       fields: tuple[str, ...] | None = None):
+        after = decode_cursor(cursor) if cursor else None
         with self.uow as uow:
-            marathon_list: list[MarathonInfoDB] = uow.marathon_repository.get_by_registration_period(datetime.now())
-            marathon_list = [marathon.to_pydantic() for marathon in marathon_list]
+            marathon_list: list[MarathonInfo] = uow.marathon_repository.get_by_registration_period(datetime.now(),
+                                                                                                 projection=True,
+                                                                                                 limit=limit,
+                                                                                                 after=after,
+                                                                                                 fields=fields)
         return marathon_list
 
     def get_marathon_this_month(self, 
                         registration_status: bool = None,
-                        region: str = None, 
-                        course: int = None):
+                        region: Region | str | list[Region | str] = None, 
+                        course: int = None,
+                        limit: int | None = None,
+                        cursor: str | None = None,
+                        fields: tuple[str, ...] | None = None):
         # 이번 달에 열리는 마라톤 대회 정보 조회
+        after = decode_cursor(cursor) if cursor else None
         with self.uow as uow:
-            now = datetime.now()
-            current_year = now.year
-            current_month = now.month
-            _, last_day = calendar.monthrange(current_year, current_month)
-            month_end = datetime(current_year, current_month, last_day, 23, 59, 59)
+            month_start, month_end = this_month_range(datetime.now())
 
-            marathon_list: list[MarathonInfoDB] = uow.marathon_repository.get_marathons(
+            marathon_list: list[MarathonInfo] = uow.marathon_repository.get_marathons(
                 registration_status=registration_status,
                 region = region,
                 course = course,
-                race_search_start_date = datetime(current_year, current_month, 1, 0, 0, 0),
+                race_search_start_date = month_start,
                 race_search_end_date = month_end,
+                projection = True,
+                limit = limit,
+                after = after,
+                fields = fields,
                 )
-            marathon_list = [marathon.to_pydantic() for marathon in marathon_list]
 
         return marathon_list
-    
+
+    def get_marathon_batch(self, queries: list[MarathonQuery]) -> list[list[MarathonInfo]]:
+        """여러 목록 조회를 세션 하나(트랜잭션 하나)로 실행하고 조회 순서대로 결과를 반환
+
+        open-registration, this-month도 미리 만든 digest 대신 DB를 조회한다 (fields/페이지를 적용하기 위해).
+        """
+        now = datetime.now()
+        with self.uow as uow:
+            return [getattr(uow.marathon_repository, method)(projection=True, **kwargs)
+                    for method, kwargs in (batch_query_call(query, now) for query in queries)]
+
+    def search_marathons(self, q: str, limit: int = 20, fields: tuple[str, ...] | None = None) -> list[MarathonInfo]:
+        """대회명/장소/주최 검색 (관련도 순, 빈 검색어는 ValueError)"""
+        with self.uow as uow:
+            return uow.marathon_repository.search(q, limit, fields)
+
+    def rebuild_digests(self, now: datetime | None = None) -> int:
+        """접수 중인 마라톤과 이번 달 마라톤 목록을 JSON으로 만들어 저장 (수집이 끝난 뒤 한 번)
+
+        목록이 바뀌는 가장 빠른 시각(접수 마감/시작, 다음 달)을 valid_until로 같이 저장해서
+        그 이후에는 조회 시 digest 대신 DB를 다시 조회한다.
+        같은 트랜잭션에서 데이터 버전을 올려서 API 응답 캐시도 함께 무효화한다.
+        """
+        now = now or datetime.now()
+        month_start, month_end = this_month_range(now)
+        with self.uow as uow:
+            repository = uow.marathon_repository
+            open_registration = repository.get_by_registration_period(now, projection=True)
+            next_start = repository.next_registration_start(now)
+            registration_changes = [m.registration_end_date for m in open_registration] + [next_start]
+            this_month = repository.get_marathons(registration_status=None,
+                                                  race_search_start_date=month_start,
+                                                  race_search_end_date=month_end,
+                                                  projection=True)
+            digests = {
+                DIGEST_OPEN_REGISTRATION: (open_registration,
+                                           min(filter(None, registration_changes), default=None)),
+                DIGEST_THIS_MONTH: (this_month, month_end + timedelta(seconds=1)),
+            }
+            for name, (marathons, valid_until) in digests.items():
+                marathons = sorted(marathons, key=lambda marathon: (marathon.race_date, marathon.id))
+                uow.digest_repository.save(name, MARATHON_LIST_ADAPTER.dump_json(marathons).decode(),
+                                           len(marathons), now, valid_until)
+            uow.digest_repository.bump_version(DATA_VERSION_MARATHON, now)
+            uow.commit()
+        return len(digests)
+
+    def get_digest(self, name: str, now: datetime | None = None) -> str | None:
+        """미리 만든 목록 JSON (없거나 유효 기간이 지났으면 None)"""
+        with self.uow as uow:
+            return digest_payload(uow.digest_repository.get(name), now or datetime.now())
+
+    def get_data_version(self) -> int:
+        with self.uow as uow:
+            return uow.digest_repository.get_version(DATA_VERSION_MARATHON)
+
+    def get_digest_marathons(self, name: str, now: datetime | None = None) -> list[MarathonInfo] | None:
+        payload = self.get_digest(name, now)
+        return None if payload is None else MARATHON_LIST_ADAPTER.validate_json(payload)
+
+
+class AsyncMarathonService:
+    """MarathonService 조회의 asyncio 버전 (쿼리를 기다리는 동안 이벤트 루프가 다른 요청을 처리)
+
+    동시에 실행되는 요청끼리 세션을 공유하지 않도록 호출마다 새 UoW를 연다.
+    """
+
+    def __init__(self, uow: AbstractAsyncUnitOfWork):
+        self.uow = uow
+
+    async def get_marathon_info(self,
+                                registration_status: bool = None,
+                                region: Region | str | list[Region | str] = None,
+                                course: int = None,
+                                race_search_start_date: datetime = None,
+                                race_search_end_date: datetime = None,
+                                limit: int | None = None,
+                                cursor: str | None = None,
+                                fields: tuple[str, ...] | None = None) -> list[MarathonInfo]:
+        after = decode_cursor(cursor) if cursor else None
+        async with self.uow.new() as uow:
+            return await uow.marathon_repository.get_marathons(
+                registration_status=registration_status,
+                region=region,
+                course=course,
+                race_search_start_date=race_search_start_date,
+                race_search_end_date=race_search_end_date,
+                limit=limit,
+                after=after,
+                fields=fields,
+            )
+
+    async def get_marathon_open_registration(self, limit: int | None = None,
+                                             cursor: str | None = None,
+                                             fields: tuple[str, ...] | None = None) -> list[MarathonInfo]:
+        after = decode_cursor(cursor) if cursor else None
+        async with self.uow.new() as uow:
+            return await uow.marathon_repository.get_by_registration_period(datetime.now(), limit=limit, after=after,
+                                                                            fields=fields)
+
+    async def get_marathon_this_month(self,
+                                      registration_status: bool = None,
+                                      region: Region | str | list[Region | str] = None,
+                                      course: int = None,
+                                      limit: int | None = None,
+                                      cursor: str | None = None,
+                                      fields: tuple[str, ...] | None = None) -> list[MarathonInfo]:
+        after = decode_cursor(cursor) if cursor else None
+        month_start, month_end = this_month_range(datetime.now())
+        async with self.uow.new() as uow:
+            return await uow.marathon_repository.get_marathons(
+                registration_status=registration_status,
+                region=region,
+                course=course,
+                race_search_start_date=month_start,
+                race_search_end_date=month_end,
+                limit=limit,
+                after=after,
+                fields=fields,
+            )
+
+    async def get_marathon_batch(self, queries: list[MarathonQuery]) -> list[list[MarathonInfo]]:
+        """MarathonService.get_marathon_batch와 같은 결과를 AsyncSession 하나로 조회"""
+        now = datetime.now()
+        async with self.uow.new() as uow:
+            return [await getattr(uow.marathon_repository, method)(**kwargs)
+                    for method, kwargs in (batch_query_call(query, now) for query in queries)]
+
+    async def search_marathons(self, q: str, limit: int = 20,
+                               fields: tuple[str, ...] | None = None) -> list[MarathonInfo]:
+        async with self.uow.new() as uow:
+            return await uow.marathon_repository.search(q, limit, fields)
+
+    async def get_digest(self, name: str, now: datetime | None = None) -> str | None:
+        async with self.uow.new() as uow:
+            return digest_payload(await uow.digest_repository.get(name), now or datetime.now())
+
+
+@dataclass
+class RecipientSyncResult:
+    inserted: int = 0
+    updated: int = 0
+    deleted: int = 0
+    unchanged: int = 0
+    duplicates: int = 0
+    invalid: list[dict] = field(default_factory=list)
+    # 주소록에 유효한 수신자가 없어서 삭제를 건너뛰었는지
+    deletion_skipped: bool = False
+
+    @property
+    def writes(self) -> int:
+        return self.inserted + self.updated + self.deleted
+
 
 class RecipientService:
     def __init__(self, uow: AbstractUnitOfWork):
@@ -77,6 +342,49 @@ class RecipientService:
             uow.recipient_repository.save(recipient)
             uow.commit()
 
+    def sync_recipients(self, recipients: list[dict], delete_missing: bool = True) -> RecipientSyncResult:
+        """주소록 전체를 저장된 수신자와 비교해서 바뀐 수신자만 반영 (한 트랜잭션)
+
+        전화번호는 E.164로 정규화해서 비교하고, 같은 번호가 여러 번 나오면 마지막 행의 이름을 사용한다.
+        delete_missing이면 주소록에 없는 수신자는 삭제한다. 단, 유효한 수신자가 하나도 없으면
+        (시트를 일시적으로 읽지 못한 경우 등) 전체 삭제를 막기 위해 삭제하지 않는다.
+        """
+        result = RecipientSyncResult()
+        names_by_phone = {}
+        for recipient in recipients:
+            phone_number = normalize_phone_number(recipient.get('phone_number'))
+            if phone_number is None:
+                result.invalid.append(recipient)
+                continue
+            if phone_number in names_by_phone:
+                result.duplicates += 1
+            names_by_phone[phone_number] = recipient.get('name')
+
+        if delete_missing and not names_by_phone:
+            delete_missing = False
+            result.deletion_skipped = True
+
+        with self.uow as uow:
+            stored = uow.recipient_repository.get_phone_index()
+            inserts, updates = [], []
+            for phone_number, name in names_by_phone.items():
+                if phone_number not in stored:
+                    inserts.append({'name': name, 'phone_number': phone_number})
+                elif stored[phone_number][1] != name:
+                    updates.append({'id': stored[phone_number][0], 'name': name})
+            deletes = [recipient_id for phone_number, (recipient_id, _) in stored.items()
+                       if delete_missing and phone_number not in names_by_phone]
+
+            uow.recipient_repository.bulk_insert(inserts)
+            uow.recipient_repository.bulk_update(updates)
+            uow.recipient_repository.delete_by_ids(deletes)
+
+            result.inserted, result.updated, result.deleted = len(inserts), len(updates), len(deletes)
+            result.unchanged = len(names_by_phone) - len(inserts) - len(updates)
+            if result.writes:
+                uow.commit()
+        return result
+
     def get_recipients(self):
         with self.uow as uow:
             recipients = uow.recipient_repository.get_all()
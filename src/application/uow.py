@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from src.domain.repository import AbstractRepository
+from src.domain.repository import AbstractReadRepository, AbstractRepository
 
 class AbstractUnitOfWork(ABC):
     marathon_repository: AbstractRepository
@@ -11,6 +11,10 @@ class AbstractUnitOfWork(ABC):
     def __exit__(self, *args):
        self.rollback()
 
+    def new(self) -> 'AbstractUnitOfWork':
+        """같은 설정이지만 상태를 공유하지 않는 UoW (응답을 스트리밍하는 동안 열려 있어야 하는 조회용)"""
+        raise NotImplementedError
+
     @abstractmethod
     def commit(self):
         """변경사항 커밋"""
@@ -19,4 +23,27 @@ class AbstractUnitOfWork(ABC):
     @abstractmethod
     def rollback(self):
         """변경사항 롤백"""
-        raise NotImplementedError
\ No newline at end of file
+        raise NotImplementedError
+
+
+class AbstractAsyncUnitOfWork(ABC):
+    """asyncio 핸들러용 UoW (`async with uow:`)"""
+    marathon_repository: AbstractReadRepository
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.rollback()
+
+    def new(self) -> 'AbstractAsyncUnitOfWork':
+        """같은 설정이지만 세션을 공유하지 않는 UoW (동시에 처리하는 요청마다 하나씩)"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def commit(self):
+        raise NotImplementedError
+
+    @abstractmethod
+    async def rollback(self):
+        raise NotImplementedError
@@ -23,6 +23,7 @@ class Region(str, Enum):
     CHUNGBUK = "충북"
     CHUNGNAM = "충남"
     DAEJEON = "대전"
+    SEJONG = "세종"
     JEONBUK = "전북"
     JEONNAM = "전남"
     GWANGJU = "광주"
@@ -36,11 +37,13 @@ class Region(str, Enum):
     OTHER = "기타"
     
 class MarathonInfo(BaseModel):
+    id: int | None = None
     title: str
     race_date: datetime
     location: str
-    courses: list[int] = Field(default_factory=list)
-    homepage: str
+    region: Region | None = None
+    courses: list[Course] = Field(default_factory=list)
+    homepage: str | None = None
     organization_name: str
     registration_start_date: datetime
     registration_end_date: datetime
@@ -0,0 +1,32 @@
+import re
+
+DEFAULT_COUNTRY_CODE = '82'
+_NON_DIGIT_PATTERN = re.compile(r'\D')
+
+
+def normalize_phone_number(phone_number: str | None, country_code: str = DEFAULT_COUNTRY_CODE) -> str | None:
+    """전화번호를 E.164 형식(+821012345678)으로 정규화 (해석할 수 없으면 None)
+
+    '010-1234-5678', '+82 010-1234-5678', '821012345678', '0082...' 형식을 모두 같은 번호로 본다.
+    """
+    if not phone_number:
+        return None
+    raw = phone_number.strip()
+    digits = _NON_DIGIT_PATTERN.sub('', raw)
+
+    if raw.startswith('+'):
+        pass
+    elif digits.startswith('00'):
+        digits = digits[2:]
+    elif digits.startswith('0'):
+        digits = country_code + digits[1:]
+    elif not digits.startswith(country_code):
+        digits = country_code + digits
+    # '+82 010-...'처럼 국가 코드 뒤에 남은 국내 식별 번호 0은 제거
+    if digits.startswith(country_code + '0'):
+        digits = country_code + digits[len(country_code) + 1:]
+
+    # E.164는 국가 코드를 포함해 최대 15자리
+    if not 8 <= len(digits) <= 15:
+        return None
+    return '+' + digits
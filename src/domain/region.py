@@ -0,0 +1,108 @@
+import re
+from functools import lru_cache
+
+from src.domain.models import Region
+
+# 시/도 이름 (행정구역 접미사를 뗀 형태)
+PROVINCE_ALIASES = {
+    '서울': Region.SEOUL,
+    '경기': Region.GYEONGGI,
+    '인천': Region.INCHEON,
+    '강원': Region.GANGWON,
+    '충북': Region.CHUNGBUK,
+    '충청북': Region.CHUNGBUK,
+    '충남': Region.CHUNGNAM,
+    '충청남': Region.CHUNGNAM,
+    '대전': Region.DAEJEON,
+    '세종': Region.SEJONG,
+    '전북': Region.JEONBUK,
+    '전라북': Region.JEONBUK,
+    '전남': Region.JEONNAM,
+    '전라남': Region.JEONNAM,
+    '광주': Region.GWANGJU,
+    '경북': Region.GYEONGBUK,
+    '경상북': Region.GYEONGBUK,
+    '대구': Region.DAEGU,
+    '경남': Region.GYEONGNAM,
+    '경상남': Region.GYEONGNAM,
+    '부산': Region.BUSAN,
+    '울산': Region.ULSAN,
+    '제주': Region.JEJU,
+    '서귀포': Region.JEJU,
+}
+
+# 시/도 없이 시/군 이름으로 시작하는 장소 (대회가 자주 열리는 곳 위주)
+CITY_REGIONS = {
+    Region.GYEONGGI: ('수원', '고양', '일산', '성남', '분당', '용인', '부천', '안산', '안양', '화성', '평택',
+                      '의정부', '파주', '김포', '광명', '하남', '시흥', '군포', '오산', '이천', '안성', '구리',
+                      '남양주', '양주', '포천', '여주', '동두천', '과천', '의왕', '양평', '가평', '연천'),
+    Region.GANGWON: ('춘천', '원주', '강릉', '동해', '태백', '속초', '삼척', '홍천', '횡성', '영월', '평창',
+                     '정선', '철원', '화천', '양구', '인제', '고성', '양양'),
+    Region.CHUNGBUK: ('청주', '충주', '제천', '보은', '옥천', '영동', '증평', '진천', '괴산', '음성', '단양'),
+    Region.CHUNGNAM: ('천안', '공주', '보령', '아산', '서산', '논산', '계룡', '당진', '금산', '부여', '서천',
+                      '청양', '홍성', '예산', '태안'),
+    Region.JEONBUK: ('전주', '군산', '익산', '정읍', '남원', '김제', '완주', '진안', '무주', '장수', '임실',
+                     '순창', '고창', '부안'),
+    Region.JEONNAM: ('목포', '여수', '순천', '나주', '광양', '담양', '곡성', '구례', '고흥', '보성', '화순',
+                     '장흥', '강진', '해남', '영암', '무안', '함평', '영광', '장성', '완도', '진도', '신안'),
+    Region.GYEONGBUK: ('포항', '경주', '김천', '안동', '구미', '영주', '영천', '상주', '문경', '경산', '의성',
+                       '청송', '영양', '영덕', '청도', '고령', '성주', '칠곡', '예천', '봉화', '울진', '울릉'),
+    Region.GYEONGNAM: ('창원', '마산', '진해', '진주', '통영', '사천', '김해', '밀양', '거제', '양산', '의령',
+                       '함안', '창녕', '남해', '하동', '산청', '함양', '거창', '합천'),
+}
+CITY_ALIASES = {city: region for region, cities in CITY_REGIONS.items() for city in cities}
+
+OVERSEAS_KEYWORDS = ('해외', '일본', '중국', '대만', '홍콩', '베트남', '태국', '필리핀', '싱가포르', '말레이시아',
+                     '몽골', '미국', '캐나다', '호주', '뉴질랜드', '프랑스', '독일', '영국', '스페인', '이탈리아')
+
+# 시/도 이름으로 시작하지만 지역이 아닌 단어 ('경기장')
+NON_REGION_WORDS = ('경기장',)
+
+_ADMINISTRATIVE_SUFFIX_PATTERN = re.compile(r'(특별자치시|특별자치도|특별시|광역시|자치도|도|시|군|구)$')
+_TOKEN_PATTERN = re.compile(r'[\s,/()\[\]]+')
+
+
+def _strip_suffix(token: str) -> str:
+    stripped = _ADMINISTRATIVE_SUFFIX_PATTERN.sub('', token)
+    return stripped if len(stripped) >= 2 else token
+
+
+@lru_cache(maxsize=4096)
+def classify_region(location: str | None) -> Region:
+    """자유 형식 장소('대전 금산인삼 엑스포주차장')를 Region으로 분류 (알 수 없으면 Region.OTHER)
+
+    앞쪽 단어부터 시/도 → 시/군 → 해외 순서로 찾고, 없으면 시/도 이름으로 시작하는 단어를 찾는다.
+    """
+    if not location:
+        return Region.OTHER
+    tokens = [token for token in _TOKEN_PATTERN.split(location.strip()) if token]
+
+    for token in tokens:
+        name = _strip_suffix(token)
+        if name in PROVINCE_ALIASES:
+            return PROVINCE_ALIASES[name]
+        if name in CITY_ALIASES:
+            return CITY_ALIASES[name]
+        if any(token.startswith(keyword) for keyword in OVERSEAS_KEYWORDS):
+            return Region.OVERSEAS
+
+    # '서울올림픽공원'처럼 단어 앞에 붙은 시/도 이름 (단어 중간의 '경기장' 등은 무시)
+    for token in tokens:
+        if token.startswith(NON_REGION_WORDS):
+            continue
+        for alias, region in PROVINCE_ALIASES.items():
+            if token.startswith(alias):
+                return region
+    return Region.OTHER
+
+
+def parse_region(value: Region | str) -> Region:
+    """API/검색 조건의 지역 값 ('서울', 'SEOUL', '서울특별시')을 Region으로 변환"""
+    if isinstance(value, Region):
+        return value
+    if value in Region.__members__:
+        return Region[value]
+    try:
+        return Region(value)
+    except ValueError:
+        return classify_region(value)
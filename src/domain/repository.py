@@ -1,7 +1,11 @@
 from abc import ABC, abstractmethod
 
 
-class AbstractRepository(ABC):
+class AbstractReadRepository(ABC):
+    """조회만 하는 repository (asyncio 조회 경로 등 저장을 지원하지 않는 구현)"""
+
+
+class AbstractRepository(AbstractReadRepository):
     @abstractmethod
     def save(self):
         pass
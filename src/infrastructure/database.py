@@ -1,16 +1,178 @@
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, event, make_url, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 from sqlalchemy.orm import Session
 from sqlalchemy.orm import declarative_base
-from config import get_settings
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, QueuePool
+from config import Settings, get_settings
+from dataclasses import dataclass, field
+from functools import lru_cache
 
 import boto3
 import json
+import threading
+import time
 
 settings = get_settings()
 Base = declarative_base()
-engine = create_engine(settings.SQLALCHEMY_DATABASE_URL,
-                           connect_args={'client_encoding': 'utf8'})
-Base.metadata.create_all(bind=engine)
+
+
+@dataclass
+class PoolStats:
+    """커넥션 풀 사용량 (풀 크기를 정할 때 참고)"""
+    checkouts: int = 0
+    errors: int = 0  # 풀 timeout, 연결 실패
+    in_use: int = 0
+    peak_in_use: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+    capacity: int | None = None  # pool_size + max_overflow (NullPool은 제한 없음)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def record_checkout(self, wait: float):
+        with self._lock:
+            self.checkouts += 1
+            self.in_use += 1
+            self.peak_in_use = max(self.peak_in_use, self.in_use)
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+
+    def record_error(self):
+        with self._lock:
+            self.errors += 1
+
+    def record_checkin(self):
+        with self._lock:
+            self.in_use -= 1
+
+    def as_dict(self) -> dict:
+        return dict(
+            checkouts=self.checkouts,
+            errors=self.errors,
+            in_use=self.in_use,
+            peak_in_use=self.peak_in_use,
+            capacity=self.capacity,
+            peak_utilization=self.peak_in_use / self.capacity if self.capacity else None,
+            avg_wait_ms=self.total_wait / self.checkouts * 1000 if self.checkouts else 0.0,
+            max_wait_ms=self.max_wait * 1000,
+        )
+
+
+class _InstrumentedPool:
+    """커넥션을 받을 때까지 걸린 시간(풀 대기 + 새 연결 생성)을 stats에 기록"""
+    stats: PoolStats
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            connection = super().connect()
+        except Exception:
+            self.stats.record_error()
+            raise
+        self.stats.record_checkout(time.perf_counter() - start)
+        return connection
+
+    def recreate(self):
+        # engine.dispose()로 풀을 다시 만들어도 통계는 이어서 기록
+        pool = super().recreate()
+        pool.stats = self.stats
+        return pool
+
+
+class InstrumentedQueuePool(_InstrumentedPool, QueuePool):
+    pass
+
+
+class InstrumentedNullPool(_InstrumentedPool, NullPool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(_InstrumentedPool, AsyncAdaptedQueuePool):
+    pass
+
+
+def _pool_options(settings: Settings, queue_pool) -> dict:
+    """Settings의 풀 설정 (DB_NULL_POOL이면 커넥션을 유지하지 않음 - Lambda용)"""
+    if settings.DB_NULL_POOL:
+        return dict(poolclass=InstrumentedNullPool)
+    return dict(poolclass=queue_pool,
+                pool_size=settings.DB_POOL_SIZE,
+                max_overflow=settings.DB_MAX_OVERFLOW,
+                pool_timeout=settings.DB_POOL_TIMEOUT,
+                pool_recycle=settings.DB_POOL_RECYCLE,
+                pool_pre_ping=settings.DB_POOL_PRE_PING)
+
+
+def _instrument(engine: Engine, settings: Settings):
+    capacity = None if settings.DB_NULL_POOL else settings.DB_POOL_SIZE + settings.DB_MAX_OVERFLOW
+    engine.pool.stats = PoolStats(capacity=capacity)
+    event.listen(engine, 'checkin', lambda dbapi_connection, connection_record: engine.pool.stats.record_checkin())
+
+
+def create_db_engine(url: str, settings: Settings = settings) -> Engine:
+    connect_args = {'client_encoding': 'utf8'} if url.startswith('postgresql') else {}
+    engine = create_engine(url, connect_args=connect_args, **_pool_options(settings, InstrumentedQueuePool))
+    _instrument(engine, settings)
+    return engine
+
+
+def async_database_url(url: str) -> str:
+    """동기 드라이버 URL을 asyncio 드라이버 URL로 변환 (postgresql → asyncpg, sqlite → aiosqlite)"""
+    url = make_url(url)
+    drivers = {'postgresql': 'postgresql+asyncpg', 'sqlite': 'sqlite+aiosqlite'}
+    return url.set(drivername=drivers.get(url.get_backend_name(), url.drivername))\
+        .render_as_string(hide_password=False)
+
+
+def create_async_db_engine(url: str, settings: Settings = settings) -> AsyncEngine:
+    engine = create_async_engine(async_database_url(url), **_pool_options(settings, InstrumentedAsyncQueuePool))
+    _instrument(engine.sync_engine, settings)
+    return engine
+
+
+@lru_cache()
+def get_engine() -> Engine:
+    """프로세스에서 공유하는 엔진 (처음 사용할 때 생성)"""
+    return create_db_engine(settings.SQLALCHEMY_DATABASE_URL)
+
+
+@lru_cache()
+def get_read_engine() -> Engine:
+    """조회용 엔진 (복제본 URL이 없으면 기본 엔진을 같이 사용)"""
+    if not settings.SQLALCHEMY_READ_DATABASE_URL:
+        return get_engine()
+    return create_db_engine(settings.SQLALCHEMY_READ_DATABASE_URL)
+
+
+@lru_cache()
+def get_async_engine() -> AsyncEngine:
+    """API 핸들러에서 쓰는 asyncio 엔진 (복제본 URL이 있으면 복제본에 연결)"""
+    return create_async_db_engine(settings.SQLALCHEMY_READ_DATABASE_URL or settings.SQLALCHEMY_DATABASE_URL)
+
+
+def pool_stats() -> dict:
+    """지금까지 만든 엔진의 풀 사용량"""
+    stats = {}
+    if get_engine.cache_info().currsize:
+        stats['primary'] = get_engine().pool.stats.as_dict()
+    if get_read_engine.cache_info().currsize and get_read_engine() is not get_engine():
+        stats['read'] = get_read_engine().pool.stats.as_dict()
+    if get_async_engine.cache_info().currsize:
+        stats['async'] = get_async_engine().pool.stats.as_dict()
+    return stats
+
+
+def dispose_engines():
+    for get in (get_read_engine, get_engine):
+        if get.cache_info().currsize:
+            get().dispose()
+        get.cache_clear()
+
+
+async def dispose_async_engine():
+    if get_async_engine.cache_info().currsize:
+        await get_async_engine().dispose()
+    get_async_engine.cache_clear()
 
 def get_secret():
     """AWS Secrets Manager에서 데이터베이스 자격 증명 가져오기"""
@@ -36,8 +198,8 @@ def create_database():
     # 기본 postgres DB에 연결
     DEFAULT_DATABASE_URL = f"postgresql://{settings.DB_USER}:{settings.DB_PASSWORD}@{settings.DB_HOST}:{settings.DB_PORT}/postgres"
     try:
-        # 먼저 postgres DB에 연결
-        engine = create_engine(DEFAULT_DATABASE_URL)
+        # 먼저 postgres DB에 연결 (한 번만 쓰므로 풀 없이)
+        engine = create_engine(DEFAULT_DATABASE_URL, poolclass=NullPool)
         with engine.connect() as conn:
             # 현재 트랜잭션 종료
             conn.execute(text("commit"))
@@ -58,30 +220,21 @@ def create_database():
 
 
 def init_tables():
-    # marathon_db에 연결하는 엔진 생성
-    engine = create_engine(settings.SQLALCHEMY_DATABASE_URL)
+    """marathon_db에 아직 적용하지 않은 스키마 마이그레이션을 실행"""
+    from src.infrastructure.migrations import run_migrations
+
     try:
-        # 테이블 생성
-        Base.metadata.create_all(bind=engine)
+        run_migrations(get_engine())
         print("Tables created successfully")
     except Exception as e:
         print(f"Error creating tables: {e}")
         raise e
-    finally:
-        engine.dispose()
 
 
 # Dependency
 def get_db():
-    engine = create_engine(settings.SQLALCHEMY_DATABASE_URL,
-                           connect_args={'client_encoding': 'utf8'})
-    
-    db = Session(engine)
+    db = Session(get_engine())
     try:
         yield db
     finally:
         db.close()
-
-
-
-
@@ -0,0 +1,237 @@
+"""marathon 테이블 스키마 마이그레이션
+
+적용한 버전은 schema_migrations 테이블에 기록하고, 아직 적용하지 않은 마이그레이션만
+버전 순서대로 각각 하나의 트랜잭션에서 실행한다.
+버전 기록이 없던 기존 DB(create_all로 만든 DB)에도 적용할 수 있도록
+모든 마이그레이션은 이미 반영된 상태에서 다시 실행해도 안전하게 작성한다.
+
+    python -m src.infrastructure.migrations          # 마이그레이션 적용
+    python -m src.infrastructure.migrations --status # 적용 상태 확인
+"""
+import argparse
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, List
+
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, bindparam, inspect, select, text
+from sqlalchemy.engine import Connection, Engine
+
+from src.infrastructure.database import Base, dispose_engines, get_engine
+from src.domain.region import classify_region
+from src.infrastructure.models import (Course, DataVersionDB, MarathonDigestDB, MarathonInfoDB, RecipientDB,
+                                       marathon_course_association)
+
+# 여러 Lambda가 동시에 마이그레이션하지 않도록 잡는 Postgres advisory lock 키
+MIGRATION_LOCK_KEY = 7_230_114
+# backfill UPDATE 한 번에 넣는 id 개수
+BACKFILL_CHUNK_SIZE = 500
+
+migration_metadata = MetaData()
+schema_migrations = Table(
+    'schema_migrations',
+    migration_metadata,
+    Column('version', Integer, primary_key=True),
+    Column('description', String),
+    Column('applied_at', DateTime),
+)
+
+
+@dataclass
+class Migration:
+    version: int
+    description: str
+    upgrade: Callable[[Connection], None]
+
+
+MIGRATIONS: List[Migration] = []
+
+
+def migration(version: int, description: str):
+    def register(upgrade: Callable[[Connection], None]):
+        MIGRATIONS.append(Migration(version, description, upgrade))
+        return upgrade
+    return register
+
+
+def add_column_if_missing(conn: Connection, table: str, column: str, column_type: str):
+    if column not in {c['name'] for c in inspect(conn).get_columns(table)}:
+        conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {column} {column_type}"))
+
+
+def create_index(conn: Connection, name: str, table: str, columns: List[str], unique: bool = False):
+    conn.execute(text(f"CREATE {'UNIQUE ' if unique else ''}INDEX IF NOT EXISTS {name} "
+                      f"ON {table} ({', '.join(columns)})"))
+
+
+@migration(1, "기본 테이블 생성")
+def create_base_tables(conn: Connection):
+    Base.metadata.create_all(conn, tables=[
+        RecipientDB.__table__,
+        Course.__table__,
+        MarathonInfoDB.__table__,
+        marathon_course_association,
+    ])
+
+
+@migration(2, "증분 크롤링 컬럼 (roadrun_no, list_row_hash)")
+def add_roadrun_columns(conn: Connection):
+    add_column_if_missing(conn, 'marathon_info', 'roadrun_no', 'INTEGER')
+    add_column_if_missing(conn, 'marathon_info', 'list_row_hash', 'VARCHAR')
+    create_index(conn, 'ix_marathon_info_roadrun_no', 'marathon_info', ['roadrun_no'])
+
+
+@migration(3, "대회명/대회일 unique index (중복 마라톤은 id가 가장 작은 행만 남김)")
+def add_title_race_date_unique(conn: Connection):
+    duplicate_ids = ("SELECT id FROM marathon_info m WHERE id > ("
+                     "SELECT MIN(d.id) FROM marathon_info d "
+                     "WHERE d.title = m.title AND d.race_date = m.race_date)")
+    conn.execute(text(f"DELETE FROM marathon_course_association WHERE marathon_id IN ({duplicate_ids})"))
+    conn.execute(text(f"DELETE FROM marathon_info WHERE id IN ({duplicate_ids})"))
+    create_index(conn, 'uq_marathon_info_title_race_date', 'marathon_info', ['title', 'race_date'], unique=True)
+
+
+@migration(4, "조회 조건(대회일, 접수기간, 장소)과 코스 연결 테이블 index")
+def add_query_indexes(conn: Connection):
+    create_index(conn, 'ix_marathon_info_race_date', 'marathon_info', ['race_date'])
+    create_index(conn, 'ix_marathon_info_registration_period', 'marathon_info',
+                 ['registration_start_date', 'registration_end_date'])
+    create_index(conn, 'ix_marathon_info_location', 'marathon_info', ['location'])
+    create_index(conn, 'ix_marathon_course_association_marathon_id', 'marathon_course_association',
+                 ['marathon_id', 'course_id'])
+    create_index(conn, 'ix_marathon_course_association_course_id', 'marathon_course_association', ['course_id'])
+
+
+@migration(5, "수신자 전화번호 unique index (중복 수신자는 id가 가장 작은 행만 남김)")
+def add_recipient_phone_unique(conn: Connection):
+    conn.execute(text("DELETE FROM recipient WHERE id IN ("
+                      "SELECT id FROM recipient r WHERE id > ("
+                      "SELECT MIN(d.id) FROM recipient d WHERE d.phone_number = r.phone_number))"))
+    create_index(conn, 'ix_recipient_phone_number', 'recipient', ['phone_number'], unique=True)
+
+
+def backfill_regions(conn: Connection) -> int:
+    """region이 비어 있는 마라톤의 장소를 분류해서 지역별 UPDATE 한 번씩으로 채움"""
+    ids_by_region = {}
+    for marathon_id, location in conn.execute(text("SELECT id, location FROM marathon_info WHERE region IS NULL")):
+        ids_by_region.setdefault(classify_region(location).value, []).append(marathon_id)
+    statement = text("UPDATE marathon_info SET region = :region WHERE id IN :ids")\
+        .bindparams(bindparam('ids', expanding=True))
+    for region, marathon_ids in ids_by_region.items():
+        for start in range(0, len(marathon_ids), BACKFILL_CHUNK_SIZE):
+            conn.execute(statement, {'region': region, 'ids': marathon_ids[start:start + BACKFILL_CHUNK_SIZE]})
+    return sum(len(marathon_ids) for marathon_ids in ids_by_region.values())
+
+
+@migration(6, "장소에서 분류한 region 컬럼과 index (기존 마라톤 backfill, 장소 index는 제거)")
+def add_region_column(conn: Connection):
+    add_column_if_missing(conn, 'marathon_info', 'region', 'VARCHAR')
+    backfill_regions(conn)
+    create_index(conn, 'ix_marathon_info_region', 'marathon_info', ['region'])
+    conn.execute(text("DROP INDEX IF EXISTS ix_marathon_info_location"))
+
+
+@migration(7, "키셋 페이지네이션용 (race_date, id) index (race_date index 대체)")
+def add_race_date_id_index(conn: Connection):
+    create_index(conn, 'ix_marathon_info_race_date_id', 'marathon_info', ['race_date', 'id'])
+    conn.execute(text("DROP INDEX IF EXISTS ix_marathon_info_race_date"))
+
+
+SEARCH_VECTOR_SQL = ("tsvector GENERATED ALWAYS AS ("
+                     "setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+                     "setweight(to_tsvector('simple', coalesce(location, '')), 'B') || "
+                     "setweight(to_tsvector('simple', coalesce(organization_name, '')), 'C')) STORED")
+SEARCH_FTS_COLUMNS = 'title, location, organization_name'
+
+
+@migration(8, "마라톤 검색 index (Postgres tsvector + GIN, SQLite FTS5)")
+def add_search_index(conn: Connection):
+    if conn.dialect.name == 'postgresql':
+        add_column_if_missing(conn, 'marathon_info', 'search_vector', SEARCH_VECTOR_SQL)
+        conn.execute(text("CREATE INDEX IF NOT EXISTS ix_marathon_info_search ON marathon_info "
+                          "USING gin (search_vector)"))
+    elif conn.dialect.name == 'sqlite':
+        # marathon_info를 content로 쓰는 FTS5 테이블 - trigger로 변경을 반영
+        conn.execute(text(f"CREATE VIRTUAL TABLE IF NOT EXISTS marathon_info_fts USING fts5("
+                          f"{SEARCH_FTS_COLUMNS}, content='marathon_info', content_rowid='id')"))
+        new_values = 'new.id, new.title, new.location, new.organization_name'
+        old_values = "'delete', old.id, old.title, old.location, old.organization_name"
+        insert_new = f"INSERT INTO marathon_info_fts(rowid, {SEARCH_FTS_COLUMNS}) VALUES ({new_values});"
+        delete_old = (f"INSERT INTO marathon_info_fts(marathon_info_fts, rowid, {SEARCH_FTS_COLUMNS}) "
+                      f"VALUES ({old_values});")
+        for name, action, body in (('ai', 'INSERT', insert_new),
+                                   ('ad', 'DELETE', delete_old),
+                                   ('au', 'UPDATE', delete_old + ' ' + insert_new)):
+            conn.execute(text(f"CREATE TRIGGER IF NOT EXISTS marathon_info_fts_{name} AFTER {action} ON marathon_info "
+                              f"BEGIN {body} END"))
+        conn.execute(text("INSERT INTO marathon_info_fts(marathon_info_fts) VALUES ('rebuild')"))
+
+
+@migration(9, "미리 만든 조회 결과(접수 중, 이번 달) 테이블")
+def create_digest_table(conn: Connection):
+    Base.metadata.create_all(conn, tables=[MarathonDigestDB.__table__])
+
+
+@migration(10, "응답 캐시 무효화용 데이터 버전 테이블")
+def create_data_version_table(conn: Connection):
+    Base.metadata.create_all(conn, tables=[DataVersionDB.__table__])
+
+
+@migration(11, "저장된 마라톤 region 다시 분류 ('경기장'을 경기도로 분류하던 문제)")
+def reclassify_regions(conn: Connection):
+    conn.execute(text("UPDATE marathon_info SET region = NULL"))
+    backfill_regions(conn)
+
+
+def applied_versions(engine: Engine) -> set[int]:
+    with engine.connect() as conn:
+        if not inspect(conn).has_table(schema_migrations.name):
+            return set()
+        return set(conn.execute(select(schema_migrations.c.version)).scalars())
+
+
+def pending_migrations(engine: Engine) -> List[Migration]:
+    applied = applied_versions(engine)
+    return [m for m in sorted(MIGRATIONS, key=lambda m: m.version) if m.version not in applied]
+
+
+def run_migrations(engine: Engine) -> List[int]:
+    """적용하지 않은 마이그레이션을 순서대로 실행하고 적용한 버전 목록을 반환"""
+    migration_metadata.create_all(engine)
+    applied = []
+    for pending in pending_migrations(engine):
+        with engine.begin() as conn:
+            if conn.dialect.name == 'postgresql':
+                conn.execute(text("SELECT pg_advisory_xact_lock(:key)"), {'key': MIGRATION_LOCK_KEY})
+                # lock을 기다리는 동안 다른 프로세스가 적용했을 수 있음
+                already_applied = conn.execute(
+                    select(schema_migrations.c.version).where(schema_migrations.c.version == pending.version)
+                ).first()
+                if already_applied:
+                    continue
+            pending.upgrade(conn)
+            conn.execute(schema_migrations.insert().values(version=pending.version,
+                                                           description=pending.description,
+                                                           applied_at=datetime.now()))
+        print(f"Migration {pending.version} applied: {pending.description}")
+        applied.append(pending.version)
+    return applied
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument('--status', action='store_true', help='적용하지 않은 마이그레이션만 출력')
+    args = arg_parser.parse_args()
+
+    engine = get_engine()
+    try:
+        if args.status:
+            for pending in pending_migrations(engine):
+                print(f"pending {pending.version}: {pending.description}")
+        else:
+            run_migrations(engine)
+    finally:
+        dispose_engines()
+
+
+if __name__ == '__main__':
+    main()
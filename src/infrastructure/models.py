@@ -1,7 +1,8 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime
-from sqlalchemy.orm import relationship
-from src.domain.models import MarathonInfo, Recipient
-from sqlalchemy import Table, ForeignKey
+from sqlalchemy import Column, Integer, String, Float, DateTime, Text
+from sqlalchemy.orm import relationship, validates
+from src.domain.models import Course as CourseInfo, MarathonInfo, Recipient
+from src.domain.region import classify_region
+from sqlalchemy import Table, ForeignKey, Index
 from .database import Base
 import re
 
@@ -9,7 +10,8 @@ class RecipientDB(Base):
     __tablename__ = 'recipient'
     id = Column(Integer, primary_key=True)
     name = Column(String)
-    phone_number = Column(String)
+    # E.164 형식 (src.domain.phone.normalize_phone_number)
+    phone_number = Column(String, unique=True, index=True)
 
     def to_pydantic(self):
         return Recipient(
@@ -29,7 +31,9 @@ marathon_course_association = Table(
     'marathon_course_association',
     Base.metadata,
     Column('marathon_id', Integer, ForeignKey('marathon_info.id')),
-    Column('course_id', Integer, ForeignKey('course.id'))
+    Column('course_id', Integer, ForeignKey('course.id')),
+    Index('ix_marathon_course_association_marathon_id', 'marathon_id', 'course_id'),
+    Index('ix_marathon_course_association_course_id', 'course_id'),
 )
 
 
@@ -61,28 +65,48 @@ class Course(Base):
 
 class MarathonInfoDB(Base):
     __tablename__ = "marathon_info"
+    # 스키마 변경은 src/infrastructure/migrations.py에도 같은 이름으로 추가
+    __table_args__ = (
+        Index('uq_marathon_info_title_race_date', 'title', 'race_date', unique=True),
+        Index('ix_marathon_info_race_date_id', 'race_date', 'id'),
+        Index('ix_marathon_info_registration_period', 'registration_start_date', 'registration_end_date'),
+        Index('ix_marathon_info_region', 'region'),
+    )
     id = Column(Integer, primary_key=True)
     title = Column(String)
     race_date = Column(DateTime)
     location = Column(String)
+    # location에서 분류한 Region 값 ('서울', '경기', ...) - 지역 조회 조건
+    region = Column(String)
     homepage = Column(String)
     courses = relationship(
         Course,
         secondary = marathon_course_association,
+        order_by = Course.distance,
     )
     organization_name = Column(String)
     registration_start_date = Column(DateTime)
     registration_end_date = Column(DateTime)
+    # roadrun view.php?no=N 번호와 목록 페이지 행 해시 (증분 크롤링용)
+    roadrun_no = Column(Integer, nullable=True, index=True)
+    list_row_hash = Column(String, nullable=True)
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
+    @validates('location')
+    def _classify_region(self, key, location):
+        self.region = classify_region(location).value
+        return location
+
     def to_pydantic(self):
         return MarathonInfo(
+            id=self.id,
             title=self.title,
             race_date=self.race_date,
             location=self.location,
-            course=[course.distance for course in self.courses],
+            region=self.region,
+            courses=[CourseInfo.model_validate(course) for course in self.courses],
             homepage=self.homepage,
             organization_name=self.organization_name,
             registration_start_date=self.registration_start_date,
@@ -97,3 +121,22 @@ class MarathonInfoDB(Base):
                 setattr(instance, key, value)
         return instance
 
+
+class MarathonDigestDB(Base):
+    """수집이 끝날 때 미리 만들어 두는 조회 결과 (MarathonInfo 목록 JSON)"""
+    __tablename__ = 'marathon_digest'
+    # 'open-registration', 'this-month' (src.application.services.DIGEST_*)
+    name = Column(String, primary_key=True)
+    payload = Column(Text)
+    item_count = Column(Integer)
+    built_at = Column(DateTime)
+    # 이 시각부터는 목록이 달라지므로 (접수 마감/시작, 다음 달) 다시 조회
+    valid_until = Column(DateTime, nullable=True)
+
+
+class DataVersionDB(Base):
+    """수집 결과가 반영될 때마다 올라가는 버전 (API 응답 캐시 무효화)"""
+    __tablename__ = 'data_version'
+    name = Column(String, primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime)
@@ -1,26 +1,50 @@
+from functools import lru_cache
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlalchemy.orm import Session, sessionmaker
-from sqlalchemy import create_engine
 
-from src.application.uow import AbstractUnitOfWork
-from src.adapters.outbound.repository import MarathonRepository, RecipientRepository
-from config import get_settings
+from src.application.uow import AbstractAsyncUnitOfWork, AbstractUnitOfWork
+from src.adapters.outbound.repository import (AsyncMarathonDigestRepository, AsyncMarathonRepository,
+                                              MarathonDigestRepository, MarathonRepository, RecipientRepository)
+from src.adapters.outbound.course_cache import CourseCache
+from src.infrastructure.database import get_async_engine, get_engine, get_read_engine
+
+
+@lru_cache()
+def default_session_factory() -> sessionmaker:
+    return sessionmaker(bind=get_engine())
+
+
+@lru_cache()
+def read_session_factory() -> sessionmaker:
+    return sessionmaker(bind=get_read_engine(), autoflush=False, expire_on_commit=False)
 
-settings = get_settings()
 
-DEFAULT_SESSION_FACTORY = sessionmaker(bind=create_engine(
-        settings.SQLALCHEMY_DATABASE_URL,
-        connect_args={'client_encoding': 'utf8'}
-))
+@lru_cache()
+def async_session_factory() -> async_sessionmaker:
+    return async_sessionmaker(bind=get_async_engine(), autoflush=False, expire_on_commit=False)
+
 
 class SqlAlchemyUnitOfWork(AbstractUnitOfWork):
-    def __init__(self, session_factory=DEFAULT_SESSION_FACTORY):
-        self.session_factory = session_factory
+    def __init__(self, session_factory: sessionmaker | None = None, course_cache: CourseCache | None = None):
+        # 지정하지 않으면 처음 트랜잭션을 열 때 공유 엔진을 만듦
+        self._session_factory = session_factory
+        # 같은 UoW로 여는 트랜잭션끼리 코스 캐시를 공유
+        self.course_cache = course_cache or CourseCache()
         self._session = None
 
+    @property
+    def session_factory(self) -> sessionmaker:
+        return self._session_factory or default_session_factory()
+
+    def new(self) -> 'SqlAlchemyUnitOfWork':
+        return SqlAlchemyUnitOfWork(self._session_factory, self.course_cache)
+
     def __enter__(self) -> Session:
         self._session = self.session_factory()
-        self.marathon_repository = MarathonRepository(self._session)
+        self.marathon_repository = MarathonRepository(self._session, self.course_cache)
         self.recipient_repository = RecipientRepository(self._session)
+        self.digest_repository = MarathonDigestRepository(self._session)
         return super().__enter__()
 
     def __exit__(self, *args):
@@ -29,6 +53,101 @@ class SqlAlchemyUnitOfWork(AbstractUnitOfWork):
 
     def commit(self):
         self._session.commit()
+        self.course_cache.add(self.marathon_repository.pending_course_ids)
+        self.marathon_repository.pending_course_ids = {}
 
     def rollback(self):
-        self._session.rollback()
\ No newline at end of file
+        self._session.rollback()
+        self.marathon_repository.pending_course_ids = {}
+
+
+
+class ReadOnlyUnitOfWork(AbstractUnitOfWork):
+    """조회 전용 UoW (API 요청 하나 동안 세션 하나를 사용)
+
+    중첩해서 열 수 있어서, 요청 시작 시 한 번 열어 두면 서비스 메서드의 `with uow`는 같은 세션을 쓴다.
+    쓰기를 하지 않으므로 종료 시 rollback 없이 세션만 닫아 연결을 풀에 돌려준다.
+    """
+
+    def __init__(self, session_factory: sessionmaker | None = None):
+        self._session_factory = session_factory
+        self._session = None
+        self._depth = 0
+        self._marathon_repository = None
+        self._recipient_repository = None
+        self._digest_repository = None
+
+    @property
+    def session_factory(self) -> sessionmaker:
+        return self._session_factory or read_session_factory()
+
+    def new(self) -> 'ReadOnlyUnitOfWork':
+        return ReadOnlyUnitOfWork(self._session_factory)
+
+    @property
+    def marathon_repository(self) -> MarathonRepository:
+        if self._marathon_repository is None:
+            self._marathon_repository = MarathonRepository(self._session)
+        return self._marathon_repository
+
+    @property
+    def recipient_repository(self) -> RecipientRepository:
+        if self._recipient_repository is None:
+            self._recipient_repository = RecipientRepository(self._session)
+        return self._recipient_repository
+
+    @property
+    def digest_repository(self) -> MarathonDigestRepository:
+        if self._digest_repository is None:
+            self._digest_repository = MarathonDigestRepository(self._session)
+        return self._digest_repository
+
+    def __enter__(self) -> 'ReadOnlyUnitOfWork':
+        if self._depth == 0:
+            self._session = self.session_factory()
+        self._depth += 1
+        return self
+
+    def __exit__(self, *args):
+        self._depth -= 1
+        if self._depth == 0:
+            self._session.close()
+            self._session = None
+            self._marathon_repository = None
+            self._recipient_repository = None
+            self._digest_repository = None
+
+    def commit(self):
+        raise RuntimeError("읽기 전용 UoW에서는 커밋할 수 없습니다.")
+
+    def rollback(self):
+        pass
+
+
+class AsyncSqlAlchemyUnitOfWork(AbstractAsyncUnitOfWork):
+    def __init__(self, session_factory: async_sessionmaker | None = None):
+        self._session_factory = session_factory
+        self._session: AsyncSession | None = None
+
+    @property
+    def session_factory(self) -> async_sessionmaker:
+        return self._session_factory or async_session_factory()
+
+    def new(self) -> 'AsyncSqlAlchemyUnitOfWork':
+        return AsyncSqlAlchemyUnitOfWork(self._session_factory)
+
+    async def __aenter__(self) -> 'AsyncSqlAlchemyUnitOfWork':
+        self._session = self.session_factory()
+        self.marathon_repository = AsyncMarathonRepository(self._session)
+        self.digest_repository = AsyncMarathonDigestRepository(self._session)
+        return await super().__aenter__()
+
+    async def __aexit__(self, *args):
+        await super().__aexit__(*args)
+        await self._session.close()
+
+    async def commit(self):
+        await self._session.commit()
+
+    async def rollback(self):
+        await self._session.rollback()
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict
+from typing import List, Dict, Iterator, Tuple
 from datetime import datetime
 from src.domain.models import MarathonInfo
 
@@ -9,11 +9,25 @@ class WebCrawlerPort(ABC):
         """웹 크롤링을 수행하고 마라톤 정보 목록을 반환"""
         pass
 
+    def iter_crawl(self, url: str) -> Iterator[Dict]:
+        """마라톤 정보를 파싱되는 대로 하나씩 반환 (기본 구현은 crawl 결과를 순회)"""
+        yield from self.crawl(url)
+
     @abstractmethod
     def preprocess_data(self, marathon_data: Dict) -> Dict:
         """크롤링된 데이터를 도메인 모델에 맞게 전처리"""
         pass
 
+    def preprocess_batch(self, marathon_list: List[Dict]) -> Tuple[List[Dict], List[Dict]]:
+        """여러 마라톤을 전처리하고 (전처리 결과, 필드별 오류 목록)을 반환"""
+        records, errors = [], []
+        for index, marathon in enumerate(marathon_list):
+            try:
+                records.append(self.preprocess_data(marathon))
+            except Exception as e:
+                errors.append(dict(index=index, field=None, value=None, message=str(e)))
+        return records, errors
+
 
 class AddressManagerPort(ABC):
     @abstractmethod
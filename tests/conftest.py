@@ -0,0 +1,72 @@
+"""조회 API/서비스 테스트가 같이 쓰는 fixture
+
+테스트 파일에서 marathons fixture로 저장할 마라톤 목록만 정의하면
+engine(파일 sqlite DB) → marathon_service(목록 저장) 순서로 준비된다.
+"""
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from src.application.services import MarathonService
+from src.infrastructure.migrations import run_migrations
+from src.infrastructure.uow import SqlAlchemyUnitOfWork
+
+
+def marathon_row(title: str, race_date: datetime, **fields) -> dict:
+    """save_marathon_batch에 넘길 마라톤 한 건 (주지 않은 필드는 지금 접수 중인 서울 10km 대회)"""
+    now = datetime.now()
+    return {
+        'title': title,
+        'race_date': race_date,
+        'location': '서울 여의도공원',
+        'homepage': '',
+        'courses': ['10km'],
+        'organization_name': '',
+        'registration_start_date': now - timedelta(days=1),
+        'registration_end_date': now + timedelta(days=1),
+        **fields,
+    }
+
+
+@pytest.fixture
+def make_marathon():
+    return marathon_row
+
+
+@pytest.fixture
+def marathons() -> list[dict]:
+    """marathon_service가 저장할 마라톤 목록 (테스트 파일에서 다시 정의)"""
+    return []
+
+
+@pytest.fixture
+def engine(tmp_path):
+    # TestClient와 스트리밍 응답이 다른 스레드에서 DB를 읽으므로 파일 DB 사용
+    engine = create_engine(f"sqlite:///{tmp_path / 'marathon.db'}")
+    run_migrations(engine)
+    try:
+        yield engine
+    finally:
+        engine.dispose()
+
+
+@pytest.fixture
+def marathon_service(engine, marathons):
+    service = MarathonService(SqlAlchemyUnitOfWork(sessionmaker(bind=engine)))
+    service.save_marathon_batch(marathons)
+    return service
+
+
+@pytest.fixture
+def statements(engine, marathon_service):
+    """marathons를 저장한 뒤 engine에서 실행한 SQL 목록"""
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, 'before_cursor_execute', record)
+    yield statements
+    event.remove(engine, 'before_cursor_execute', record)
@@ -0,0 +1,154 @@
+import json
+from datetime import datetime
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.adapters.inbound.api import MarathonController
+from src.application.services import AsyncMarathonService, MarathonService
+from src.infrastructure.uow import AsyncSqlAlchemyUnitOfWork, ReadOnlyUnitOfWork
+
+
+@pytest.fixture
+def marathons(make_marathon):
+    # 같은 날짜가 여러 개 있어도 (race_date, id)로 순서가 정해져야 함
+    return [make_marathon(f'마라톤 {i:02d}', datetime(2024, 12, 1 + i // 3, 9, 0),
+                          location='서울 여의도공원' if i % 2 else '경기 수원종합운동장',
+                          courses=['10km', '하프'])
+            for i in range(25)]
+
+
+@pytest.fixture
+def client(marathon_service):
+    app = FastAPI()
+    app.include_router(MarathonController(marathon_service).router)
+    return TestClient(app)
+
+
+def test_keyset_pagination_walks_every_marathon_once(client):
+    titles, cursor, pages = [], None, 0
+    while True:
+        params = {'limit': 10, **({'cursor': cursor} if cursor else {})}
+        response = client.get('/api/v1/marathon', params=params)
+        assert response.status_code == 200
+        titles.extend(marathon['title'] for marathon in response.json())
+        pages += 1
+        cursor = response.headers.get('X-Next-Cursor')
+        if cursor is None:
+            break
+
+    assert pages == 3
+    assert titles == [f'마라톤 {i:02d}' for i in range(25)]
+
+
+def test_pagination_keeps_filters(client):
+    first = client.get('/api/v1/marathon', params={'limit': 5, 'region': ['서울']})
+    second = client.get('/api/v1/marathon', params={'limit': 5, 'region': ['서울'],
+                                                    'cursor': first.headers['X-Next-Cursor']})
+
+    marathons = first.json() + second.json()
+    assert len(marathons) == 10
+    assert {marathon['region'] for marathon in marathons} == {'서울'}
+    assert len({marathon['id'] for marathon in marathons}) == 10
+
+
+def test_invalid_cursor_is_rejected(client):
+    response = client.get('/api/v1/marathon', params={'limit': 10, 'cursor': 'not-a-cursor'})
+    assert response.status_code == 400
+
+
+def test_open_registration_is_paginated(client):
+    response = client.get('/api/v1/marathon/open-registration', params={'limit': 20})
+
+    assert len(response.json()) == 20
+    assert 'X-Next-Cursor' in response.headers
+
+
+def test_stream_ndjson(client):
+    response = client.get('/api/v1/marathon/stream', params={'format': 'ndjson', 'region': ['경기']})
+
+    assert response.headers['content-type'].startswith('application/x-ndjson')
+    marathons = [json.loads(line) for line in response.text.splitlines()]
+    assert len(marathons) == 13
+    assert all(marathon['region'] == '경기' for marathon in marathons)
+    assert [course['distance'] for course in marathons[0]['courses']] == [10.0, 21.0975]
+
+
+def test_stream_json_array(client):
+    response = client.get('/api/v1/marathon/stream', params={'format': 'json'})
+
+    assert len(response.json()) == 25
+
+
+def test_iter_marathons_reads_in_chunks(marathon_service):
+    marathons = list(marathon_service.iter_marathon_info(chunk_size=4))
+
+    assert len(marathons) == 25
+    assert all(len(marathon.courses) == 2 for marathon in marathons)
+
+
+@pytest.fixture
+def read_sessions(engine, marathon_service):
+    """읽기 전용 UoW가 연 세션 목록"""
+    sessions = []
+    factory = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+    event.listen(factory, 'after_begin', lambda session, transaction, connection: sessions.append(session))
+    event.listen(factory, 'after_rollback', lambda session: sessions.append('rollback'))
+    return factory, sessions
+
+
+def test_read_scope_uses_one_session_per_request(marathon_service, read_sessions):
+    factory, sessions = read_sessions
+    app = FastAPI()
+    app.include_router(MarathonController(marathon_service,
+                                          read_uow_factory=lambda: ReadOnlyUnitOfWork(factory)).router)
+    client = TestClient(app)
+
+    client.get('/api/v1/marathon', params={'limit': 10})
+    client.get('/api/v1/marathon/this-month')
+
+    assert len(sessions) == 2
+    assert len(set(map(id, sessions))) == 2
+
+
+def test_read_scope_is_not_opened_for_async_service(engine, marathon_service):
+    opened = []
+
+    def read_uow_factory():
+        opened.append(ReadOnlyUnitOfWork(sessionmaker(bind=engine)))
+        return opened[-1]
+
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{engine.url.database}")
+    async_service = AsyncMarathonService(AsyncSqlAlchemyUnitOfWork(async_sessionmaker(bind=async_engine)))
+    app = FastAPI()
+    app.include_router(MarathonController(marathon_service, read_uow_factory=read_uow_factory,
+                                          async_marathon_service=async_service).router)
+
+    with TestClient(app) as client:
+        response = client.get('/api/v1/marathon', params={'limit': 10})
+        client.portal.call(async_engine.dispose)
+
+    assert len(response.json()) == 10
+    assert opened == []
+
+
+def test_read_only_uow_closes_without_rollback(read_sessions):
+    factory, sessions = read_sessions
+    uow = ReadOnlyUnitOfWork(factory)
+    service = MarathonService(uow)
+
+    with uow:
+        assert len(service.get_marathon_info(registration_status=False)) == 25
+        assert len(service.get_marathon_open_registration()) == 25
+        assert uow._session.autoflush is False
+        assert uow._session.expire_on_commit is False
+
+    # 서비스 메서드마다 열고 닫아도 요청 스코프 안에서는 같은 세션 하나, 종료 시 rollback 없음
+    assert len(sessions) == 1
+    assert uow._session is None
+    with pytest.raises(RuntimeError):
+        uow.commit()
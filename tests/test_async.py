@@ -0,0 +1,122 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
+
+from src.adapters.inbound.api import MarathonController
+from src.application.services import AsyncMarathonService, MarathonQuery
+from src.infrastructure.uow import AsyncSqlAlchemyUnitOfWork
+
+
+@pytest.fixture
+def marathons(make_marathon):
+    now = datetime.now()
+    return [make_marathon(f'마라톤 {i:02d}', datetime(now.year, now.month, 1 + i % 20, 9, 0),
+                          location='강원 춘천' if i % 3 else '부산 광안리',
+                          courses=['10km', '하프'] if i % 2 else ['풀'],
+                          registration_end_date=now + timedelta(days=1 if i % 4 else -2))
+            for i in range(30)]
+
+
+@pytest.fixture
+def db_path(engine, marathon_service):
+    return engine.url.database
+
+
+class RecordingSession(Session):
+    """트랜잭션을 시작한 세션을 기록"""
+    began = []
+
+
+event.listen(RecordingSession, 'after_begin',
+             lambda session, transaction, connection: RecordingSession.began.append(session))
+
+
+def run_async(db_path, call):
+    """aiosqlite 엔진으로 call(service)를 실행 (엔진은 같은 이벤트 루프에서 정리)"""
+    async def main():
+        engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
+        try:
+            factory = async_sessionmaker(bind=engine, expire_on_commit=False, sync_session_class=RecordingSession)
+            return await call(AsyncMarathonService(AsyncSqlAlchemyUnitOfWork(factory)))
+        finally:
+            await engine.dispose()
+    return asyncio.run(main())
+
+
+@pytest.mark.parametrize('kwargs', [
+    {'registration_status': False},
+    {'registration_status': True, 'region': ['강원']},
+    {'registration_status': False, 'course': 10},
+    {'registration_status': False, 'limit': 7},
+])
+def test_async_marathon_info_matches_sync(db_path, marathon_service, kwargs):
+    async def call(service):
+        return await service.get_marathon_info(**kwargs)
+
+    assert run_async(db_path, call) == marathon_service.get_marathon_info(**kwargs)
+
+
+def test_async_open_registration_and_this_month_match_sync(db_path, marathon_service):
+    async def call(service):
+        return (await service.get_marathon_open_registration(limit=10),
+                await service.get_marathon_this_month())
+
+    open_registration, this_month = run_async(db_path, call)
+    assert open_registration == marathon_service.get_marathon_open_registration(limit=10)
+    assert this_month == marathon_service.get_marathon_this_month()
+    assert len(this_month) == 30
+
+
+def test_concurrent_requests_use_separate_sessions(db_path):
+    async def call(service):
+        return await asyncio.gather(*(service.get_marathon_info(registration_status=False, limit=5)
+                                      for _ in range(5)))
+
+    RecordingSession.began.clear()
+    results = run_async(db_path, call)
+
+    assert all(result == results[0] for result in results)
+    assert len(set(map(id, RecordingSession.began))) == 5
+
+
+def test_async_batch_matches_sync_with_one_session(db_path, marathon_service):
+    queries = [MarathonQuery(view='marathon', region=['강원'], limit=5, fields='title,courses'),
+               MarathonQuery(view='open-registration'),
+               MarathonQuery(view='this-month', course=10)]
+
+    async def call(service):
+        return await service.get_marathon_batch(queries)
+
+    RecordingSession.began.clear()
+    results = run_async(db_path, call)
+
+    assert len(RecordingSession.began) == 1
+    assert [[m.model_dump(include={'title', 'courses'}) for m in result] for result in results] == \
+        [[m.model_dump(include={'title', 'courses'}) for m in result]
+         for result in marathon_service.get_marathon_batch(queries)]
+
+
+def test_api_uses_async_service(db_path, marathon_service):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
+    async_service = AsyncMarathonService(AsyncSqlAlchemyUnitOfWork(async_sessionmaker(bind=engine)))
+    app = FastAPI()
+    app.include_router(MarathonController(marathon_service, async_marathon_service=async_service).router)
+
+    with TestClient(app) as client:
+        first = client.get('/api/v1/marathon', params={'limit': 20})
+        second = client.get('/api/v1/marathon', params={'limit': 20, 'cursor': first.headers['X-Next-Cursor']})
+        this_month = client.get('/api/v1/marathon/this-month')
+        batch = client.post('/api/v1/marathon/batch', json=[{'view': 'this-month', 'fields': 'title'}])
+        client.portal.call(engine.dispose)
+
+    assert [marathon['title'] for marathon in first.json() + second.json()] == \
+        [marathon.title for marathon in marathon_service.get_marathon_info(limit=100)]
+    assert len(this_month.json()) == 30
+    assert batch.json() == [{'items': [{'title': marathon['title']} for marathon in this_month.json()],
+                             'next_cursor': None}]
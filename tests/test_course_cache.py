@@ -0,0 +1,97 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from src.adapters.outbound.course_cache import CourseCache
+from src.application.services import MarathonService
+from src.infrastructure.models import Base, Course
+from src.infrastructure.uow import SqlAlchemyUnitOfWork
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine('sqlite:///:memory:')
+    Base.metadata.create_all(engine)
+    try:
+        yield engine
+    finally:
+        Base.metadata.drop_all(engine)
+
+
+@pytest.fixture
+def session_maker(engine):
+    return sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+@pytest.fixture
+def course_statements(engine):
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        if 'course' in statement and 'marathon_course_association' not in statement:
+            statements.append(statement)
+
+    event.listen(engine, 'before_cursor_execute', record)
+    return statements
+
+
+def make_marathons(day: int, count: int = 10) -> list[dict]:
+    return [{
+        'title': f'마라톤 {day}-{i}',
+        'race_date': datetime(2024, 12, day, 9),
+        'location': '서울',
+        'homepage': '',
+        'courses': ['풀', '하프', '10km', '5km'],
+        'organization_name': '',
+        'registration_start_date': datetime(2024, 10, 1),
+        'registration_end_date': datetime(2024, 11, 1),
+    } for i in range(count)]
+
+
+def test_cache_avoids_course_queries_across_units_of_work(session_maker, course_statements):
+    uow = SqlAlchemyUnitOfWork(session_maker)
+    service = MarathonService(uow)
+
+    service.save_marathon_batch(make_marathons(day=1))
+    first_batch = len(course_statements)
+    for day in range(2, 8):
+        service.save_marathon_batch(make_marathons(day=day))
+
+    assert first_batch > 0
+    assert len(course_statements) == first_batch
+    assert uow.course_cache.loads == 1
+    with session_maker() as session:
+        assert session.query(Course).count() == 4
+
+
+def test_rolled_back_courses_are_not_cached(session_maker):
+    uow = SqlAlchemyUnitOfWork(session_maker)
+    with uow:
+        uow.marathon_repository.get_or_create_course_ids({'풀'})
+
+    with uow:
+        course_ids = uow.marathon_repository.get_or_create_course_ids({'풀'})
+        uow.commit()
+
+    with session_maker() as session:
+        assert session.get(Course, course_ids['풀']).distance == 42.195
+    assert uow.course_cache.get_ids(session_maker(), {42.195}) == {42.195: course_ids['풀']}
+
+
+def test_cache_finds_courses_added_elsewhere(session_maker):
+    course_cache = CourseCache()
+    with session_maker() as session:
+        course_cache.refresh(session)
+        session.add(Course(distance=10.0, name='10KM'))
+        session.commit()
+
+    uow = SqlAlchemyUnitOfWork(session_maker, course_cache=course_cache)
+    with uow:
+        course_ids = uow.marathon_repository.get_or_create_course_ids({'10km'})
+
+    with session_maker() as session:
+        assert session.query(Course).count() == 1
+        assert course_ids == {'10km': session.query(Course.id).scalar()}
+    assert course_cache.get_ids(session_maker(), {10.0}) == {10.0: course_ids['10km']}
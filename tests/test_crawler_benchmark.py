@@ -0,0 +1,35 @@
+import pytest
+
+from benchmarks.crawler_benchmark import run_benchmark
+from benchmarks.roadrun_stub import RoadRunStubServer
+from src.adapters.inbound.http_cache import CachedHttpClient
+from src.adapters.inbound.web_crawler import BaseMarathonInfoFilter, RoadRunWebCrawler
+
+
+def test_crawler_runs_against_stub_server():
+    with RoadRunStubServer(rows=5) as server:
+        crawler = RoadRunWebCrawler(BaseMarathonInfoFilter(),
+                                    max_workers=2,
+                                    http_client=CachedHttpClient(),
+                                    base_url=server.base_url)
+        marathon_list = crawler.crawl(server.list_url)
+
+    assert [m['roadrun_no'] for m in marathon_list] == [1000, 1001, 1002, 1003, 1004]
+    assert all(m['registration_period'] for m in marathon_list)
+    assert server.requests == 6
+
+
+def test_benchmark_reports_every_combination():
+    # lxml 백엔드는 선택 설치(fast-parser extra)
+    pytest.importorskip('lxml')
+    results = run_benchmark(rows=4, latency=0.0, jitter=0.0, workers=[1, 2], parsers=['html.parser', 'lxml'])
+
+    assert [(r.parser, r.workers) for r in results] == [
+        ('html.parser', 1), ('html.parser', 2), ('lxml', 1), ('lxml', 2),
+    ]
+    for result in results:
+        assert result.marathons == 4
+        assert result.pages == 5
+        assert result.pages_per_sec > 0
+        assert result.fetch_p95_ms >= result.fetch_p50_ms
+        assert result.peak_memory_mb > 0
@@ -0,0 +1,157 @@
+import threading
+import time
+from datetime import datetime
+
+import pytest
+
+from src.application.crawler_registry import (
+    CrawlerRegistry,
+    deduplicate_marathons,
+    marathon_dedup_key,
+)
+from src.application.pipeline import MarathonIngestionPipeline
+from src.ports.inbound import WebCrawlerPort
+
+
+class StaticCrawler(WebCrawlerPort):
+    def __init__(self, marathons, delay: float = 0.0, error: Exception | None = None):
+        self.marathons = marathons
+        self.delay = delay
+        self.error = error
+
+    def crawl(self, url):
+        time.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return list(self.marathons)
+
+    def preprocess_data(self, marathon):
+        return dict(marathon)
+
+
+class GatedCrawler(WebCrawlerPort):
+    """처음 first개를 내보낸 뒤 release가 set될 때까지 기다렸다가 나머지를 내보내는 크롤러"""
+
+    def __init__(self, marathons, first: int, release: threading.Event):
+        self.marathons = marathons
+        self.first = first
+        self.release = release
+        self.released_before_end = None
+
+    def crawl(self, url):
+        return list(self.iter_crawl(url))
+
+    def iter_crawl(self, url):
+        for index, marathon in enumerate(self.marathons):
+            if index == self.first:
+                self.released_before_end = self.release.wait(timeout=5)
+            yield marathon
+
+    def preprocess_data(self, marathon):
+        return dict(marathon)
+
+
+class RecordingService:
+    """저장한 배치를 기록하고 첫 배치를 저장하면 release를 set"""
+
+    def __init__(self, release: threading.Event):
+        self.release = release
+        self.batches = []
+
+    def save_marathon_batch(self, marathons):
+        self.batches.append([m['title'] for m in marathons])
+        self.release.set()
+        return len(marathons)
+
+    def rebuild_digests(self):
+        return 0
+
+
+def make_marathon(title, location, homepage=None, day=8):
+    return {
+        'title': title,
+        'race_date': datetime(2024, 12, day, 9, 30),
+        'location': location,
+        'homepage': homepage,
+    }
+
+
+def test_dedup_key_normalises_title_date_and_location():
+    assert marathon_dedup_key(make_marathon('제22회 금산인삼 마라톤', '대전광역시 유성구')) == \
+        marathon_dedup_key(make_marathon('2024 금산인삼마라톤', '대전 금산인삼 엑스포주차장'))
+    assert marathon_dedup_key(make_marathon('금산인삼마라톤', '대전')) != \
+        marathon_dedup_key(make_marathon('금산인삼마라톤', '대전', day=9))
+
+
+def test_deduplicate_marathons_merges_missing_fields():
+    result = deduplicate_marathons([
+        ('roadrun', make_marathon('금산인삼마라톤', '대전 금산')),
+        ('marathon_online', make_marathon('제5회 금산인삼 마라톤', '대전광역시', homepage='http://example.com')),
+        ('marathon_online', make_marathon('서울 송년 마라톤', '서울')),
+    ])
+
+    assert result.duplicates == 1
+    assert [m['title'] for m in result.marathons] == ['금산인삼마라톤', '서울 송년 마라톤']
+    assert result.marathons[0]['homepage'] == 'http://example.com'
+    assert result.marathons[0]['location'] == '대전 금산'
+    assert list(result.sources.values())[0] == ['roadrun', 'marathon_online']
+
+
+def test_registry_runs_sources_concurrently():
+    registry = CrawlerRegistry()
+    registry.register('a', StaticCrawler([make_marathon('금산인삼마라톤', '대전')], delay=0.2), 'a')
+    registry.register('b', StaticCrawler([make_marathon('금산인삼 마라톤', '대전'),
+                                          make_marathon('부산 마라톤', '부산')], delay=0.2), 'b')
+
+    started = time.monotonic()
+    result = registry.crawl_all()
+
+    assert time.monotonic() - started < 0.35
+    assert len(result.marathons) == 2
+    assert result.duplicates == 1
+    assert result.per_source == {'a': 1, 'b': 2}
+
+
+def test_registry_keeps_other_sources_when_one_fails():
+    registry = CrawlerRegistry()
+    registry.register('broken', StaticCrawler([], error=ConnectionError('down')), 'x')
+    registry.register('ok', StaticCrawler([make_marathon('부산 마라톤', '부산')]), 'y')
+
+    assert [m['title'] for m in registry.crawl(None)] == ['부산 마라톤']
+    assert registry.last_result.errors == {'broken': 'down'}
+
+
+def test_register_duplicate_source():
+    registry = CrawlerRegistry()
+    registry.register('roadrun', StaticCrawler([]), 'x')
+    with pytest.raises(ValueError):
+        registry.register('roadrun', StaticCrawler([]), 'y')
+
+
+def test_iter_crawl_streams_and_skips_duplicates_as_they_arrive():
+    registry = CrawlerRegistry()
+    registry.register('a', StaticCrawler([make_marathon('금산인삼마라톤', '대전')]), 'a')
+    registry.register('b', StaticCrawler([make_marathon('금산인삼 마라톤', '대전'),
+                                          make_marathon('부산 마라톤', '부산')], delay=0.1), 'b')
+
+    marathons = list(registry.iter_crawl())
+
+    assert [m['title'] for m in marathons] == ['금산인삼마라톤', '부산 마라톤']
+    assert registry.last_result.duplicates == 1
+    assert registry.last_result.per_source == {'a': 1, 'b': 2}
+
+
+def test_pipeline_commits_first_batch_before_crawl_ends():
+    release = threading.Event()
+    crawler = GatedCrawler([make_marathon(f'마라톤 {i}', '서울', day=i + 1) for i in range(5)],
+                           first=2, release=release)
+    registry = CrawlerRegistry()
+    registry.register('roadrun', crawler, 'x')
+    service = RecordingService(release)
+
+    result = MarathonIngestionPipeline(registry, service, batch_size=2).run(None)
+
+    # 크롤러는 첫 배치(2건)가 저장된 뒤에야 나머지를 내보냄
+    assert crawler.released_before_end is True
+    assert service.batches == [['마라톤 0', '마라톤 1'], ['마라톤 2', '마라톤 3'], ['마라톤 4']]
+    assert result.written == 5
@@ -0,0 +1,52 @@
+from sqlalchemy import text
+
+from config import get_settings
+from src.infrastructure.database import (InstrumentedNullPool, InstrumentedQueuePool, create_db_engine,
+                                         get_engine)
+from src.infrastructure.uow import ReadOnlyUnitOfWork, SqlAlchemyUnitOfWork
+
+
+def test_queue_pool_records_checkouts(tmp_path):
+    settings = get_settings().model_copy(update={'DB_POOL_SIZE': 2, 'DB_MAX_OVERFLOW': 1})
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'pool.db'}", settings)
+    try:
+        assert isinstance(engine.pool, InstrumentedQueuePool)
+        with engine.connect() as first, engine.connect() as second:
+            first.execute(text("SELECT 1"))
+            second.execute(text("SELECT 1"))
+            assert engine.pool.stats.in_use == 2
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+
+        stats = engine.pool.stats.as_dict()
+        assert stats['checkouts'] == 3
+        assert stats['in_use'] == 0
+        assert stats['peak_in_use'] == 2
+        assert stats['capacity'] == 3
+        assert stats['peak_utilization'] == 2 / 3
+        assert stats['max_wait_ms'] >= stats['avg_wait_ms'] > 0
+    finally:
+        engine.dispose()
+
+
+def test_null_pool_keeps_stats_after_dispose(tmp_path):
+    settings = get_settings().model_copy(update={'DB_NULL_POOL': True})
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'pool.db'}", settings)
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+    engine.dispose()
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+
+    assert isinstance(engine.pool, InstrumentedNullPool)
+    assert engine.pool.stats.checkouts == 2
+    assert engine.pool.stats.in_use == 0
+    assert engine.pool.stats.capacity is None
+    engine.dispose()
+
+
+def test_unit_of_work_creates_engine_lazily():
+    created = get_engine.cache_info().currsize
+    SqlAlchemyUnitOfWork()
+    ReadOnlyUnitOfWork()
+    assert get_engine.cache_info().currsize == created
@@ -0,0 +1,92 @@
+import json
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import sessionmaker
+
+from src.adapters.inbound.api import MarathonController
+from src.application.services import DIGEST_OPEN_REGISTRATION, DIGEST_THIS_MONTH
+from src.infrastructure.uow import ReadOnlyUnitOfWork
+
+NOW = datetime(2024, 11, 10, 12, 0)
+
+
+# 마라톤 00~03의 접수 기간
+REGISTRATION_PERIODS = [
+    (NOW - timedelta(days=10), NOW + timedelta(days=3)),
+    (NOW - timedelta(days=10), NOW + timedelta(days=1)),
+    (NOW + timedelta(days=2), NOW + timedelta(days=20)),
+    (NOW - timedelta(days=20), NOW - timedelta(days=1)),
+]
+
+
+@pytest.fixture
+def marathons(make_marathon):
+    return [make_marathon(f'마라톤 {i:02d}', datetime(2024, 11, 1 + i, 9, 0), courses=['10km', '풀'],
+                          registration_start_date=start, registration_end_date=end)
+            for i, (start, end) in enumerate(REGISTRATION_PERIODS)]
+
+
+def titles(payload: str) -> list[str]:
+    return [marathon['title'] for marathon in json.loads(payload)]
+
+
+def test_rebuild_digests_stores_rendered_lists(marathon_service):
+    assert marathon_service.rebuild_digests(NOW) == 2
+
+    assert titles(marathon_service.get_digest(DIGEST_OPEN_REGISTRATION, NOW)) == ['마라톤 00', '마라톤 01']
+    assert titles(marathon_service.get_digest(DIGEST_THIS_MONTH, NOW)) == [f'마라톤 {i:02d}' for i in range(4)]
+    [marathon, _] = marathon_service.get_digest_marathons(DIGEST_OPEN_REGISTRATION, NOW)
+    assert [course.name for course in marathon.courses] == ['10KM', 'FULL']
+
+
+def test_marathons_without_homepage_are_served(marathon_service, make_marathon):
+    # 목록에 홈페이지 링크가 없으면 크롤러는 homepage=None을 넘긴다
+    marathon_service.save_marathon_batch([
+        make_marathon('마라톤 04', datetime(2024, 11, 5, 9, 0), homepage=None,
+                      registration_start_date=NOW - timedelta(days=1), registration_end_date=NOW + timedelta(days=5)),
+    ])
+
+    assert marathon_service.rebuild_digests(NOW) == 2
+    assert '마라톤 04' in titles(marathon_service.get_digest(DIGEST_OPEN_REGISTRATION, NOW))
+    [served] = [m for m in marathon_service.get_digest_marathons(DIGEST_OPEN_REGISTRATION, NOW)
+                if m.title == '마라톤 04']
+    assert served.homepage is None
+    assert [m.homepage for m in marathon_service.get_marathon_info() if m.title == '마라톤 04'] == [None]
+
+
+def test_digest_expires_when_the_list_would_change(marathon_service):
+    marathon_service.rebuild_digests(NOW)
+
+    # 마라톤 01 접수 마감 / 다음 달
+    assert marathon_service.get_digest(DIGEST_OPEN_REGISTRATION, NOW + timedelta(hours=23)) is not None
+    assert marathon_service.get_digest(DIGEST_OPEN_REGISTRATION, NOW + timedelta(days=1)) is None
+    assert marathon_service.get_digest(DIGEST_THIS_MONTH, datetime(2024, 11, 30, 23, 0)) is not None
+    assert marathon_service.get_digest(DIGEST_THIS_MONTH, datetime(2024, 12, 1)) is None
+
+
+def test_digest_is_missing_before_first_rebuild(marathon_service):
+    assert marathon_service.get_digest(DIGEST_OPEN_REGISTRATION) is None
+    assert marathon_service.get_digest_marathons(DIGEST_OPEN_REGISTRATION) is None
+
+
+def test_endpoint_serves_digest_with_one_primary_key_lookup(engine, marathon_service, statements):
+    marathon_service.rebuild_digests()
+    app = FastAPI()
+    read_factory = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+    app.include_router(MarathonController(marathon_service,
+                                          read_uow_factory=lambda: ReadOnlyUnitOfWork(read_factory)).router)
+    client = TestClient(app)
+    statements.clear()
+
+    response = client.get('/api/v1/marathon/this-month')
+
+    assert len(statements) == 1
+    assert 'FROM marathon_digest' in statements[0]
+    assert response.status_code == 200
+    assert response.json() == json.loads(marathon_service.get_digest(DIGEST_THIS_MONTH))
+
+    # 페이지 조회는 digest 대신 DB 조회 - 같은 JSON
+    assert client.get('/api/v1/marathon/this-month', params={'limit': 100}).json() == response.json()
@@ -0,0 +1,171 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.adapters.inbound.api import MarathonController
+from src.application.fields import parse_fields
+from src.application.services import MAX_BATCH_QUERIES, AsyncMarathonService, MarathonService
+from src.infrastructure.uow import AsyncSqlAlchemyUnitOfWork, ReadOnlyUnitOfWork, SqlAlchemyUnitOfWork
+
+
+@pytest.fixture
+def marathons(make_marathon):
+    now = datetime.now()
+    return [make_marathon(f'마라톤 {i:02d}', datetime(now.year, now.month, 1 + i % 20, 9, 0),
+                          location='서울 여의도공원' if i % 2 else '경기 수원종합운동장',
+                          homepage=f'http://example.com/{i}',
+                          courses=['10km', '하프'],
+                          organization_name='주최사',
+                          registration_end_date=now + timedelta(days=1 if i % 3 else -2))
+            for i in range(25)]
+
+
+@pytest.fixture
+def sessions(engine, marathon_service):
+    """UoW가 연 세션 목록"""
+    sessions = []
+    factory = sessionmaker(bind=engine)
+    event.listen(factory, 'after_begin', lambda session, transaction, connection: sessions.append(session))
+    return factory, sessions
+
+
+@pytest.fixture
+def client(sessions):
+    factory, _ = sessions
+    app = FastAPI()
+    app.include_router(MarathonController(MarathonService(SqlAlchemyUnitOfWork(factory))).router)
+    return TestClient(app)
+
+
+def test_parse_fields():
+    assert parse_fields(None) is None
+    assert parse_fields('') is None
+    assert parse_fields('homepage, title,title') == ('title', 'homepage')
+    assert parse_fields(['race_date', 'courses']) == ('race_date', 'courses')
+    with pytest.raises(ValueError):
+        parse_fields('title,password')
+
+
+def test_fields_narrow_payload_and_projection(client, statements):
+    response = client.get('/api/v1/marathon', params={'fields': 'title,race_date,homepage'})
+
+    assert response.status_code == 200
+    marathons = response.json()
+    assert len(marathons) == 25
+    assert all(set(marathon) == {'title', 'race_date', 'homepage'} for marathon in marathons)
+    assert marathons[0]['homepage'].startswith('http://example.com/')
+    # 코스 테이블은 읽지 않고, marathon_info에서도 요청한 컬럼(+ id, race_date)만 조회
+    assert len(statements) == 1
+    assert 'marathon_info.homepage' in statements[0]
+    assert 'marathon_info.location' not in statements[0]
+    assert 'marathon_info.organization_name' not in statements[0]
+
+
+def test_fields_with_courses_and_region(client, statements):
+    marathons = client.get('/api/v1/marathon', params={'fields': 'region,courses'}).json()
+
+    assert {marathon['region'] for marathon in marathons} == {'서울', '경기'}
+    assert [course['name'] for course in marathons[0]['courses']] == ['10KM', 'HALF']
+    assert len(statements) == 2
+
+
+def test_fields_keep_keyset_pagination(client):
+    titles, cursor = [], None
+    while True:
+        params = {'limit': 10, 'fields': 'title', **({'cursor': cursor} if cursor else {})}
+        response = client.get('/api/v1/marathon', params=params)
+        titles.extend(marathon['title'] for marathon in response.json())
+        cursor = response.headers.get('X-Next-Cursor')
+        if cursor is None:
+            break
+
+    assert sorted(titles) == [f'마라톤 {i:02d}' for i in range(25)]
+    assert len(set(titles)) == 25
+
+
+def test_unknown_field_is_rejected(client):
+    response = client.get('/api/v1/marathon/open-registration', params={'fields': 'title,secret'})
+
+    assert response.status_code == 400
+    assert 'secret' in response.json()['detail']
+
+
+def test_fields_on_open_registration_and_this_month(client):
+    full = client.get('/api/v1/marathon/open-registration').json()
+    sparse = client.get('/api/v1/marathon/open-registration', params={'fields': 'title'}).json()
+    this_month = client.get('/api/v1/marathon/this-month', params={'fields': 'title,race_date'}).json()
+
+    assert sorted(marathon['title'] for marathon in sparse) == sorted(marathon['title'] for marathon in full)
+    assert all(set(marathon) == {'title'} for marathon in sparse)
+    assert len(this_month) == 25
+
+
+def test_batch_matches_separate_requests_with_one_session(client, sessions):
+    _, began = sessions
+    queries = [
+        {'view': 'marathon', 'region': ['서울'], 'limit': 5, 'fields': ['title', 'race_date', 'homepage']},
+        {'view': 'open-registration'},
+        {'view': 'this-month', 'fields': 'title'},
+    ]
+    separate = [
+        client.get('/api/v1/marathon', params={'region': ['서울'], 'limit': 5,
+                                                'fields': 'title,race_date,homepage'}),
+        client.get('/api/v1/marathon/open-registration'),
+        client.get('/api/v1/marathon/this-month', params={'fields': 'title'}),
+    ]
+    began.clear()
+
+    response = client.post('/api/v1/marathon/batch', json=queries)
+
+    assert response.status_code == 200
+    results = response.json()
+    assert len(began) == 1
+    assert [result['items'] for result in results] == [r.json() for r in separate]
+    assert results[0]['next_cursor'] == separate[0].headers['X-Next-Cursor']
+    assert results[1]['next_cursor'] is None
+
+
+def test_batch_uses_request_read_scope(engine, sessions):
+    factory, began = sessions
+    app = FastAPI()
+    app.include_router(MarathonController(MarathonService(SqlAlchemyUnitOfWork(factory)),
+                                          read_uow_factory=lambda: ReadOnlyUnitOfWork(factory)).router)
+
+    response = TestClient(app).post('/api/v1/marathon/batch', json=[{'view': 'marathon'}, {'view': 'this-month'}])
+
+    assert response.status_code == 200
+    assert len(began) == 1
+
+
+@pytest.mark.parametrize('queries, status_code', [
+    ([{'view': 'marathon', 'limit': 5, 'cursor': 'not-a-cursor'}], 400),
+    ([{'view': 'marathon', 'fields': 'secret'}], 422),
+    ([{'view': 'upcoming'}], 422),
+    ([], 422),
+    ([{'view': 'marathon'}] * (MAX_BATCH_QUERIES + 1), 422),
+])
+def test_invalid_batch_is_rejected(client, queries, status_code):
+    assert client.post('/api/v1/marathon/batch', json=queries).status_code == status_code
+
+
+def test_async_fields_match_sync(engine, marathon_service):
+    sync_result = marathon_service.get_marathon_info(limit=10, fields=('title', 'homepage'))
+
+    async def main():
+        async_engine = create_async_engine(f"sqlite+aiosqlite:///{engine.url.database}")
+        try:
+            service = AsyncMarathonService(AsyncSqlAlchemyUnitOfWork(async_sessionmaker(bind=async_engine)))
+            return await service.get_marathon_info(limit=10, fields=('title', 'homepage'))
+        finally:
+            await async_engine.dispose()
+
+    async_result = asyncio.run(main())
+    assert [m.model_dump(include={'title', 'homepage'}) for m in async_result] == \
+        [m.model_dump(include={'title', 'homepage'}) for m in sync_result]
+    assert 'location' not in async_result[0].__dict__
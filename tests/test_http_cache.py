@@ -0,0 +1,89 @@
+import pytest
+
+from src.adapters.inbound.http_cache import CachedHttpClient, FileHttpCache
+
+URL = "http://www.roadrun.co.kr/schedule/view.php?no=101"
+PAGE = "<table><tr><td>대회명</td><td>금산인삼마라톤</td></tr></table>".encode('euc-kr')
+
+
+class FakeResponse:
+    def __init__(self, content: bytes = b'', status_code: int = 200, headers: dict | None = None):
+        self.content = content
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.encoding = None
+        self.decoded = 0
+
+    @property
+    def text(self):
+        self.decoded += 1
+        return self.content.decode(self.encoding or 'utf-8')
+
+    def raise_for_status(self):
+        pass
+
+
+class FakeSession:
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.request_headers = []
+
+    def get(self, url, headers=None, **kwargs):
+        self.request_headers.append(headers or {})
+        return self.responses.pop(0)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return FileHttpCache(tmp_path / 'http-cache')
+
+
+def test_etag_revalidation_returns_cached_text(cache):
+    session = FakeSession(
+        FakeResponse(PAGE, headers={'ETag': '"v1"', 'Last-Modified': 'Mon, 02 Dec 2024 00:00:00 GMT'}),
+        FakeResponse(status_code=304),
+    )
+    client = CachedHttpClient(session=session, cache=cache)
+
+    first = client.get_text(URL, encoding='euc-kr')
+    second = client.get_text(URL, encoding='euc-kr')
+
+    assert first == second == PAGE.decode('euc-kr')
+    assert session.request_headers[1] == {
+        'If-None-Match': '"v1"',
+        'If-Modified-Since': 'Mon, 02 Dec 2024 00:00:00 GMT',
+    }
+    assert client.stats.as_dict() == dict(hits=1, misses=1, not_modified=1, unchanged_content=0, fresh=0)
+
+
+def test_content_hash_fallback_skips_decoding(cache):
+    unchanged = FakeResponse(PAGE)
+    session = FakeSession(FakeResponse(PAGE), unchanged)
+    client = CachedHttpClient(session=session, cache=cache)
+
+    client.get_text(URL, encoding='euc-kr')
+    text = client.get_text(URL, encoding='euc-kr')
+
+    assert text == PAGE.decode('euc-kr')
+    assert unchanged.decoded == 0
+    assert client.stats.unchanged_content == 1
+
+
+def test_changed_content_is_refetched(cache):
+    changed = "<p>변경됨</p>".encode('euc-kr')
+    session = FakeSession(FakeResponse(PAGE), FakeResponse(changed))
+    client = CachedHttpClient(session=session, cache=cache)
+
+    client.get_text(URL, encoding='euc-kr')
+    assert client.get_text(URL, encoding='euc-kr') == "<p>변경됨</p>"
+    assert client.stats.misses == 2
+
+
+def test_fresh_entries_skip_the_request(cache):
+    session = FakeSession(FakeResponse(PAGE))
+    CachedHttpClient(session=session, cache=cache).get_text(URL, encoding='euc-kr')
+
+    # 다음 실행(새 클라이언트)에서도 같은 디렉터리의 캐시를 재사용
+    client = CachedHttpClient(session=FakeSession(), cache=cache, fresh_for=3600)
+    assert client.get_text(URL, encoding='euc-kr') == PAGE.decode('euc-kr')
+    assert client.stats.fresh == 1
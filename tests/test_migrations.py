@@ -0,0 +1,145 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine, event, inspect, text
+from sqlalchemy.orm import sessionmaker
+
+from src.application.services import MarathonService
+from src.infrastructure.migrations import MIGRATIONS, applied_versions, pending_migrations, run_migrations
+from src.infrastructure.uow import SqlAlchemyUnitOfWork
+
+LEGACY_SCHEMA = [
+    "CREATE TABLE recipient (id INTEGER PRIMARY KEY, name VARCHAR, phone_number VARCHAR)",
+    "CREATE TABLE course (id INTEGER PRIMARY KEY, distance FLOAT, name VARCHAR, description VARCHAR)",
+    "CREATE TABLE marathon_info (id INTEGER PRIMARY KEY, title VARCHAR, race_date DATETIME, location VARCHAR, "
+    "homepage VARCHAR, organization_name VARCHAR, registration_start_date DATETIME, "
+    "registration_end_date DATETIME)",
+    "CREATE TABLE marathon_course_association (marathon_id INTEGER REFERENCES marathon_info(id), "
+    "course_id INTEGER REFERENCES course(id))",
+]
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine('sqlite:///:memory:')
+    try:
+        yield engine
+    finally:
+        engine.dispose()
+
+
+def index_names(engine, table: str) -> set[str]:
+    return {index['name'] for index in inspect(engine).get_indexes(table)}
+
+
+def test_run_migrations_on_empty_database(engine):
+    assert run_migrations(engine) == [m.version for m in MIGRATIONS]
+    assert run_migrations(engine) == []
+    assert pending_migrations(engine) == []
+
+    assert {'uq_marathon_info_title_race_date',
+            'ix_marathon_info_race_date_id',
+            'ix_marathon_info_registration_period',
+            'ix_marathon_info_region',
+            'ix_marathon_info_roadrun_no'} <= index_names(engine, 'marathon_info')
+    assert 'ix_marathon_info_location' not in index_names(engine, 'marathon_info')
+    assert {'ix_marathon_course_association_marathon_id',
+            'ix_marathon_course_association_course_id'} <= index_names(engine, 'marathon_course_association')
+
+
+def test_run_migrations_upgrades_legacy_database(engine):
+    with engine.begin() as conn:
+        for statement in LEGACY_SCHEMA:
+            conn.execute(text(statement))
+        conn.execute(text("INSERT INTO course (id, distance, name) VALUES (1, 10, '10KM')"))
+        for marathon_id in (1, 2):
+            conn.execute(text("INSERT INTO marathon_info (id, title, race_date, location) "
+                              "VALUES (:id, '서울 마라톤', '2024-03-15 09:00:00.000000', '서울 여의도공원')"),
+                         {'id': marathon_id})
+            conn.execute(text("INSERT INTO marathon_course_association VALUES (:id, 1)"), {'id': marathon_id})
+        conn.execute(text("INSERT INTO marathon_info (id, title, race_date, location) "
+                          "VALUES (3, '금산 마라톤', '2024-12-08 09:30:00.000000', '대전 금산인삼 엑스포주차장')"))
+
+    run_migrations(engine)
+
+    assert applied_versions(engine) == {m.version for m in MIGRATIONS}
+    with engine.connect() as conn:
+        assert conn.execute(text("SELECT id, region FROM marathon_info ORDER BY id")).all() == [(1, '서울'),
+                                                                                              (3, '대전')]
+        assert conn.execute(text("SELECT marathon_id FROM marathon_course_association")).scalars().all() == [1]
+    assert {'roadrun_no', 'list_row_hash'} <= {c['name'] for c in inspect(engine).get_columns('marathon_info')}
+    assert 'ix_marathon_info_race_date_id' in index_names(engine, 'marathon_info')
+
+
+def test_stadium_regions_are_reclassified(engine):
+    run_migrations(engine)
+    with engine.begin() as conn:
+        conn.execute(text("INSERT INTO marathon_info (id, title, race_date, location, region) "
+                          "VALUES (1, '인천 마라톤', '2024-03-15 09:00:00.000000', '문학경기장', '경기')"))
+        conn.execute(text("DELETE FROM schema_migrations WHERE version = 11"))
+
+    assert run_migrations(engine) == [11]
+    with engine.connect() as conn:
+        assert conn.execute(text("SELECT region FROM marathon_info")).scalar_one() == '기타'
+
+
+@pytest.fixture
+def marathon_service(engine):
+    run_migrations(engine)
+    return MarathonService(SqlAlchemyUnitOfWork(sessionmaker(bind=engine)))
+
+
+def query_plans(engine, call) -> str:
+    """call()이 실행한 SELECT 문마다 EXPLAIN QUERY PLAN 결과를 모아서 반환"""
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith('SELECT'):
+            statements.append((statement, parameters))
+
+    event.listen(engine, 'before_cursor_execute', record)
+    try:
+        call()
+    finally:
+        event.remove(engine, 'before_cursor_execute', record)
+
+    plans = []
+    with engine.connect() as conn:
+        for statement, parameters in statements:
+            plans.extend(row[-1] for row in conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters))
+    return '\n'.join(plans)
+
+
+def test_race_date_query_uses_index(engine, marathon_service):
+    plan = query_plans(engine, lambda: marathon_service.get_marathon_info(
+        registration_status=False,
+        race_search_start_date=datetime(2024, 12, 1),
+        race_search_end_date=datetime(2024, 12, 31),
+    ))
+    assert 'ix_marathon_info_race_date' in plan
+    assert 'SCAN marathon_info' not in plan
+
+
+def test_registration_period_query_uses_index(engine, marathon_service):
+    plan = query_plans(engine, marathon_service.get_marathon_open_registration)
+    assert 'ix_marathon_info_registration_period' in plan
+    assert 'SCAN marathon_info' not in plan
+
+
+def test_region_query_uses_index(engine, marathon_service):
+    plan = query_plans(engine, lambda: marathon_service.get_marathon_info(registration_status=False,
+                                                                          region=['서울', '경기']))
+    assert 'ix_marathon_info_region' in plan
+    assert 'SCAN marathon_info' not in plan
+
+
+def test_course_query_uses_association_indexes(engine, marathon_service):
+    plan = query_plans(engine, lambda: marathon_service.get_marathon_info(registration_status=False, course=10))
+    assert 'ix_marathon_course_association' in plan
+    assert 'SCAN marathon_course_association' not in plan
+
+
+def test_search_query_uses_fts_index(engine, marathon_service):
+    plan = query_plans(engine, lambda: marathon_service.search_marathons('춘천'))
+    assert 'SCAN marathon_info_fts VIRTUAL TABLE INDEX' in plan
+    assert 'SEARCH marathon_info USING INTEGER PRIMARY KEY' in plan
@@ -0,0 +1,86 @@
+from datetime import datetime, time
+
+import pytest
+
+from src.adapters.inbound import normalizer, web_crawler
+from src.adapters.inbound.normalizer import MarathonBatchNormalizer, parse_start_time
+from src.adapters.inbound.web_crawler import BaseMarathonInfoFilter, RoadRunWebCrawler
+
+
+def make_raw(event_datetime='2024년12월8일 출발시간: 오전 9시 30분',
+             registration_period='2024년10월11일~2024년11월19일',
+             **overrides):
+    raw = {
+        'date': '12/8',
+        'title': '금산인삼마라톤',
+        'courses': ['하프', '10km'],
+        'location': '대전 금산인삼 엑스포주차장',
+        'organizer': '전국마라톤협회',
+        'contact': '010-1234-5678',
+        'homepage': 'http://example.com',
+        'detail_url': "javascript:open_window('win', 'view.php?no=101')",
+        'roadrun_no': 101,
+        'list_row_hash': 'hash',
+        'registration_period': registration_period,
+        'event_datetime': event_datetime,
+    }
+    raw.update(overrides)
+    return raw
+
+
+@pytest.mark.parametrize("start_time", [
+    '오전 9시 30분', '오후 1시', '오후 12시 30분', '09:00', '24:00', '8;30', '0700', '9', '출발 10시',
+])
+def test_batch_normalizer_matches_per_row_path(start_time):
+    raw = make_raw(event_datetime=f'2024년12월8일 출발시간: {start_time}')
+    crawler = RoadRunWebCrawler(BaseMarathonInfoFilter())
+
+    result = MarathonBatchNormalizer().normalize([raw])
+
+    assert result.errors == []
+    assert result.records == [crawler.preprocess_data(raw)]
+
+
+def test_batch_normalizer_reports_field_errors():
+    result = MarathonBatchNormalizer().normalize([
+        make_raw(),
+        make_raw(event_datetime='2024년12월8일 출발시간: 미정'),
+        make_raw(registration_period='추후 공지'),
+        make_raw(event_datetime=None),
+    ])
+
+    assert len(result.records) == 2
+    assert result.records[1]['race_date'] == datetime(2024, 12, 8, 0, 0)
+    assert [(error.index, error.field) for error in result.errors] == [
+        (1, 'start_time'),
+        (2, 'registration_period'),
+        (3, 'event_datetime'),
+    ]
+
+
+def test_batch_normalizer_caches_repeated_strings():
+    normalizer = MarathonBatchNormalizer(cache_size=16)
+    normalizer.normalize([make_raw() for _ in range(10)])
+
+    stats = normalizer.cache_stats()
+    assert stats['date'] == dict(hits=27, misses=3, size=3)
+    assert stats['start_time'] == dict(hits=9, misses=1, size=1)
+
+
+def test_crawler_reuses_normalizer_parsers():
+    # 행 단위(preprocess_data)와 배치 경로가 같은 해석 함수를 사용
+    assert web_crawler.parse_korean_date is normalizer.parse_korean_date
+    assert RoadRunWebCrawler(BaseMarathonInfoFilter())._parse_race_time('미정') == time(0, 0)
+
+
+def test_parse_start_time_raises_value_error():
+    with pytest.raises(ValueError):
+        parse_start_time('추후 공지')
+
+
+def test_crawler_preprocess_batch_uses_normalizer():
+    crawler = RoadRunWebCrawler(BaseMarathonInfoFilter())
+    records, errors = crawler.preprocess_batch([make_raw(), make_raw(registration_period=None)])
+
+    assert len(records) == 1
+    assert errors[0]['field'] == 'registration_period'
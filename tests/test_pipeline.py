@@ -0,0 +1,134 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.application.pipeline import MarathonIngestionPipeline, PipelineResult
+from src.application.services import MarathonService
+from src.infrastructure.models import Base
+from src.infrastructure.uow import SqlAlchemyUnitOfWork
+from src.ports.inbound import WebCrawlerPort
+
+
+class FakeCrawler(WebCrawlerPort):
+    """raw 마라톤을 순서대로 내보내고, fail_after개 이후에는 예외를 던지는 크롤러"""
+
+    def __init__(self, count: int, fail_after: int | None = None):
+        self.count = count
+        self.fail_after = fail_after
+        self.yielded = 0
+
+    def crawl(self, url):
+        return list(self.iter_crawl(url))
+
+    def iter_crawl(self, url):
+        for i in range(self.count):
+            if self.fail_after is not None and i == self.fail_after:
+                raise TimeoutError('list.php timed out')
+            self.yielded += 1
+            yield {'title': f'마라톤 {i}', 'day': i + 1}
+
+    def preprocess_data(self, marathon):
+        if marathon['day'] == 3:
+            raise ValueError('잘못된 대회일시')
+        return {
+            'title': marathon['title'],
+            'race_date': datetime(2024, 12, marathon['day'], 9, 0),
+            'location': '서울',
+            'homepage': 'http://example.com',
+            'courses': ['10km'],
+            'organization_name': '주최사',
+            'registration_start_date': datetime(2024, 11, 1),
+            'registration_end_date': datetime(2024, 11, 30),
+        }
+
+
+class RecordingMarathonService(MarathonService):
+    def __init__(self, uow):
+        super().__init__(uow)
+        self.batch_sizes = []
+
+    def save_marathon_batch(self, marathons):
+        self.batch_sizes.append(len(marathons))
+        return super().save_marathon_batch(marathons)
+
+
+@pytest.fixture
+def marathon_service():
+    engine = create_engine('sqlite:///:memory:')
+    Base.metadata.create_all(engine)
+    session_maker = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    try:
+        yield RecordingMarathonService(SqlAlchemyUnitOfWork(session_maker))
+    finally:
+        Base.metadata.drop_all(engine)
+
+
+def test_pipeline_persists_in_batches(marathon_service):
+    pipeline = MarathonIngestionPipeline(FakeCrawler(7), marathon_service, batch_size=3)
+    result = pipeline.run('list.php')
+
+    assert result.crawled == 7
+    assert result.preprocessed == 6
+    assert result.written == 6
+    assert result.digests == 2
+    assert marathon_service.batch_sizes == [3, 3]
+    assert len(result.errors) == 1
+    assert len(marathon_service.get_marathon_info(registration_status=False)) == 6
+
+
+def test_pipeline_keeps_batches_when_crawl_fails(marathon_service):
+    pipeline = MarathonIngestionPipeline(FakeCrawler(10, fail_after=5), marathon_service, batch_size=2)
+    result = pipeline.run('list.php')
+
+    # day 3은 전처리 실패, 나머지 4개는 크롤링 중단 전까지 저장
+    assert result.written == 4
+    assert marathon_service.batch_sizes == [2, 2]
+    assert any(error.startswith('crawl:') for error in result.errors)
+    assert len(marathon_service.get_marathon_info(registration_status=False)) == 4
+
+
+def test_pipeline_skips_failed_batch_and_keeps_going(marathon_service):
+    class FailingSecondBatch(RecordingMarathonService):
+        def save_marathon_batch(self, marathons):
+            if len(self.batch_sizes) == 1:
+                self.batch_sizes.append(len(marathons))
+                raise RuntimeError('database is locked')
+            return super().save_marathon_batch(marathons)
+
+    service = FailingSecondBatch(marathon_service.uow)
+    pipeline = MarathonIngestionPipeline(FakeCrawler(9), service, batch_size=2)
+    result = pipeline.run('list.php')
+
+    # day 3은 전처리 실패, 두 번째 배치(day 4, 5)만 저장 실패
+    assert service.batch_sizes == [2, 2, 2, 2]
+    assert result.failed_batches == 1
+    assert result.batches == 3
+    assert result.written == 6
+    assert result.digests == 2
+    assert any(error.startswith('persist 2 marathons') for error in result.errors)
+    assert len(service.get_marathon_info(registration_status=False)) == 6
+
+
+def test_pipeline_filter_stage(marathon_service):
+    class OnlyEvenDays:
+        def filter(self, marathon):
+            return marathon if marathon['race_date'].day % 2 == 0 else None
+
+    pipeline = MarathonIngestionPipeline(FakeCrawler(6), marathon_service, marathon_filter=OnlyEvenDays())
+    result = pipeline.run('list.php')
+
+    assert result.written == 3
+    assert result.filtered_out == 2
+
+
+def test_pipeline_pulls_lazily(marathon_service):
+    crawler = FakeCrawler(100)
+    pipeline = MarathonIngestionPipeline(crawler, marathon_service, batch_size=5)
+    result = PipelineResult()
+    batches = pipeline._batched(pipeline._preprocess(pipeline._crawl('list.php', result), result), result)
+
+    next(batches)
+    # 첫 배치(5개)를 채우는 데 필요한 만큼만 크롤링 (day 3은 전처리 실패)
+    assert crawler.yielded == 6
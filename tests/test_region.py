@@ -0,0 +1,36 @@
+import pytest
+
+from src.domain.models import Region
+from src.domain.region import classify_region, parse_region
+
+
+@pytest.mark.parametrize("location,expected", [
+    ('대전 금산인삼 엑스포주차장', Region.DAEJEON),
+    ('서울특별시 영등포구 여의도공원', Region.SEOUL),
+    ('서울 잠실종합운동장', Region.SEOUL),
+    ('경기도 수원시 월드컵경기장', Region.GYEONGGI),
+    ('충청남도 금산군', Region.CHUNGNAM),
+    ('강원특별자치도 춘천시', Region.GANGWON),
+    ('제주특별자치도 서귀포시', Region.JEJU),
+    ('세종특별자치시 호수공원', Region.SEJONG),
+    ('춘천 의암호 일원', Region.GANGWON),
+    ('(경북) 경주 보문단지', Region.GYEONGBUK),
+    ('일본 도쿄', Region.OVERSEAS),
+    ('부산광역시', Region.BUSAN),
+    ('한강공원', Region.OTHER),
+    ('서울올림픽공원 평화의광장', Region.SEOUL),
+    # 경기장의 '경기'는 경기도가 아님
+    ('잠실올림픽주경기장', Region.OTHER),
+    ('상암 월드컵경기장', Region.OTHER),
+    ('문학경기장', Region.OTHER),
+    ('경기장 앞 광장', Region.OTHER),
+    ('', Region.OTHER),
+    (None, Region.OTHER),
+])
+def test_classify_region(location, expected):
+    assert classify_region(location) == expected
+
+
+@pytest.mark.parametrize("value", [Region.SEOUL, '서울', 'SEOUL', '서울특별시'])
+def test_parse_region(value):
+    assert parse_region(value) == Region.SEOUL
@@ -1,6 +1,7 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 from src.infrastructure.models import MarathonInfoDB, Course
+from src.domain.models import MarathonInfo, Region
 from src.infrastructure.database import Base
 from src.adapters.outbound.repository import MarathonRepository
 from datetime import datetime
@@ -129,6 +130,23 @@ class TestMarathonRepository:
         assert 21 in [c.distance for c in results[0].courses]
         assert results[0].race_date.month == 3
 
+    def test_get_marathons_by_multiple_regions(self, db_session, sample_marathons):
+        repository = MarathonRepository(db_session)
+        results = repository.get_marathons(registration_status=False, region=['서울', Region.BUSAN])
+
+        assert sorted(m.title for m in results) == ['부산 마라톤', '서울 마라톤']
+        assert {m.region for m in results} == {'서울', '부산'}
+
+    def test_region_follows_location_updates(self, db_session, sample_marathons):
+        repository = MarathonRepository(db_session)
+        marathon = sample_marathons[0]
+        repository.bulk_upsert([{'title': marathon.title, 'race_date': marathon.race_date,
+                                 'location': '경기도 고양시 일산호수공원', 'homepage': marathon.homepage,
+                                 'list_row_hash': 'moved'}])
+        db_session.commit()
+
+        assert [m.title for m in repository.get_by_region('경기')] == ['서울 마라톤']
+
     def test_get_marathons_with_location(self, db_session, sample_marathons):
         repository = MarathonRepository(db_session)
         results = repository.get_by_region("부산광역시")
@@ -157,4 +175,68 @@ class TestMarathonRepository:
     def test_course_variations(self, db_session, sample_marathons, course, expected_count):
         repository = MarathonRepository(db_session)
         results = repository.get_by_distance(course)
-        assert len(results) == expected_count
\ No newline at end of file
+        assert len(results) == expected_count
+
+
+def count_selects(db_session, call):
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        if statement.startswith('SELECT'):
+            statements.append(statement)
+
+    engine = db_session.get_bind()
+    event.listen(engine, 'before_cursor_execute', record)
+    try:
+        result = call()
+    finally:
+        event.remove(engine, 'before_cursor_execute', record)
+    return result, len(statements)
+
+
+@pytest.fixture
+def many_marathons(db_session, sample_marathons):
+    courses = db_session.query(Course).all()
+    for marathon in sample_marathons:
+        marathon.organization_name = "주최사"
+    for i in range(30):
+        db_session.add(MarathonInfoDB(
+            title=f"마라톤 {i}",
+            race_date=datetime(2024, 4, 1 + i % 28, 9, 0, 0),
+            location="서울특별시",
+            homepage='example.com',
+            organization_name="주최사",
+            registration_start_date=datetime(2024, 2, 1),
+            registration_end_date=datetime(2024, 3, 1),
+            courses=courses[:1 + i % len(courses)],
+        ))
+    db_session.commit()
+    db_session.expire_all()
+
+
+class TestMarathonRepositoryQueryCount:
+    @pytest.mark.parametrize("projection", [False, True])
+    def test_listing_loads_courses_with_constant_queries(self, db_session, many_marathons, projection):
+        repository = MarathonRepository(db_session)
+
+        def listing():
+            marathons = repository.get_marathons(registration_status=False, projection=projection)
+            if not projection:
+                marathons = [marathon.to_pydantic() for marathon in marathons]
+            return marathons
+
+        marathons, selects = count_selects(db_session, listing)
+
+        assert len(marathons) == 33
+        assert selects == 2
+        assert all(isinstance(marathon, MarathonInfo) for marathon in marathons)
+        seoul = next(marathon for marathon in marathons if marathon.title == "서울 마라톤")
+        assert sorted(course.distance for course in seoul.courses) == [21, 42]
+
+    def test_projection_matches_orm_listing(self, db_session, many_marathons):
+        repository = MarathonRepository(db_session)
+        orm = [marathon.to_pydantic() for marathon in repository.get_by_distance(21)]
+        projected = repository.get_by_distance(21, projection=True)
+
+        key = lambda marathon: marathon.title
+        assert sorted(projected, key=key) == sorted(orm, key=key)
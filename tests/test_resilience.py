@@ -0,0 +1,116 @@
+import threading
+
+import pytest
+import requests
+
+from src.adapters.inbound.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    Deadline,
+    DeadlineExceeded,
+    ResilientFetcher,
+    RetryPolicy,
+)
+
+URL = "http://www.roadrun.co.kr/schedule/view.php?no=101"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def failing(times: int, error: Exception):
+    calls = []
+
+    def attempt(timeout):
+        calls.append(timeout)
+        if len(calls) <= times:
+            raise error
+        return 'ok'
+    return attempt, calls
+
+
+def test_retry_then_success():
+    clock = FakeClock()
+    fetcher = ResilientFetcher(request_timeout=5, retry_policy=RetryPolicy(max_attempts=3), sleep=clock.sleep)
+    attempt, calls = failing(2, requests.ConnectionError('reset'))
+
+    assert fetcher.fetch(URL, attempt) == 'ok'
+    assert calls == [5, 5, 5]
+    assert fetcher.stats.retries == 2
+
+
+def test_non_retryable_error_is_raised_immediately():
+    fetcher = ResilientFetcher(sleep=lambda _: None)
+    response = requests.Response()
+    response.status_code = 404
+    attempt, calls = failing(1, requests.HTTPError(response=response))
+
+    with pytest.raises(requests.HTTPError):
+        fetcher.fetch(URL, attempt)
+    assert len(calls) == 1
+
+
+def test_backoff_is_bounded_and_jittered():
+    policy = RetryPolicy(backoff_base=0.5, backoff_max=2.0)
+    delays = [policy.backoff(attempt) for attempt in range(10) for _ in range(20)]
+
+    assert all(0 <= delay <= 2.0 for delay in delays)
+    assert len(set(delays)) > 1
+
+
+def test_timeout_never_exceeds_remaining_deadline():
+    clock = FakeClock()
+    fetcher = ResilientFetcher(request_timeout=10, sleep=clock.sleep)
+    attempt, calls = failing(0, None)
+
+    fetcher.fetch(URL, attempt, Deadline(3, clock=clock))
+    assert calls == [3]
+
+    clock.now = 5
+    with pytest.raises(DeadlineExceeded):
+        fetcher.fetch(URL, attempt, Deadline(0, clock=clock))
+
+
+def test_circuit_breaker_opens_and_recovers():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30, clock=clock)
+    fetcher = ResilientFetcher(retry_policy=RetryPolicy(max_attempts=1), circuit_breaker=breaker, sleep=clock.sleep)
+    attempt, calls = failing(2, requests.Timeout('slow'))
+
+    for _ in range(2):
+        with pytest.raises(requests.Timeout):
+            fetcher.fetch(URL, attempt)
+    with pytest.raises(CircuitOpenError):
+        fetcher.fetch(URL, attempt)
+    assert len(calls) == 2
+    assert breaker.state('www.roadrun.co.kr') == 'open'
+
+    clock.now += 30
+    assert breaker.state('www.roadrun.co.kr') == 'half-open'
+    assert fetcher.fetch(URL, attempt) == 'ok'
+    assert breaker.state('www.roadrun.co.kr') == 'closed'
+    assert fetcher.stats.circuit_rejections == 1
+
+
+def test_fetch_stats_are_thread_safe():
+    fetcher = ResilientFetcher()
+
+    def fetch_many():
+        for _ in range(2000):
+            fetcher.fetch(URL, lambda timeout: 'ok')
+
+    workers = [threading.Thread(target=fetch_many) for _ in range(8)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    assert fetcher.stats.attempts == 16000
@@ -0,0 +1,148 @@
+import asyncio
+from datetime import datetime
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.adapters.inbound.api import MarathonController
+from src.adapters.inbound.response_cache import LocalSharedCache, ResponseCache, TTLCache, etag_matches
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def marathons(make_marathon):
+    return [make_marathon(f'마라톤 {i:02d}', datetime(2024, 12, 1 + i, 9, 0),
+                          location='서울 여의도공원' if i % 2 else '부산 광안리')
+            for i in range(6)]
+
+
+def make_client(marathon_service, shared=None) -> tuple[TestClient, ResponseCache]:
+    cache = ResponseCache(version_provider=marathon_service.get_data_version, shared=shared,
+                          version_check_interval=0)
+    app = FastAPI()
+    app.include_router(MarathonController(marathon_service, response_cache=cache).router)
+    return TestClient(app), cache
+
+
+def test_ttl_cache_evicts_least_recently_used_and_expired_entries():
+    clock = FakeClock()
+    cache = TTLCache(maxsize=2, ttl=10, clock=clock)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    assert cache.get('a') == 1
+    cache.set('c', 3)
+
+    assert cache.get('b') is None
+    assert cache.get('a') == 1
+    clock.now = 10
+    assert cache.get('a') is None
+    assert cache.get('c') is None
+
+
+def test_etag_matching():
+    assert etag_matches('"abc"', '"abc"')
+    assert etag_matches('"x", W/"abc"', '"abc"')
+    assert etag_matches('*', '"abc"')
+    assert not etag_matches('"abd"', '"abc"')
+    assert not etag_matches(None, '"abc"')
+
+
+def test_cached_response_and_not_modified(marathon_service, statements):
+    client, cache = make_client(marathon_service)
+
+    first = client.get('/api/v1/marathon', params={'region': ['서울', '부산'], 'limit': 4})
+    statements.clear()
+    second = client.get('/api/v1/marathon', params={'limit': 4, 'region': ['부산', '서울']})
+    revalidated = client.get('/api/v1/marathon', params={'region': ['서울', '부산'], 'limit': 4},
+                             headers={'If-None-Match': first.headers['ETag']})
+
+    assert first.status_code == second.status_code == 200
+    assert second.content == first.content
+    assert second.headers['ETag'] == first.headers['ETag']
+    assert second.headers['X-Next-Cursor'] == first.headers['X-Next-Cursor']
+    assert revalidated.status_code == 304
+    assert revalidated.content == b''
+    # 캐시 적중 시에는 데이터 버전 확인 (기본 키 조회)만 실행
+    assert all('data_version' in statement for statement in statements)
+    assert cache.stats.hits == 2
+    assert cache.stats.not_modified == 1
+
+
+def test_data_version_bump_invalidates_cache(marathon_service, make_marathon):
+    client, cache = make_client(marathon_service)
+    before = client.get('/api/v1/marathon/open-registration', params={'limit': 100})
+
+    marathon_service.save_marathon_batch([make_marathon('마라톤 10', datetime(2024, 12, 11, 9, 0))])
+    assert client.get('/api/v1/marathon/open-registration', params={'limit': 100}).content == before.content
+
+    marathon_service.rebuild_digests()
+    after = client.get('/api/v1/marathon/open-registration', params={'limit': 100},
+                       headers={'If-None-Match': before.headers['ETag']})
+
+    assert after.status_code == 200
+    assert len(after.json()) == len(before.json()) + 1
+    assert after.headers['ETag'] != before.headers['ETag']
+    assert cache.stats.invalidations == 1
+
+
+def test_shared_cache_is_used_by_other_processes(marathon_service, statements):
+    shared = LocalSharedCache()
+    first_client, _ = make_client(marathon_service, shared)
+    second_client, second_cache = make_client(marathon_service, shared)
+
+    first = first_client.get('/api/v1/marathon/search', params={'q': '마라톤'})
+    statements.clear()
+    second = second_client.get('/api/v1/marathon/search', params={'q': '마라톤'})
+
+    assert second.content == first.content
+    assert second.headers['ETag'] == first.headers['ETag']
+    assert second_cache.stats.shared_hits == 1
+    assert all('data_version' in statement for statement in statements)
+
+
+class LoopCheckingSharedCache(LocalSharedCache):
+    """호출이 이벤트 루프 스레드에서 일어났는지 기록하는 공유 캐시"""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+
+    @staticmethod
+    def on_event_loop() -> bool:
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+        return True
+
+    def get(self, key: str):
+        self.calls.append(('get', self.on_event_loop()))
+        return super().get(key)
+
+    def set(self, key: str, value: bytes, ttl: float):
+        self.calls.append(('set', self.on_event_loop()))
+        super().set(key, value, ttl)
+
+
+def test_shared_cache_is_called_off_the_event_loop(marathon_service):
+    shared = LoopCheckingSharedCache()
+    client, _ = make_client(marathon_service, shared)
+
+    assert client.get('/api/v1/marathon/this-month').status_code == 200
+    assert shared.calls == [('get', False), ('set', False)]
+
+
+def test_errors_and_streams_are_not_cached(marathon_service):
+    client, cache = make_client(marathon_service)
+
+    assert client.get('/api/v1/marathon', params={'cursor': 'bad'}).status_code == 400
+    assert client.get('/api/v1/marathon/stream').status_code == 200
+    assert len(cache.local) == 0
@@ -0,0 +1,49 @@
+from pathlib import Path
+
+import pytest
+
+from src.adapters.inbound.roadrun_parser import PARSERS, SoupRoadRunParser, get_parser
+
+FIXTURE_DIR = Path(__file__).parent / "fixtures" / "roadrun"
+
+
+def load_page(name: str) -> str:
+    return (FIXTURE_DIR / name).read_bytes().decode('euc-kr')
+
+
+def skip_if_not_installed(engine: str):
+    """lxml, selectolax 백엔드는 선택 설치(fast-parser extra)이므로 패키지가 없으면 건너뜀"""
+    if engine != SoupRoadRunParser.name:
+        pytest.importorskip(engine)
+
+
+@pytest.mark.parametrize("engine", list(PARSERS))
+def test_list_page_matches_reference_parser(engine):
+    skip_if_not_installed(engine)
+    html = load_page('list.html')
+    assert get_parser(engine).parse_list(html) == SoupRoadRunParser().parse_list(html)
+
+
+@pytest.mark.parametrize("engine", list(PARSERS))
+@pytest.mark.parametrize("page", ['view_101.html', 'view_102.html', 'view_103.html'])
+def test_detail_page_matches_reference_parser(engine, page):
+    skip_if_not_installed(engine)
+    html = load_page(page)
+    assert get_parser(engine).parse_detail(html) == SoupRoadRunParser().parse_detail(html)
+
+
+def test_reference_parser_output():
+    list_rows = SoupRoadRunParser().parse_list(load_page('list.html'))
+
+    assert len(list_rows) == 3
+    assert list_rows[0]['date'] == '12/8'
+    assert list_rows[0]['day_of_week'] == '일'
+    assert list_rows[0]['contact'] == '010-1234-5678'
+    assert SoupRoadRunParser().parse_detail(load_page('view_102.html')) == (
+        '2024년10월1일~2024년12월1일', '2024년12월14일 출발시간: 08:00'
+    )
+
+
+def test_unknown_parser():
+    with pytest.raises(ValueError):
+        get_parser('html5lib')
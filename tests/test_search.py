@@ -0,0 +1,67 @@
+from datetime import datetime
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.adapters.inbound.api import MarathonController
+
+
+@pytest.fixture
+def marathons(make_marathon):
+    return [
+        make_marathon('춘천마라톤', datetime(2024, 10, 27, 9, 0),
+                      location='강원 춘천시 공지천', organization_name='조선일보'),
+        make_marathon('소양강 하프 마라톤', datetime(2024, 10, 5, 9, 0),
+                      location='강원 춘천 소양강댐', organization_name='춘천시육상연맹'),
+        make_marathon('서울 레이스', datetime(2024, 10, 12, 9, 0),
+                      location='서울 여의도공원', organization_name='서울시'),
+    ]
+
+
+def titles(marathons) -> list[str]:
+    return [marathon.title for marathon in marathons]
+
+
+def test_search_matches_title_location_and_organiser_by_prefix(marathon_service):
+    # 대회명에서 찾은 결과가 주최에서만 찾은 결과보다 앞에 옴
+    assert titles(marathon_service.search_marathons('춘천')) == ['춘천마라톤', '소양강 하프 마라톤']
+    assert titles(marathon_service.search_marathons('여의도')) == ['서울 레이스']
+    assert titles(marathon_service.search_marathons('춘천 소양강')) == ['소양강 하프 마라톤']
+    assert marathon_service.search_marathons('부산') == []
+
+
+def test_search_returns_courses(marathon_service):
+    [marathon] = marathon_service.search_marathons('서울 레이스')
+    assert [course.distance for course in marathon.courses] == [10.0]
+
+
+def test_search_index_follows_updates(marathon_service, make_marathon):
+    marathon_service.save_marathon_batch([
+        make_marathon('서울 레이스', datetime(2024, 10, 12, 9, 0), location='부산 광안리', organization_name='서울시',
+                      list_row_hash='changed'),
+    ])
+
+    assert titles(marathon_service.search_marathons('광안리')) == ['서울 레이스']
+    assert marathon_service.search_marathons('여의도') == []
+
+
+def test_search_ignores_query_syntax(marathon_service):
+    assert titles(marathon_service.search_marathons('"춘천*" (')) == ['춘천마라톤', '소양강 하프 마라톤']
+    with pytest.raises(ValueError):
+        marathon_service.search_marathons('*()')
+
+
+def test_search_endpoint(marathon_service):
+    app = FastAPI()
+    app.include_router(MarathonController(marathon_service).router)
+    client = TestClient(app)
+
+    response = client.get('/api/v1/marathon/search', params={'q': '춘천', 'limit': 1})
+    assert response.status_code == 200
+    assert titles_of(response.json()) == ['춘천마라톤']
+    assert client.get('/api/v1/marathon/search', params={'q': '!!'}).status_code == 400
+
+
+def titles_of(marathons: list[dict]) -> list[str]:
+    return [marathon['title'] for marathon in marathons]
@@ -0,0 +1,208 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from src.application.services import MarathonService, RecipientService
+from src.domain.phone import normalize_phone_number
+from src.infrastructure.models import Base
+from src.infrastructure.uow import SqlAlchemyUnitOfWork
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine('sqlite:///:memory:')
+    Base.metadata.create_all(engine)
+    try:
+        yield engine
+    finally:
+        Base.metadata.drop_all(engine)
+
+
+@pytest.fixture
+def marathon_service(engine):
+    session_maker = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    return MarathonService(SqlAlchemyUnitOfWork(session_maker))
+
+
+def make_marathon(**overrides) -> dict:
+    marathon = {
+        'title': '금산인삼마라톤',
+        'race_date': datetime(2024, 12, 8, 9, 30),
+        'location': '대전 금산인삼 엑스포주차장',
+        'homepage': 'http://example.com/geumsan',
+        'courses': ['하프', '10km'],
+        'organization_name': '전국마라톤협회',
+        'registration_start_date': datetime(2024, 10, 11),
+        'registration_end_date': datetime(2024, 11, 19),
+        'roadrun_no': 101,
+        'list_row_hash': 'hash-v1',
+    }
+    marathon.update(overrides)
+    return marathon
+
+
+def test_save_marathon_info_skips_duplicates(marathon_service):
+    marathon_service.save_marathon_info(make_marathon())
+    marathon_service.save_marathon_info(make_marathon())
+
+    assert len(marathon_service.get_marathon_info(registration_status=False)) == 1
+    assert marathon_service.get_known_roadrun_rows() == {101: 'hash-v1'}
+
+
+def test_save_marathon_info_updates_changed_list_row(marathon_service):
+    marathon_service.save_marathon_info(make_marathon())
+    marathon_service.save_marathon_info(make_marathon(location='충남 금산군', list_row_hash='hash-v2'))
+
+    marathon_list = marathon_service.get_marathon_info(registration_status=False)
+    assert len(marathon_list) == 1
+    assert marathon_list[0].location == '충남 금산군'
+    assert marathon_service.get_known_roadrun_rows() == {101: 'hash-v2'}
+
+
+def test_save_marathon_batch_commits_once_with_bulk_statements(engine, marathon_service):
+    statements = []
+    commits = []
+    event.listen(engine, 'before_cursor_execute', lambda *args: statements.append(args[2]))
+    event.listen(engine, 'commit', lambda conn: commits.append(conn))
+
+    written = marathon_service.save_marathon_batch([
+        make_marathon(title=f'마라톤 {i}', roadrun_no=i, courses=['풀', '하프', '10km'])
+        for i in range(20)
+    ])
+
+    assert written == 20
+    assert len(commits) == 1
+    marathon_inserts = [s for s in statements if s.startswith('INSERT INTO marathon_info')]
+    association_inserts = [s for s in statements if s.startswith('INSERT INTO marathon_course_association')]
+    assert len(marathon_inserts) == 1
+    assert len(association_inserts) == 1
+
+    with marathon_service.uow as uow:
+        marathon_list = uow.marathon_repository.get()
+        assert len(marathon_list) == 20
+        assert all(sorted(c.distance for c in m.courses) == [10.0, 21.0975, 42.195] for m in marathon_list)
+
+
+def test_save_marathon_batch_skips_unchanged_and_in_batch_duplicates(marathon_service):
+    assert marathon_service.save_marathon_batch([make_marathon(), make_marathon(location='중복')]) == 1
+    assert marathon_service.save_marathon_batch([make_marathon()]) == 0
+
+    marathon_list = marathon_service.get_marathon_info(registration_status=False)
+    assert [m.location for m in marathon_list] == ['대전 금산인삼 엑스포주차장']
+
+
+def test_save_marathon_batch_updates_courses_of_changed_rows(marathon_service):
+    marathon_service.save_marathon_batch([make_marathon()])
+    written = marathon_service.save_marathon_batch([make_marathon(courses=['풀'], list_row_hash='hash-v2')])
+
+    assert written == 1
+    with marathon_service.uow as uow:
+        marathon = uow.marathon_repository.get()[0]
+        assert [course.distance for course in marathon.courses] == [42.195]
+
+
+def test_save_marathon_batch_follows_roadrun_no_when_title_changes(marathon_service):
+    marathon_service.save_marathon_batch([make_marathon()])
+    written = marathon_service.save_marathon_batch([make_marathon(title='제5회 금산인삼마라톤',
+                                                                  list_row_hash='hash-v2')])
+
+    assert written == 1
+    marathon_list = marathon_service.get_marathon_info(registration_status=False)
+    assert [m.title for m in marathon_list] == ['제5회 금산인삼마라톤']
+
+
+def test_save_marathon_batch_merges_rename_into_existing_marathon(marathon_service):
+    marathon_service.save_marathon_batch([
+        make_marathon(),
+        make_marathon(title='제5회 금산인삼마라톤', roadrun_no=None, list_row_hash='other'),
+    ])
+    # roadrun 101의 제목이 이미 저장된 다른 마라톤과 같아짐
+    written = marathon_service.save_marathon_batch([
+        make_marathon(title='제5회 금산인삼마라톤', list_row_hash='hash-v2', courses=['풀']),
+    ])
+
+    assert written == 1
+    [marathon] = marathon_service.get_marathon_info(registration_status=False)
+    assert marathon.title == '제5회 금산인삼마라톤'
+    assert [course.distance for course in marathon.courses] == [42.195]
+    assert marathon_service.get_known_roadrun_rows() == {101: 'hash-v2'}
+
+
+@pytest.fixture
+def recipient_service(engine):
+    session_maker = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    return RecipientService(SqlAlchemyUnitOfWork(session_maker))
+
+
+@pytest.mark.parametrize("phone_number,expected", [
+    ('010-1234-5678', '+821012345678'),
+    ('+82 10-1234-5678', '+821012345678'),
+    ('+82 010 1234 5678', '+821012345678'),
+    ('0082-10-1234-5678', '+821012345678'),
+    ('+1 415 555 0100', '+14155550100'),
+    ('010', None),
+    ('', None),
+])
+def test_normalize_phone_number(phone_number, expected):
+    assert normalize_phone_number(phone_number) == expected
+
+
+def test_sync_recipients_is_idempotent(engine, recipient_service):
+    sheet = [
+        {'name': '김철수', 'phone_number': '010-1111-2222'},
+        {'name': '이영희', 'phone_number': '010-3333-4444'},
+        {'name': '김철수', 'phone_number': '+82 10-1111-2222'},
+        {'name': '잘못된 번호', 'phone_number': '1234'},
+    ]
+    result = recipient_service.sync_recipients(sheet)
+    assert (result.inserted, result.updated, result.deleted, result.duplicates) == (2, 0, 0, 1)
+    assert len(result.invalid) == 1
+
+    statements = []
+    event.listen(engine, 'before_cursor_execute', lambda *args: statements.append(args[2]))
+    result = recipient_service.sync_recipients(sheet)
+
+    assert result.writes == 0
+    assert result.unchanged == 2
+    assert all(statement.startswith('SELECT') for statement in statements)
+    assert sorted(r.phone_number for r in recipient_service.get_recipients()) == ['+821011112222', '+821033334444']
+
+
+def test_sync_recipients_applies_changes_in_bulk(engine, recipient_service):
+    recipient_service.sync_recipients([
+        {'name': '김철수', 'phone_number': '010-1111-2222'},
+        {'name': '이영희', 'phone_number': '010-3333-4444'},
+        {'name': '박민수', 'phone_number': '010-5555-6666'},
+    ])
+
+    statements = []
+    event.listen(engine, 'before_cursor_execute', lambda *args: statements.append(args[2]))
+    result = recipient_service.sync_recipients([
+        {'name': '김철수', 'phone_number': '010-1111-2222'},
+        {'name': '이영희(개명)', 'phone_number': '010-3333-4444'},
+        {'name': '최지우', 'phone_number': '010-7777-8888'},
+        {'name': '한가인', 'phone_number': '010-9999-0000'},
+    ])
+
+    assert (result.inserted, result.updated, result.deleted, result.unchanged) == (2, 1, 1, 1)
+    writes = [s.split()[0] for s in statements if not s.startswith('SELECT')]
+    assert sorted(writes) == ['DELETE', 'INSERT', 'UPDATE']
+    assert {(r.name, r.phone_number) for r in recipient_service.get_recipients()} == {
+        ('김철수', '+821011112222'),
+        ('이영희(개명)', '+821033334444'),
+        ('최지우', '+821077778888'),
+        ('한가인', '+821099990000'),
+    }
+
+
+@pytest.mark.parametrize('sheet', [[], [{'name': '잘못된 번호', 'phone_number': '1234'}]])
+def test_sync_recipients_keeps_recipients_when_sheet_is_empty(recipient_service, sheet):
+    recipient_service.sync_recipients([{'name': '김철수', 'phone_number': '010-1111-2222'}])
+
+    result = recipient_service.sync_recipients(sheet)
+
+    assert result.deleted == 0
+    assert result.deletion_skipped
+    assert [r.phone_number for r in recipient_service.get_recipients()] == ['+821011112222']
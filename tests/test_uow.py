@@ -1,4 +1,4 @@
-from src.infrastructure.uow import SqlAlchemyUnitOfWork, DEFAULT_SESSION_FACTORY
+from src.infrastructure.uow import SqlAlchemyUnitOfWork
 from src.adapters.outbound.repository import MarathonRepository
 from datetime import datetime
 import pytest
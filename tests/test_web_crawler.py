@@ -0,0 +1,242 @@
+import re
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+import requests
+
+from src.adapters.inbound.http_cache import CachedHttpClient
+from src.adapters.inbound.resilience import ResilientFetcher
+from src.adapters.inbound.web_crawler import (
+    BaseMarathonInfoFilter,
+    MarathonInfoWeeklyFilter,
+    PerHostLimiter,
+    RoadRunWebCrawler,
+)
+
+FIXTURE_DIR = Path(__file__).parent / "fixtures" / "roadrun"
+LIST_URL = "http://www.roadrun.co.kr/schedule/list.php"
+
+
+class FakeResponse:
+    def __init__(self, content: bytes, status_code: int = 200, headers: dict | None = None):
+        self.content = content
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.encoding = None
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f'HTTP {self.status_code}')
+
+    @property
+    def text(self):
+        return self.content.decode(self.encoding or 'utf-8', errors='replace')
+
+
+class FakeClock:
+    """sleep하면 그만큼 시간이 흐르는 가짜 시계"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.now += seconds
+
+
+class FakeRoadRun:
+    """녹화된 list.php / view.php 페이지를 돌려주는 requests.Session 대체"""
+
+    def __init__(self, delay: float = 0.0, sleep=time.sleep):
+        self.delay = delay
+        self.sleep = sleep
+        self.requested_urls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def get(self, url, **kwargs):
+        with self._lock:
+            self.requested_urls.append(url)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            timeout = kwargs.get('timeout')
+            if timeout is not None and self.delay > timeout:
+                self.sleep(timeout)
+                raise requests.Timeout(f'{url} timed out')
+            self.sleep(self.delay)
+            if url.endswith('list.php'):
+                return FakeResponse((FIXTURE_DIR / 'list.html').read_bytes())
+            no = re.search(r'no=(\d+)', url).group(1)
+            return FakeResponse((FIXTURE_DIR / f'view_{no}.html').read_bytes())
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+@pytest.fixture
+def fake_roadrun():
+    return FakeRoadRun(delay=0.05)
+
+
+def make_crawler(session, **kwargs) -> RoadRunWebCrawler:
+    return RoadRunWebCrawler(BaseMarathonInfoFilter(),
+                             http_client=CachedHttpClient(session=session),
+                             **kwargs)
+
+
+def test_crawl_parses_list_and_detail_pages(fake_roadrun):
+    crawler = make_crawler(fake_roadrun)
+    marathon_list = crawler.crawl(LIST_URL)
+
+    assert [m['title'] for m in marathon_list] == ['금산인삼마라톤', '서울 송년 마라톤', '부산 해맞이 달리기']
+    first = marathon_list[0]
+    assert first['courses'] == ['하프', '10km', '5km']
+    assert first['location'] == '대전 금산인삼 엑스포주차장'
+    assert first['homepage'] == 'http://example.com/geumsan'
+    assert first['registration_period'] == '2024년10월11일~2024년11월19일'
+    assert first['event_datetime'] == '2024년12월8일 출발시간: 오전 9시 30분'
+    assert marathon_list[1]['homepage'] is None
+
+
+def test_concurrent_crawl_keeps_sequential_order(fake_roadrun):
+    sequential = make_crawler(fake_roadrun).crawl(LIST_URL)
+    concurrent = make_crawler(fake_roadrun, max_workers=4, per_host_limit=4).crawl(LIST_URL)
+
+    assert concurrent == sequential
+    assert fake_roadrun.max_in_flight > 1
+
+
+def test_concurrent_crawl_respects_per_host_limit(fake_roadrun):
+    crawler = make_crawler(fake_roadrun, max_workers=8, per_host_limit=1)
+    crawler.crawl(LIST_URL)
+
+    assert len(fake_roadrun.requested_urls) == 4
+    assert fake_roadrun.max_in_flight == 1
+
+
+def test_per_host_limiter_spaces_requests():
+    limiter = PerHostLimiter(max_concurrent=4, min_interval=0.05)
+    started = []
+    for _ in range(3):
+        limiter.run('http://example.com/a', lambda: started.append(time.monotonic()))
+
+    assert started[2] - started[0] >= 0.1
+
+
+def test_preprocess_data():
+    crawler = RoadRunWebCrawler(BaseMarathonInfoFilter())
+    marathon = crawler.preprocess_data({
+        'title': '금산인삼마라톤',
+        'location': '대전 금산인삼 엑스포주차장',
+        'organizer': '전국마라톤협회',
+        'registration_period': '2024년10월11일~2024년11월19일',
+        'event_datetime': '2024년12월8일 출발시간: 오전 9시 30분',
+    })
+
+    assert marathon['organization_name'] == '전국마라톤협회'
+    assert marathon['race_date'].strftime('%Y-%m-%d %H:%M') == '2024-12-08 09:30'
+    assert marathon['registration_end_date'].day == 19
+
+
+def test_crawl_extracts_roadrun_no_and_row_hash(fake_roadrun):
+    marathon_list = make_crawler(fake_roadrun).crawl(LIST_URL)
+
+    assert [m['roadrun_no'] for m in marathon_list] == [101, 102, 103]
+    assert len({m['list_row_hash'] for m in marathon_list}) == 3
+
+
+def test_incremental_crawl_skips_known_rows(fake_roadrun):
+    first_crawl = make_crawler(fake_roadrun).crawl(LIST_URL)
+    known_rows = {m['roadrun_no']: m['list_row_hash'] for m in first_crawl}
+    known_rows[102] = 'stale-hash'  # 목록 행이 바뀐 마라톤
+    fake_roadrun.requested_urls.clear()
+
+    crawler = make_crawler(fake_roadrun, known_rows=known_rows)
+    marathon_list = crawler.crawl(LIST_URL)
+
+    assert [m['roadrun_no'] for m in marathon_list] == [102]
+    assert fake_roadrun.requested_urls == [LIST_URL, 'http://www.roadrun.co.kr/schedule/view.php?no=102']
+    assert crawler.stats.rows_seen == 3
+    assert crawler.stats.skipped_known == 2
+    assert crawler.stats.detail_fetches == 1
+
+
+def test_weekly_filter_prunes_rows_before_detail_fetch(fake_roadrun):
+    # 2024-12-10(화) 기준 이번 주는 12/9 ~ 12/15
+    marathon_filter = MarathonInfoWeeklyFilter(today=datetime(2024, 12, 10, 9, 0))
+    crawler = RoadRunWebCrawler(marathon_filter, http_client=CachedHttpClient(session=fake_roadrun))
+
+    marathon_list = crawler.crawl(LIST_URL)
+
+    # 12/8 대회는 목록 단계에서 제외, 1/5 대회는 접수 중이라 통과
+    assert [m['roadrun_no'] for m in marathon_list] == [102, 103]
+    assert 'http://www.roadrun.co.kr/schedule/view.php?no=101' not in fake_roadrun.requested_urls
+    assert crawler.stats.prefiltered == 1
+    assert crawler.stats.detail_fetches == 2
+    assert crawler.stats.fetches_avoided == 1
+
+
+def test_weekly_filter_pre_and_post_filter_agree():
+    marathon_filter = MarathonInfoWeeklyFilter(today=datetime(2024, 12, 30))
+
+    assert marathon_filter.pre_filter({'date': '1/5'})
+    assert not marathon_filter.pre_filter({'date': '12/8'})
+    assert marathon_filter.filter({
+        'event_datetime': '2025년1월5일 출발시간: 0700',
+        'registration_period': '2024년11월1일~2024년12월31일',
+    })
+    assert marathon_filter.filter({
+        'event_datetime': '2025년3월1일 출발시간: 0900',
+        'registration_period': '2025년1월1일~2025년2월1일',
+    }) is None
+
+
+def test_weekly_filter_keeps_races_months_ahead():
+    # 7개월 뒤 대회(5/20)를 작년 날짜로 보고 걸러내면 지금 접수 중이어도 상세 페이지를 요청하지 않음
+    marathon_filter = MarathonInfoWeeklyFilter(today=datetime(2024, 10, 18))
+
+    assert marathon_filter._infer_list_date('5/20') == datetime(2025, 5, 20)
+    assert marathon_filter.pre_filter({'date': '5/20'})
+    assert marathon_filter.filter({
+        'event_datetime': '2025년5월20일 출발시간: 0800',
+        'registration_period': '2024년10월1일~2024년11월30일',
+    })
+    # 올해보다 이전 연도로는 추정하지 않음 (1/3 기준 12/28은 내년 대회로 보고 통과)
+    assert MarathonInfoWeeklyFilter(today=datetime(2025, 1, 3))._infer_list_date('12/28') == datetime(2025, 12, 28)
+
+
+def test_deadline_returns_partial_results_and_records_skipped_rows():
+    # 요청마다 가짜 시계가 0.3초씩 흐름: list.php + view 101 (0.6초) < 예산 0.75초 < + view 102 (0.9초)
+    clock = FakeClock()
+    fake = FakeRoadRun(delay=0.3, sleep=clock.sleep)
+    crawler = make_crawler(fake, deadline_seconds=0.75, clock=clock, fetcher=ResilientFetcher(sleep=clock.sleep))
+
+    marathon_list = crawler.crawl(LIST_URL)
+
+    # list.php + view 101 까지만 예산 안에 끝남
+    assert [m['roadrun_no'] for m in marathon_list] == [101]
+    assert crawler.stats.deadline_exceeded
+    assert [row['roadrun_no'] for row in crawler.stats.skipped] == [102, 103]
+    # 103은 요청을 보내기 전에 건너뛰었으므로 상세 페이지 요청 수에 넣지 않음
+    assert crawler.stats.detail_fetches == 2
+
+
+def test_request_timeout_is_passed_to_session(fake_roadrun):
+    timeouts = []
+    original_get = fake_roadrun.get
+
+    def get(url, **kwargs):
+        timeouts.append(kwargs.get('timeout'))
+        return original_get(url, **kwargs)
+
+    fake_roadrun.get = get
+    make_crawler(fake_roadrun, fetcher=ResilientFetcher(request_timeout=7)).crawl(LIST_URL)
+
+    assert timeouts == [7, 7, 7, 7]